@@ -5,321 +5,285 @@ This module contains the core sorting algorithm implementations that can be shar
 between different UI implementations (Rich CLI, Textual TUI, etc.).
 """
 
-from typing import Any, Dict, List
+import os
+import random
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .buffers import ArrayLike, check_writable, copy_buffer
+from .events import (
+    COMPARE,
+    FROM_AUX,
+    KEY,
+    LOAD,
+    MOVE,
+    PASS_END,
+    PASS_START,
+    PIVOT,
+    RANGE,
+    STORE,
+    SWAP,
+    TO_AUX,
+    Event,
+    count_accesses,
+)
+from .profiling import Profiler
+from .registry import (  # noqa: F401
+    ALGORITHMS,
+    get_algorithm_visualizer,
+    get_available_algorithms,
+)
+from .renderers import (
+    BubbleLastSwapRenderer,
+    BubbleSortRenderer,
+    InsertionBinaryRenderer,
+    InsertionShiftRenderer,
+    InsertionSortRenderer,
+    MergeSortRenderer,
+    OddEvenSortRenderer,
+    ParallelMergeSortRenderer,
+    QuickSortRenderer,
+    QuickThreeWayRenderer,
+    SelectionSortRenderer,
+    TraceRenderer,
+)
+from .stats import bubble_sort_stats, insertion_sort_stats, selection_sort_stats
+
+# Estratégias de escolha do pivô do Quick Sort
+PIVOT_FIRST = "first"
+PIVOT_MEDIAN3 = "median3"
+PIVOT_RANDOM = "random"
+PIVOT_STRATEGIES = (PIVOT_FIRST, PIVOT_MEDIAN3, PIVOT_RANDOM)
+
+# Trechos do Merge Sort paralelo, cada um ordenado por um worker; arrays
+# pequenos usam menos trechos, com pelo menos MIN_CHUNK_SIZE elementos cada
+PARALLEL_CHUNKS = 8
+MIN_CHUNK_SIZE = 4
+# Abaixo disso, iniciar os processos custa mais que ordenar num só; a partir
+# daqui o padrão é um trecho por worker
+PARALLEL_MIN_SIZE = 20_000
+
+
+def chunk_bounds(length: int, chunks: int = PARALLEL_CHUNKS) -> List[Tuple[int, int]]:
+    """Split ``length`` positions into at most ``chunks`` contiguous ``(lo, hi)`` runs."""
+    if length == 0:
+        return []
+    count = max(1, min(chunks, length // MIN_CHUNK_SIZE))
+    bounds = [length * chunk // count for chunk in range(count + 1)]
+    return [(bounds[chunk], bounds[chunk + 1] - 1) for chunk in range(count)]
 
 
 class SortingVisualizer:
-    """Base class for sorting algorithm visualizations."""
+    """Base class for sorting algorithm visualizations.
+
+    Subclasses implement ``generate_events``, the step-event engine that sorts
+    an array in place and yields one ``(opcode, i, j)`` event per step, and
+    point ``renderer_class`` at the renderer that narrates those events.
+
+    Besides lists, the input may be any writable buffer such as
+    ``array.array``, a NumPy array or a ``memoryview``: it is copied in its
+    own format (never converted to a list), or sorted directly with
+    ``in_place=True``.
+
+    Attaching a ``Profiler`` (``enable_profiling``) times every phase of the
+    pipeline; with ``profiler`` left as None nothing is measured.
+    """
+
+    renderer_class = TraceRenderer
 
     def __init__(self):
         self.comparisons = 0
         self.swaps = 0
+        self.profiler: Optional[Profiler] = None
+
+    def enable_profiling(self, profiler: Optional[Profiler] = None) -> Profiler:
+        """Attach ``profiler`` (or a new one) and return it."""
+        self.profiler = profiler or Profiler()
+        return self.profiler
 
     def reset_stats(self):
         """Reset algorithm statistics."""
         self.comparisons = 0
         self.swaps = 0
 
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        """Sort ``array`` in place, yielding a step event for each operation."""
+        raise NotImplementedError
 
-class BubbleSortVisualizer(SortingVisualizer):
-    """Bubble Sort algorithm with visualization."""
+    def iter_events(
+        self, input_array: ArrayLike, in_place: bool = False
+    ) -> Iterator[Event]:
+        """Yield the step events for sorting ``input_array`` (a copy unless ``in_place``)."""
+        self.reset_stats()
+        events = self.generate_events(self._working_array(input_array, in_place))
+        if self.profiler is not None:
+            return self.profiler.timed_iter("sort", events)
+        return events
 
-    def sort_complete(self, input_array: List[int]) -> str:
+    def sort(self, input_array: ArrayLike, in_place: bool = False) -> ArrayLike:
         """
-        Execute bubble sort and return complete Rich-formatted visualization.
+        Execute the algorithm at full speed, without building any output.
 
         Args:
             input_array: The array to sort
+            in_place: Sort ``input_array`` itself instead of a copy
 
         Returns:
-            Complete Rich-formatted string with the full sorting process
+            The sorted array (statistics are kept on the instance)
         """
         self.reset_stats()
-        array = input_array.copy()
-        length = len(array)
-        output = []
-
-        # Header
-        output.append("[bold cyan]🫧 BUBBLE SORT[/]")
-        output.append("")
-        output.append(f"[white]Array inicial:[/] {input_array}")
-        output.append(f"[white]Tamanho:[/] {length} elementos")
-        output.append("")
-        output.append("[dim]O Bubble Sort compara elementos adjacentes e os troca")
-        output.append("se estiverem fora de ordem.[/]")
-        output.append("─" * 60)
-        output.append("")
-
-        # Main sorting loops
-        for iteration in range(length):
-            output.append(
-                f"[bold blue]🔄 PASSO {iteration + 1}/{length}[/] - Estado atual: {array}"
-            )
-            if iteration == 0:
-                output.append(
-                    "[dim]💡 A cada passo, o maior elemento restante irá para sua posição final[/]"
-                )
-            output.append("")
-
-            swapped = False
-            for index in range(length - iteration - 1):
-                # "-1" porque precisamos pegar o elemento adjacente (index + 1)
-                # "-iteration" porque a cada iteração um novo elemento já estará ordenado no final do array
-
-                cur_element = array[index]
-                adj_element = array[index + 1]
-                self.comparisons += 1
-
-                output.append(
-                    f"    🔍 Comparando {cur_element} (pos: {index}) com {adj_element} (pos: {index + 1})"
-                )
-
-                # Visual representation
-                visual_array = self._create_visual_array(
-                    array, [index, index + 1], iteration
-                )
-                output.append(f"    Array: {' '.join(visual_array)}")
-
-                if iteration > 0:
-                    output.append(
-                        f"    [dim]Últimos {iteration} elementos já estão ordenados ✅[/]"
-                    )
-
-                # Perform comparison and swap
-                if cur_element > adj_element:
-                    # Swap:
-                    array[index], array[index + 1] = array[index + 1], array[index]
-
-                    # Output and statistics
-                    self.swaps += 1
-                    swapped = True
-                    output.append(
-                        f"    [green]✅ {cur_element} > {adj_element} → TROCAR![/]"
-                    )
-
-                    # Show result after swap
-                    visual_array_after = self._create_visual_array(
-                        array, [index, index + 1], iteration, swap_highlight=True
-                    )
-                    output.append(f"    Resultado: {' '.join(visual_array_after)}")
-                else:
-                    output.append(
-                        f"    [red]❌ {cur_element} ≤ {adj_element} → não trocar[/]"
-                    )
-                output.append("")
+        array = self._working_array(input_array, in_place)
+        if self.profiler is not None:
+            with self.profiler.phase("sort"):
+                deque(self.generate_events(array), maxlen=0)
+        else:
+            deque(self.generate_events(array), maxlen=0)
+        return array
+
+    def operation_counts(self, input_array: ArrayLike) -> Dict[str, int]:
+        """
+        Count comparisons, swaps, moves and array reads/writes of a run.
 
-            if not swapped:
-                output.append(
-                    "    [yellow]🎉 Nenhuma troca neste passo! Array pode estar ordenado.[/]"
-                )
-                break
+        Runs the event engine on a copy; see ``events.count_accesses`` for how
+        each event is counted.
+        """
+        return count_accesses(self.iter_events(input_array))
 
-            output.append("─" * 40)
-            output.append("")
+    @staticmethod
+    def _working_array(input_array: ArrayLike, in_place: bool) -> ArrayLike:
+        if in_place:
+            check_writable(input_array)
+            return input_array
+        return copy_buffer(input_array)
 
-        # Final result
-        output.append("")
-        output.append("[bold green]🎉 ORDENAÇÃO CONCLUÍDA![/]")
-        output.append("")
-        output.append(f"[white]Array final:[/] [bold cyan]{array}[/]")
-        output.append("")
-        output.append("[white]📊 Estatísticas:[/]")
-        output.append(f"[white]  • Comparações:[/] [yellow]{self.comparisons}[/]")
-        output.append(f"[white]  • Trocas realizadas:[/] [yellow]{self.swaps}[/]")
-        output.append(f"[white]  • Complexidade:[/] O(n²) = O({length}²) = {length**2}")
+    def sort_stats(self, input_array: List[int]) -> List[int]:
+        """
+        Stats-only mode: compute the sorted array and the counters, no output.
 
-        return "\n".join(output)
+        Subclasses override ``_compute_stats`` with an exact formula when one
+        exists; otherwise the algorithm runs through its event engine.
 
-    def _create_visual_array(
-        self,
-        array: List[int],
-        highlight_indices: List[int],
-        sorted_elements: int,
-        swap_highlight: bool = False,
-    ) -> List[str]:
-        """Create visual representation of array with highlighting."""
-        visual_array = []
-        length = len(array)
+        Args:
+            input_array: The array to sort
 
-        for i, val in enumerate(array):
-            if i in highlight_indices:
-                if swap_highlight:
-                    visual_array.append(f"[green on white] {val} [/]")
-                elif i == highlight_indices[0]:
-                    visual_array.append(f"[magenta on white] {val} [/]")
-                else:
-                    visual_array.append(f"[cyan on white] {val} [/]")
-            elif i >= length - sorted_elements:
-                visual_array.append(f"[dim] {val} [/]")
-            else:
-                visual_array.append(f"[white] {val} [/]")
+        Returns:
+            The sorted copy of the array (statistics are kept on the instance)
+        """
+        stats = self._compute_stats(input_array)
+        if stats is None:
+            return self.sort(input_array)
 
-        return visual_array
+        self.comparisons = stats["comparisons"]
+        self.swaps = stats["swaps"]
+        return sorted(input_array)
 
+    def _compute_stats(self, input_array: List[int]) -> Optional[Dict[str, int]]:
+        """Return exact ``comparisons``/``swaps`` counters, or None if unknown."""
+        return None
 
-class SelectionSortVisualizer(SortingVisualizer):
-    """Selection Sort algorithm with visualization."""
+    def render_lines(
+        self, input_array: ArrayLike, in_place: bool = False, **options
+    ) -> Iterator[str]:
+        """Yield the Rich-formatted visualization lazily, one line at a time.
 
-    def sort_complete(self, input_array: List[int]) -> str:
+        Extra keyword arguments (e.g. ``delta``) go to the renderer.
+        """
+        renderer = self.new_renderer(input_array, **options)
+        return renderer.render(self.iter_events(input_array, in_place))
+
+    def new_renderer(self, input_array: ArrayLike, **options) -> TraceRenderer:
+        """Create this algorithm's renderer, sharing the visualizer's profiler."""
+        renderer = self.renderer_class(input_array, **options)
+        if self.profiler is not None:
+            renderer.attach_profiler(self.profiler)
+        return renderer
+
+    def sort_complete(
+        self, input_array: ArrayLike, in_place: bool = False, **options
+    ) -> str:
         """
-        Execute selection sort and return complete Rich-formatted visualization.
+        Execute the algorithm and return complete Rich-formatted visualization.
 
         Args:
             input_array: The array to sort
+            in_place: Sort ``input_array`` itself instead of a copy
+            **options: Renderer options, such as ``delta=True``
 
         Returns:
             Complete Rich-formatted string with the full sorting process
         """
-        self.reset_stats()
-        array = input_array.copy()
-        length = len(array)
-        output = []
-
-        # Header
-        output.append("[bold cyan]🔄 SELECTION SORT[/]")
-        output.append("")
-        output.append(f"[white]Array inicial:[/] {input_array}")
-        output.append(f"[white]Tamanho:[/] {length} elementos")
-        output.append("")
-        output.append("[dim]O Selection Sort encontra o menor elemento")
-        output.append("e o coloca na posição correta a cada iteração.[/]")
-        output.append("─" * 60)
-        output.append("")
-
-        # Main sorting loop - só precisamos ir até o penúltimo
-        for cur_index in range(length - 1):
-            output.append(
-                f"[bold blue]🔄 PASSO {cur_index + 1}/{length - 1}[/] - Encontrando elemento para posição {cur_index}"
-            )
-            if cur_index == 0:
-                output.append(
-                    "[dim]💡 A cada passo, encontramos o menor elemento restante[/]"
-                )
-            output.append("")
+        lines = self.render_lines(input_array, in_place, **options)
+        if self.profiler is not None:
+            # A geração das linhas fica nas outras fases; aqui só a junção
+            lines = list(lines)
+            with self.profiler.phase("join"):
+                return "\n".join(lines)
+        return "\n".join(lines)
 
-            min_index = cur_index
-            min_value = array[cur_index]
 
-            output.append(
-                f"    🔍 Procurando o menor elemento a partir da posição {cur_index}"
-            )
-            output.append(f"    Candidato inicial: {min_value} (pos: {min_index})")
-            output.append("")
+class BubbleSortVisualizer(SortingVisualizer):
+    """Bubble Sort algorithm with visualization."""
 
-            # Find minimum element in remaining unsorted portion
-            for candidate_index in range(cur_index + 1, length):
-                candidate_value = array[candidate_index]
-                self.comparisons += 1
+    renderer_class = BubbleSortRenderer
 
-                output.append(
-                    f"    🔍 Comparando {candidate_value} (pos: {candidate_index}) com atual mínimo {min_value}"
-                )
+    def _compute_stats(self, input_array: List[int]) -> Optional[Dict[str, int]]:
+        return bubble_sort_stats(input_array)
 
-                # Visual representation during search
-                visual_array = self._create_visual_array_selection(
-                    array, cur_index, min_index, candidate_index, length
-                )
-                output.append(f"    Array: {' '.join(visual_array)}")
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        length = len(array)
 
-                if candidate_value < min_value:
-                    min_value = candidate_value
-                    min_index = candidate_index
-                    output.append(
-                        f"    [green]✅ Novo mínimo encontrado: {min_value} na posição {min_index}[/]"
-                    )
-                else:
-                    output.append(
-                        f"    [red]❌ {candidate_value} ≥ {min_value} → manter mínimo atual[/]"
-                    )
+        for iteration in range(length):
+            yield (PASS_START, iteration, 0)
 
-                output.append("")
+            swapped = False
+            for index in range(length - iteration - 1):
+                # "-1" porque precisamos pegar o elemento adjacente (index + 1)
+                # "-iteration" porque a cada iteração um novo elemento já estará ordenado no final do array
+                self.comparisons += 1
+                yield (COMPARE, index, index + 1)
 
-            # Show final minimum found
-            output.append(
-                f"    [yellow]🎯 Menor elemento encontrado: {min_value} (pos: {min_index})[/]"
-            )
+                if array[index] > array[index + 1]:
+                    array[index], array[index + 1] = array[index + 1], array[index]
+                    self.swaps += 1
+                    swapped = True
+                    yield (SWAP, index, index + 1)
 
-            if min_index != cur_index:
-                output.append(
-                    f"    [blue]🔄 Trocando posição {cur_index} ({array[cur_index]}) com posição {min_index} ({min_value})[/]"
-                )
+            yield (PASS_END, iteration, 0)
 
-                # Show before swap
-                visual_before = self._create_visual_array_selection(
-                    array, cur_index, min_index, -1, length, show_swap=True
-                )
-                output.append(f"    Antes:  {' '.join(visual_before)}")
+            if not swapped:
+                break
 
-                # Perform swap
-                array[cur_index], array[min_index] = array[min_index], array[cur_index]
-                self.swaps += 1
 
-                # Show after swap
-                visual_after = self._create_visual_array_selection(
-                    array, cur_index, -1, -1, length, show_result=True
-                )
-                output.append(f"    Depois: {' '.join(visual_after)}")
-            else:
-                output.append(f"    [green]✅ Elemento já está na posição correta![/]")
+class SelectionSortVisualizer(SortingVisualizer):
+    """Selection Sort algorithm with visualization."""
 
-            if cur_index > 0:
-                output.append(
-                    f"    [dim]Primeiros {cur_index + 1} elementos já estão ordenados ✅[/]"
-                )
+    renderer_class = SelectionSortRenderer
 
-            output.append("─" * 40)
-            output.append("")
+    def _compute_stats(self, input_array: List[int]) -> Optional[Dict[str, int]]:
+        return selection_sort_stats(input_array)
 
-        # Final result
-        output.append("")
-        output.append("[bold green]🎉 ORDENAÇÃO CONCLUÍDA![/]")
-        output.append("")
-        output.append(f"[white]Array final:[/] [bold cyan]{array}[/]")
-        output.append("")
-        output.append("[white]📊 Estatísticas:[/]")
-        output.append(f"[white]  • Comparações:[/] [yellow]{self.comparisons}[/]")
-        output.append(f"[white]  • Trocas realizadas:[/] [yellow]{self.swaps}[/]")
-        output.append(f"[white]  • Complexidade:[/] O(n²) = O({length}²) = {length**2}")
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        length = len(array)
 
-        return "\n".join(output)
+        # Só precisamos ir até o penúltimo
+        for cur_index in range(length - 1):
+            yield (PASS_START, cur_index, 0)
 
-    def _create_visual_array_selection(
-        self,
-        array: List[int],
-        current_pos: int,
-        min_pos: int,
-        candidate_pos: int,
-        length: int,
-        show_swap: bool = False,
-        show_result: bool = False,
-    ) -> List[str]:
-        """Create visual representation of array for selection sort."""
-        visual_array = []
-
-        for i, val in enumerate(array):
-            if show_result and i <= current_pos:
-                # Show sorted portion in green
-                visual_array.append(f"[bold green] {val} [/]")
-            elif show_swap and (i == current_pos or i == min_pos):
-                # Show elements being swapped
-                visual_array.append(f"[yellow on blue] {val} [/]")
-            elif i == current_pos:
-                # Current position being filled
-                visual_array.append(f"[bold blue on white] {val} [/]")
-            elif i == min_pos:
-                # Current minimum found
-                visual_array.append(f"[bold green on white] {val} [/]")
-            elif i == candidate_pos:
-                # Element being compared
-                visual_array.append(f"[magenta on white] {val} [/]")
-            elif i < current_pos:
-                # Already sorted portion
-                visual_array.append(f"[dim green] {val} [/]")
-            else:
-                # Unsorted portion
-                visual_array.append(f"[white] {val} [/]")
+            # Find minimum element in remaining unsorted portion
+            min_index = cur_index
+            for candidate_index in range(cur_index + 1, length):
+                self.comparisons += 1
+                yield (COMPARE, candidate_index, min_index)
 
-        return visual_array
+                if array[candidate_index] < array[min_index]:
+                    min_index = candidate_index
+
+            if min_index != cur_index:
+                array[cur_index], array[min_index] = array[min_index], array[cur_index]
+                self.swaps += 1
+                yield (SWAP, cur_index, min_index)
+
+            yield (PASS_END, cur_index, 0)
 
 
 class InsertionSortVisualizer(SortingVisualizer):
@@ -341,216 +305,615 @@ class InsertionSortVisualizer(SortingVisualizer):
     difíceis de interpretar para iniciantes.
     """
 
-    def sort_complete(self, input_array: List[int]) -> str:
-        """
-        Execute insertion sort and return complete Rich-formatted visualization.
+    renderer_class = InsertionSortRenderer
 
-        Args:
-            input_array: The array to sort
+    def _compute_stats(self, input_array: List[int]) -> Optional[Dict[str, int]]:
+        return insertion_sort_stats(input_array)
 
-        Returns:
-            Complete Rich-formatted string with the full sorting process
-        """
-        self.reset_stats()
-        array = input_array.copy()
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
         length = len(array)
-        output = []
-
-        # Header
-        output.append("[bold cyan]📍 INSERTION SORT[/]")
-        output.append("")
-        output.append(f"[white]Array inicial:[/] {input_array}")
-        output.append(f"[white]Tamanho:[/] {length} elementos")
-        output.append("")
-        output.append("[dim]O Insertion Sort insere cada elemento")
-        output.append("na posição correta fazendo trocas com elementos maiores.[/]")
-        output.append("─" * 60)
-        output.append("")
-
-        # Main sorting loop - começamos do segundo elemento
-        for cur_index in range(1, length):
-            cur_value = array[cur_index]
-
-            output.append(
-                f"[bold blue]🔄 PASSO {cur_index}/{length - 1}[/] - Inserindo {cur_value} na posição correta"
-            )
-            if cur_index == 1:
-                output.append(
-                    "[dim]💡 A cada passo, inserimos o elemento atual na posição correta à esquerda[/]"
-                )
-            output.append("")
 
-            output.append(
-                f"    🎯 Elemento a inserir: {cur_value} (posição {cur_index})"
-            )
-
-            # Show initial state
-            visual_array = self._create_visual_array_insertion(
-                array, cur_index, cur_index, length
-            )
-            output.append(f"    Array inicial: {' '.join(visual_array)}")
-            output.append("")
-
-            current_pos = cur_index
-            swaps_in_step = 0
+        # Começamos do segundo elemento
+        for cur_index in range(1, length):
+            yield (PASS_START, cur_index, 0)
 
             # Enquanto há elementos à esquerda maiores que o valor atual
-            while current_pos > 0 and array[current_pos - 1] > cur_value:
+            current_pos = cur_index
+            while current_pos > 0:
                 self.comparisons += 1
+                yield (COMPARE, current_pos - 1, current_pos)
 
-                output.append(
-                    f"    🔍 Comparando {cur_value} com {array[current_pos - 1]} (pos {current_pos - 1})"
-                )
-                output.append(
-                    f"    [green]✅ {array[current_pos - 1]} > {cur_value} → TROCAR![/]"
-                )
-
-                # Show before swap
-                visual_before = self._create_visual_array_insertion(
-                    array,
-                    cur_index,
-                    current_pos,
-                    length,
-                    show_swap_positions=[current_pos - 1, current_pos],
-                )
-                output.append(f"    Antes:  {' '.join(visual_before)}")
+                if array[current_pos - 1] <= array[current_pos]:
+                    break
 
-                # Perform swap
                 array[current_pos], array[current_pos - 1] = (
                     array[current_pos - 1],
                     array[current_pos],
                 )
                 self.swaps += 1
-                swaps_in_step += 1
+                yield (SWAP, current_pos - 1, current_pos)
 
-                # Show after swap
-                visual_after = self._create_visual_array_insertion(
-                    array, cur_index, current_pos - 1, length, show_result=True
-                )
-                output.append(f"    Depois: {' '.join(visual_after)}")
-                output.append("")
+                current_pos -= 1
+
+            yield (PASS_END, cur_index, 0)
+
+
+class BubbleLastSwapVisualizer(BubbleSortVisualizer):
+    """Bubble Sort that ends each pass at the last swap of the previous one.
+
+    Everything after the last swap of a pass is already in its final place,
+    so the range can shrink by more than one element per pass.
+    """
+
+    renderer_class = BubbleLastSwapRenderer
+
+    def _compute_stats(self, input_array: List[int]) -> Optional[Dict[str, int]]:
+        return None
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        # A partir de "bound" o array já está ordenado
+        bound = len(array)
+        iteration = 0
+
+        while bound > 1:
+            yield (PASS_START, iteration, bound)
+
+            last_swap = 0
+            for index in range(bound - 1):
+                self.comparisons += 1
+                yield (COMPARE, index, index + 1)
+
+                if array[index] > array[index + 1]:
+                    array[index], array[index + 1] = array[index + 1], array[index]
+                    self.swaps += 1
+                    last_swap = index + 1
+                    yield (SWAP, index, index + 1)
+
+            yield (PASS_END, iteration, 0)
+
+            bound = last_swap
+            iteration += 1
+
+
+class InsertionShiftVisualizer(SortingVisualizer):
+    """Classic Insertion Sort: the element is kept aside and larger ones shift right.
+
+    Each shift is one write (a MOVE event) instead of the three assignments
+    of a swap, and the element is written only once, at its final position.
+    """
+
+    renderer_class = InsertionShiftRenderer
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        length = len(array)
+
+        for cur_index in range(1, length):
+            yield (PASS_START, cur_index, 0)
 
+            key = array[cur_index]
+            yield (LOAD, cur_index, 0)
+
+            current_pos = cur_index
+            while current_pos > 0:
+                self.comparisons += 1
+                yield (COMPARE, current_pos - 1, KEY)
+
+                if array[current_pos - 1] <= key:
+                    break
+
+                array[current_pos] = array[current_pos - 1]
+                yield (MOVE, current_pos - 1, current_pos)
                 current_pos -= 1
 
-            # Final comparison if we stopped
-            if current_pos > 0:
+            if current_pos != cur_index:
+                array[current_pos] = key
+                yield (STORE, current_pos, 0)
+
+            yield (PASS_END, cur_index, 0)
+
+
+class InsertionBinaryVisualizer(SortingVisualizer):
+    """Insertion Sort that finds the insertion point by binary search.
+
+    Comparisons drop to O(n log n); the number of shifts is the same as in
+    the shift-based version. Equal elements keep their order (the search
+    looks for the position after the last element ``<=`` the key).
+    """
+
+    renderer_class = InsertionBinaryRenderer
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        length = len(array)
+
+        for cur_index in range(1, length):
+            yield (PASS_START, cur_index, 0)
+
+            key = array[cur_index]
+            yield (LOAD, cur_index, 0)
+
+            low, high = 0, cur_index
+            while low < high:
+                middle = (low + high) // 2
                 self.comparisons += 1
-                output.append(
-                    f"    🔍 Comparando {cur_value} com {array[current_pos - 1]} (pos {current_pos - 1})"
-                )
-                output.append(
-                    f"    [red]❌ {array[current_pos - 1]} ≤ {cur_value} → posição encontrada![/]"
-                )
-                output.append("")
+                yield (COMPARE, middle, KEY)
 
-            # Summary of this step
-            if swaps_in_step > 0:
-                output.append(
-                    f"    [yellow]📍 Elemento {cur_value} inserido na posição {current_pos} após {swaps_in_step} trocas[/]"
-                )
+                if array[middle] <= key:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            for current_pos in range(cur_index, low, -1):
+                array[current_pos] = array[current_pos - 1]
+                yield (MOVE, current_pos - 1, current_pos)
+
+            if low != cur_index:
+                array[low] = key
+                yield (STORE, low, 0)
+
+            yield (PASS_END, cur_index, 0)
+
+
+class QuickSortVisualizer(SortingVisualizer):
+    """Quick Sort: each pass partitions a range around a pivot.
+
+    The chosen pivot is moved to the start of the range and a Lomuto
+    partition gathers the smaller elements right after it; the pivot then
+    goes between the two parts, at its final position. With ``three_way``
+    the elements equal to the pivot are gathered in the middle (Dijkstra's
+    partition) and left out of both parts, which keeps inputs with many
+    repeated values at O(n log n).
+
+    The ranges wait on an explicit stack, the smaller part on top, so the
+    stack never holds more than O(log n) of them. The random strategy draws
+    from its own generator seeded with ``seed``, so a run is reproducible.
+    """
+
+    renderer_class = QuickSortRenderer
+    pivot = PIVOT_MEDIAN3
+    three_way = False
+
+    def __init__(
+        self,
+        pivot: Optional[str] = None,
+        three_way: Optional[bool] = None,
+        seed: int = 0,
+    ):
+        super().__init__()
+        if pivot is not None:
+            if pivot not in PIVOT_STRATEGIES:
+                raise ValueError(f"Unknown pivot strategy: {pivot}")
+            self.pivot = pivot
+        if three_way is not None:
+            self.three_way = three_way
+            self.renderer_class = (
+                QuickThreeWayRenderer if three_way else QuickSortRenderer
+            )
+        self.seed = seed
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        rng = random.Random(self.seed)
+        stack = [(0, len(array) - 1)]
+        pass_index = 0
+
+        while stack:
+            lo, hi = stack.pop()
+            if hi <= lo:
+                continue
+
+            yield (PASS_START, pass_index, 0)
+            yield (RANGE, lo, hi)
+
+            pivot_index = yield from self._choose_pivot(array, lo, hi, rng)
+            yield (PIVOT, pivot_index, 0)
+            if pivot_index != lo:
+                array[lo], array[pivot_index] = array[pivot_index], array[lo]
+                self.swaps += 1
+                yield (SWAP, lo, pivot_index)
+
+            if self.three_way:
+                lt, gt = yield from self._partition_three_way(array, lo, hi)
             else:
-                output.append(
-                    f"    [green]✅ Elemento {cur_value} já estava na posição correta![/]"
-                )
+                lt = gt = yield from self._partition(array, lo, hi)
 
-            if cur_index > 1:
-                output.append(
-                    f"    [dim]Primeiros {cur_index + 1} elementos já estão ordenados ✅[/]"
-                )
+            yield (PASS_END, pass_index, 0)
+            pass_index += 1
 
-            output.append("─" * 40)
-            output.append("")
+            # A parte menor fica no topo da pilha e é ordenada primeiro
+            left, right = (lo, lt - 1), (gt + 1, hi)
+            if lt - lo < hi - gt:
+                stack.append(right)
+                stack.append(left)
+            else:
+                stack.append(left)
+                stack.append(right)
+
+    def _choose_pivot(
+        self, array: List[int], lo: int, hi: int, rng: random.Random
+    ) -> Iterator[Event]:
+        """Yield the comparisons of the pivot choice; returns the pivot position."""
+        if self.pivot == PIVOT_RANDOM:
+            return rng.randint(lo, hi)
+        if self.pivot == PIVOT_FIRST or hi - lo < 2:
+            return lo
+
+        # Mediana de três: início, meio e fim do intervalo
+        mid = (lo + hi) // 2
+        self.comparisons += 1
+        yield (COMPARE, lo, mid)
+        self.comparisons += 1
+        yield (COMPARE, mid, hi)
+        if array[lo] <= array[mid]:
+            if array[mid] <= array[hi]:
+                return mid
+        elif array[hi] <= array[mid]:
+            return mid
+
+        # O meio é o menor ou o maior dos três: a mediana é um dos extremos
+        self.comparisons += 1
+        yield (COMPARE, lo, hi)
+        if (array[lo] <= array[hi]) == (array[lo] <= array[mid]):
+            return hi
+        return lo
+
+    def _partition(self, array: List[int], lo: int, hi: int) -> Iterator[Event]:
+        """Lomuto partition around ``array[lo]``; returns the pivot's final position."""
+        pivot = array[lo]
+        store = lo
+        for index in range(lo + 1, hi + 1):
+            self.comparisons += 1
+            yield (COMPARE, index, lo)
+
+            if array[index] < pivot:
+                store += 1
+                if store != index:
+                    array[store], array[index] = array[index], array[store]
+                    self.swaps += 1
+                    yield (SWAP, store, index)
+
+        if store != lo:
+            array[lo], array[store] = array[store], array[lo]
+            self.swaps += 1
+            yield (SWAP, lo, store)
+        return store
+
+    def _partition_three_way(
+        self, array: List[int], lo: int, hi: int
+    ) -> Iterator[Event]:
+        """Three-way partition around ``array[lo]``; returns the equal range."""
+        pivot = array[lo]
+        lt, index, gt = lo, lo + 1, hi
+        while index <= gt:
+            # array[lt] é sempre uma cópia do pivô
+            self.comparisons += 1
+            yield (COMPARE, index, lt)
+
+            value = array[index]
+            if value < pivot:
+                array[lt], array[index] = value, array[lt]
+                self.swaps += 1
+                yield (SWAP, lt, index)
+                lt += 1
+                index += 1
+            elif value > pivot:
+                if index != gt:
+                    array[index], array[gt] = array[gt], value
+                    self.swaps += 1
+                    yield (SWAP, index, gt)
+                gt -= 1
+            else:
+                index += 1
+        return lt, gt
 
-        # Final result
-        output.append("")
-        output.append("[bold green]🎉 ORDENAÇÃO CONCLUÍDA![/]")
-        output.append("")
-        output.append(f"[white]Array final:[/] [bold cyan]{array}[/]")
-        output.append("")
-        output.append("[white]📊 Estatísticas:[/]")
-        output.append(f"[white]  • Comparações:[/] [yellow]{self.comparisons}[/]")
-        output.append(f"[white]  • Trocas realizadas:[/] [yellow]{self.swaps}[/]")
-        output.append(f"[white]  • Complexidade:[/] O(n²) = O({length}²) = {length**2}")
 
-        return "\n".join(output)
+class QuickFirstVisualizer(QuickSortVisualizer):
+    """Quick Sort with the first element as pivot (O(n²) on sorted inputs)."""
+
+    pivot = PIVOT_FIRST
+
+
+class QuickRandomVisualizer(QuickSortVisualizer):
+    """Quick Sort with a (seeded) random pivot."""
+
+    pivot = PIVOT_RANDOM
+
+
+class QuickThreeWayVisualizer(QuickSortVisualizer):
+    """Quick Sort with median-of-three pivot and three-way partition."""
+
+    renderer_class = QuickThreeWayRenderer
+    three_way = True
+
+
+class MergeSortVisualizer(SortingVisualizer):
+    """Top-down Merge Sort with a single auxiliary buffer.
+
+    The buffer is allocated once, with the size of the array, and every merge
+    uses its own positions of it: the smaller head of the two runs is copied
+    into the buffer until one run is exhausted, and the merged prefix is then
+    copied back. What is left of the right run is already in place and is not
+    copied at all; a merge whose runs are already in order (last of the left
+    <= first of the right) costs a single comparison.
+    """
+
+    renderer_class = MergeSortRenderer
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        aux = copy_buffer(array)
+        for pass_index, (lo, mid, hi) in enumerate(self._merges(len(array))):
+            yield (PASS_START, pass_index, 0)
+            yield from self._merge(array, aux, lo, mid, hi)
+            yield (PASS_END, pass_index, 0)
+
+    def _merges(self, length: int) -> Iterator[Tuple[int, int, int]]:
+        """Yield the ``(lo, mid, hi)`` merges in the order of the recursion."""
+        # Pilha explícita: (lo, hi, filhos já ordenados?)
+        stack = [(0, length - 1, False)]
+        while stack:
+            lo, hi, ready = stack.pop()
+            if hi <= lo:
+                continue
+            mid = (lo + hi) // 2
+            if ready:
+                yield (lo, mid, hi)
+            else:
+                stack.append((lo, hi, True))
+                stack.append((mid + 1, hi, False))
+                stack.append((lo, mid, False))
+
+    def _merge(
+        self, array: List[int], aux: List[int], lo: int, mid: int, hi: int
+    ) -> Iterator[Event]:
+        """Merge the sorted runs ``lo..mid`` and ``mid+1..hi``."""
+        yield (RANGE, lo, mid)
+        yield (RANGE, mid + 1, hi)
+
+        self.comparisons += 1
+        yield (COMPARE, mid, mid + 1)
+        if array[mid] <= array[mid + 1]:
+            return
+
+        left, right, written = lo, mid + 1, lo
+        while left <= mid and right <= hi:
+            self.comparisons += 1
+            yield (COMPARE, left, right)
+
+            # "<=" na esquerda mantém a ordem dos iguais (estável)
+            if array[left] <= array[right]:
+                aux[written] = array[left]
+                yield (TO_AUX, left, written)
+                left += 1
+            else:
+                aux[written] = array[right]
+                yield (TO_AUX, right, written)
+                right += 1
+            written += 1
+
+        while left <= mid:
+            aux[written] = array[left]
+            yield (TO_AUX, left, written)
+            left += 1
+            written += 1
+
+        for position in range(lo, written):
+            array[position] = aux[position]
+            yield (FROM_AUX, position, position)
+
+
+class MergeBottomUpVisualizer(MergeSortVisualizer):
+    """Bottom-up Merge Sort: runs of width 1, 2, 4... merged left to right."""
+
+    def _merges(self, length: int) -> Iterator[Tuple[int, int, int]]:
+        width = 1
+        while width < length:
+            for lo in range(0, length - width, 2 * width):
+                yield (lo, lo + width - 1, min(lo + 2 * width - 1, length - 1))
+            width *= 2
+
+
+class ParallelMergeSortVisualizer(MergeSortVisualizer):
+    """Merge Sort split across worker processes, joined by a k-way merge.
+
+    The array is split into ``chunk_bounds`` runs. Each run is one pass,
+    sorted by a worker with the top-down Merge Sort; the last pass merges
+    all the runs at once: a tournament tree picks the smallest head among
+    them (ceil(log2 k) comparisons per element) into the auxiliary buffer,
+    which is then copied back. What is left of the last run when every other
+    run is exhausted is already in place.
+
+    The event engine plays the workers one after the other. ``sort`` runs
+    them at the same time in a process pool of ``workers`` processes (default:
+    one per CPU), over the array copied once into shared memory (see
+    ``parallel``), and then merges in this process; the counters are the same.
+
+    With ``chunks`` left as None the split depends on the input: narrated
+    inputs get ``PARALLEL_CHUNKS`` runs, and from ``PARALLEL_MIN_SIZE`` on
+    there is one run per worker, so no worker sorts two runs one after the
+    other and the serial k-way merge stays as narrow as possible.
+    """
 
-    def _create_visual_array_insertion(
+    renderer_class = ParallelMergeSortRenderer
+
+    def __init__(self, chunks: Optional[int] = None, workers: Optional[int] = None):
+        super().__init__()
+        self.chunks = chunks
+        self.workers = workers
+
+    def worker_count(self) -> int:
+        """Processes of the pool: ``workers``, or one per CPU."""
+        return self.workers or os.cpu_count() or 1
+
+    def chunk_count(self, length: int) -> int:
+        """Runs to split an input of ``length`` elements into (see ``chunk_bounds``)."""
+        if self.chunks is not None:
+            return self.chunks
+        if length >= PARALLEL_MIN_SIZE:
+            return self.worker_count()
+        return PARALLEL_CHUNKS
+
+    def new_renderer(self, input_array: ArrayLike, **options) -> TraceRenderer:
+        options.setdefault("chunks", self.chunk_count(len(input_array)))
+        return super().new_renderer(input_array, **options)
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        length = len(array)
+        aux = copy_buffer(array)
+        runs = chunk_bounds(length, self.chunk_count(length))
+
+        for worker, (lo, hi) in enumerate(runs):
+            yield (PASS_START, worker, 0)
+            # Trecho deste worker
+            yield (RANGE, lo, hi)
+            yield from self._sort_run(array, aux, lo, hi)
+            yield (PASS_END, worker, 0)
+
+        if len(runs) > 1:
+            yield (PASS_START, len(runs), 0)
+            yield (RANGE, 0, length - 1)
+            yield from self._kway_merge(array, aux, runs)
+            yield (PASS_END, len(runs), 0)
+
+    def _sort_run(
+        self, array: List[int], aux: List[int], lo: int, hi: int
+    ) -> Iterator[Event]:
+        """Merge Sort of the positions ``lo..hi`` (the run of one worker)."""
+        for left, mid, right in self._merges(hi - lo + 1):
+            yield from self._merge(array, aux, lo + left, lo + mid, lo + right)
+
+    def _kway_merge(
+        self, array: List[int], aux: List[int], runs: List[Tuple[int, int]]
+    ) -> Iterator[Event]:
+        """Merge the sorted ``runs`` (contiguous, in order) with a tournament tree."""
+        for lo, hi in runs:
+            yield (RANGE, lo, hi)
+
+        heads = [lo for lo, _ in runs]
+        # Folhas em tree[size:]; cada nó guarda o trecho vencedor (None: esgotado)
+        size = 1
+        while size < len(runs):
+            size *= 2
+        tree: List[Optional[int]] = [None] * (2 * size)
+        tree[size : size + len(runs)] = range(len(runs))
+        for node in range(size - 1, 0, -1):
+            yield from self._play(array, heads, tree, node)
+
+        last = len(runs) - 1
+        remaining = len(runs)
+        written = runs[0][0]
+        while tree[1] is not None:
+            run = tree[1]
+            if remaining == 1 and run == last:
+                # O resto do último trecho já está no lugar
+                break
+
+            aux[written] = array[heads[run]]
+            yield (TO_AUX, heads[run], written)
+            written += 1
+            heads[run] += 1
+
+            node = size + run
+            if heads[run] > runs[run][1]:
+                tree[node] = None
+                remaining -= 1
+            node //= 2
+            while node:
+                yield from self._play(array, heads, tree, node)
+                node //= 2
+
+        for position in range(runs[0][0], written):
+            array[position] = aux[position]
+            yield (FROM_AUX, position, position)
+
+    def _play(
         self,
         array: List[int],
-        original_pos: int,
-        current_pos: int,
-        length: int,
-        show_swap_positions: List[int] = None,
-        show_result: bool = False,
-    ) -> List[str]:
-        """Create visual representation of array for insertion sort."""
-        visual_array = []
-        show_swap_positions = show_swap_positions or []
-
-        for i, val in enumerate(array):
-            if show_result and i == current_pos:
-                # Show element in its new correct position
-                visual_array.append(f"[bold green on white] {val} [/]")
-            elif show_swap_positions and i in show_swap_positions:
-                # Show elements being swapped
-                visual_array.append(f"[yellow on blue] {val} [/]")
-            elif i == current_pos:
-                # Current position of the element being inserted
-                visual_array.append(f"[bold blue on white] {val} [/]")
-            elif i == original_pos and i != current_pos:
-                # Original position (if different from current)
-                visual_array.append(f"[magenta on white] {val} [/]")
-            elif i < original_pos:
-                # Already sorted portion
-                visual_array.append(f"[dim green] {val} [/]")
-            else:
-                # Unsorted portion
-                visual_array.append(f"[white] {val} [/]")
-
-        return visual_array
-
-
-# Algorithm registry
-ALGORITHMS = {
-    "bubble": {
-        "name": "🫧 Bubble Sort",
-        "visualizer": BubbleSortVisualizer,
-        "implemented": True,
-    },
-    "selection": {
-        "name": "🔄 Selection Sort",
-        "visualizer": SelectionSortVisualizer,
-        "implemented": True,
-    },
-    "insertion": {
-        "name": "📍 Insertion Sort",
-        "visualizer": InsertionSortVisualizer,
-        "implemented": True,
-    },
-    "quick": {"name": "🚀 Quick Sort", "visualizer": None, "implemented": False},
-    "merge": {"name": "🔀 Merge Sort", "visualizer": None, "implemented": False},
-}
-
-
-def get_algorithm_visualizer(algorithm_id: str) -> SortingVisualizer:
-    """Get a visualizer instance for the specified algorithm."""
-    if algorithm_id not in ALGORITHMS:
-        raise ValueError(f"Unknown algorithm: {algorithm_id}")
-
-    algo_info = ALGORITHMS[algorithm_id]
-    if not algo_info["implemented"]:
-        raise NotImplementedError(f"Algorithm {algorithm_id} is not yet implemented")
-
-    return algo_info["visualizer"]()
-
-
-def get_available_algorithms() -> List[Dict[str, Any]]:
-    """Get list of all available algorithms with their metadata."""
-    return [
-        {
-            "id": algo_id,
-            "name": algo_info["name"],
-            "implemented": algo_info["implemented"],
-        }
-        for algo_id, algo_info in ALGORITHMS.items()
-    ]
+        heads: List[int],
+        tree: List[Optional[int]],
+        node: int,
+    ) -> Iterator[Event]:
+        """Decide the match at ``node`` between the winners of its two children."""
+        left, right = tree[2 * node], tree[2 * node + 1]
+        if left is None or right is None:
+            tree[node] = right if left is None else left
+            return
+
+        self.comparisons += 1
+        yield (COMPARE, heads[left], heads[right])
+        # "<=" favorece o trecho da esquerda: os iguais mantêm a ordem (estável)
+        tree[node] = left if array[heads[left]] <= array[heads[right]] else right
+
+    def sort(self, input_array: ArrayLike, in_place: bool = False) -> ArrayLike:
+        # Importado só aqui: multiprocessing só é carregado quando usado
+        from .parallel import parallel_sort, shared_format
+
+        workers = min(self.worker_count(), self.chunk_count(len(input_array)))
+        if (
+            workers <= 1
+            or len(input_array) < PARALLEL_MIN_SIZE
+            or shared_format(input_array) is None
+        ):
+            # Processos não compensam: os mesmos passos, aqui mesmo
+            return super().sort(input_array, in_place)
+
+        self.reset_stats()
+        array = self._working_array(input_array, in_place)
+        if self.profiler is not None:
+            with self.profiler.phase("sort"):
+                self.comparisons, self.swaps = parallel_sort(self, array, workers)
+        else:
+            self.comparisons, self.swaps = parallel_sort(self, array, workers)
+        return array
+
+
+class OddEvenSortVisualizer(SortingVisualizer):
+    """Odd-even transposition sort, the data-parallel relative of Bubble Sort.
+
+    Each pass is one phase: it compare-exchanges the pairs ``(i, i + 1)`` with
+    ``i`` even (even phases) or odd (odd phases). The pairs of a phase do not
+    overlap, so they could all run at once; the event engine yields them one
+    by one for the narration, while ``sort`` runs every phase as a single
+    vectorized NumPy operation (see ``vectorized``). At most n phases are
+    needed, and two phases in a row without swaps mean the array is sorted.
+    """
+
+    renderer_class = OddEvenSortRenderer
+
+    def generate_events(self, array: List[int]) -> Iterator[Event]:
+        length = len(array)
+        quiet = 0
+
+        for phase in range(length):
+            yield (PASS_START, phase, 0)
+
+            swapped = False
+            for index in range(phase % 2, length - 1, 2):
+                self.comparisons += 1
+                yield (COMPARE, index, index + 1)
+
+                if array[index] > array[index + 1]:
+                    array[index], array[index + 1] = array[index + 1], array[index]
+                    self.swaps += 1
+                    swapped = True
+                    yield (SWAP, index, index + 1)
+
+            yield (PASS_END, phase, 0)
+
+            # Uma fase par e uma ímpar sem trocas: todos os vizinhos em ordem
+            quiet = 0 if swapped else quiet + 1
+            if quiet == 2:
+                break
+
+    def sort(self, input_array: ArrayLike, in_place: bool = False) -> ArrayLike:
+        # Importado só aqui: os outros algoritmos não pagam o import do NumPy
+        from .vectorized import numpy, odd_even_sort
+
+        if numpy is None:
+            return super().sort(input_array, in_place)
+
+        self.reset_stats()
+        array = self._working_array(input_array, in_place)
+        if self.profiler is not None:
+            with self.profiler.phase("sort"):
+                self.comparisons, self.swaps = odd_even_sort(array)
+        else:
+            self.comparisons, self.swaps = odd_even_sort(array)
+        return array
@@ -0,0 +1,257 @@
+"""
+Batch runner module for RichSort.
+
+Runs every (algorithm, test case) pair of a matrix in a pool of worker
+processes and yields one result row per job as soon as it finishes, so the
+results of a long batch can be streamed to a file while it runs. Each job
+reports the counters and the sort time (see ``bench.benchmark_one``) and can
+also write its rendered narration to a file.
+
+Generated test cases travel to the workers as their description only: the
+array is built inside the worker process, never pickled.
+"""
+
+import argparse
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional
+
+from .bench import benchmark_one, write_results
+from .registry import get_algorithm_visualizer, get_available_algorithms
+from .renderers import OUTPUT_MAX_LINES, budget_options
+from .test_cases import (
+    DISTRIBUTIONS,
+    GENERATED_SIZE,
+    TEST_CASES,
+    generated_case,
+)
+
+BATCH_FIELDS = [
+    "algorithm",
+    "case",
+    "distribution",
+    "size",
+    "sort_seconds",
+    "render_seconds",
+    "comparisons",
+    "swaps",
+    "moves",
+    "reads",
+    "writes",
+    "lines",
+    "output",
+    "worker",
+    "error",
+]
+
+
+def _case_slug(test_case: Dict[str, Any]) -> str:
+    """File-name friendly id of a test case."""
+    if "distribution" in test_case:
+        return f"{test_case['distribution']}-{test_case['size']}-s{test_case['seed']}"
+    name = unicodedata.normalize("NFKD", test_case["name"])
+    name = "".join(
+        c if c.isalnum() else "-" for c in name.encode("ascii", "ignore").decode()
+    )
+    return "-".join(part for part in name.lower().split("-") if part)
+
+
+def build_jobs(
+    algorithms: List[str],
+    test_cases: List[Dict[str, Any]],
+    output_dir: Optional[str] = None,
+    max_lines: Optional[int] = OUTPUT_MAX_LINES,
+) -> List[Dict[str, Any]]:
+    """One job per (algorithm, test case); ``output_dir`` enables rendering."""
+    jobs = []
+    for test_case in test_cases:
+        for algorithm_id in algorithms:
+            output = None
+            if output_dir is not None:
+                output = os.path.join(
+                    output_dir, f"{algorithm_id}-{_case_slug(test_case)}.txt"
+                )
+            jobs.append(
+                {
+                    "algorithm": algorithm_id,
+                    "case": test_case,
+                    "output": output,
+                    "max_lines": max_lines,
+                }
+            )
+    return jobs
+
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one job (in a worker process) and return its result row."""
+    test_case = job["case"]
+    row = {field: None for field in BATCH_FIELDS}
+    row.update(
+        algorithm=job["algorithm"],
+        case=test_case["name"],
+        distribution=test_case.get("distribution"),
+        worker=os.getpid(),
+    )
+    try:
+        # Casos gerados montam o array aqui, no processo do worker
+        input_array = test_case["array"]
+        row["size"] = len(input_array)
+
+        result = benchmark_one(job["algorithm"], input_array, render=False)
+        row.update({field: value for field, value in result.items() if field in row})
+
+        if job["output"] is not None:
+            visualizer = get_algorithm_visualizer(job["algorithm"])
+            options = budget_options(job["max_lines"])
+            lines = 0
+            start = time.perf_counter()
+            with open(job["output"], "w", encoding="utf-8") as output:
+                for line in visualizer.render_lines(input_array, **options):
+                    output.write(line)
+                    output.write("\n")
+                    lines += 1
+            row["render_seconds"] = time.perf_counter() - start
+            row["lines"] = lines
+            row["output"] = job["output"]
+    except Exception as e:  # um job com erro não interrompe o lote
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def run_batch(
+    jobs: List[Dict[str, Any]], workers: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run ``jobs`` and yield their result rows in completion order.
+
+    Args:
+        jobs: Jobs from ``build_jobs``
+        workers: Worker processes (default: all CPUs); 1 runs the jobs in
+            this process, in order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for job in jobs:
+            yield run_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_job, job) for job in jobs]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Interrompido (Ctrl+C, consumidor parou): descarta o que não começou
+            for future in futures:
+                future.cancel()
+
+
+def _str_list(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    implemented = [a["id"] for a in get_available_algorithms() if a["implemented"]]
+
+    parser = argparse.ArgumentParser(
+        prog="richsort batch",
+        description=(
+            "Executa cada algoritmo em cada caso de teste em paralelo, "
+            "escrevendo os resultados à medida que terminam."
+        ),
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithms",
+        type=_str_list,
+        default=implemented,
+        help="algoritmos separados por vírgula (padrão: todos implementados)",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=_int_list,
+        default=[GENERATED_SIZE],
+        help=f"tamanhos dos casos gerados (padrão: {GENERATED_SIZE}; 0 = nenhum)",
+    )
+    parser.add_argument(
+        "-d",
+        "--distributions",
+        type=_str_list,
+        default=list(DISTRIBUTIONS),
+        help=f"distribuições dos casos gerados ({', '.join(DISTRIBUTIONS)})",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-fixed", action="store_true", help="não inclui os casos de teste fixos"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="processos em paralelo (padrão: todos os núcleos)",
+    )
+    parser.add_argument(
+        "--render-dir",
+        help="grava a narração de cada job neste diretório",
+    )
+    parser.add_argument(
+        "--max-lines",
+        type=int,
+        default=OUTPUT_MAX_LINES,
+        help="linhas de narração por arquivo antes de resumir (0 = sem limite)",
+    )
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument(
+        "-o", "--output", help="arquivo de resultados (padrão: saída padrão)"
+    )
+    return parser
+
+
+def main(argv: List[str] = None):
+    """Entry point for the batch runner."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    for algorithm_id in args.algorithms:
+        try:
+            get_algorithm_visualizer(algorithm_id)
+        except (ValueError, NotImplementedError) as e:
+            parser.error(str(e))
+    for distribution in args.distributions:
+        if distribution not in DISTRIBUTIONS:
+            parser.error(f"distribuição desconhecida: {distribution}")
+
+    test_cases = [] if args.no_fixed else list(TEST_CASES)
+    for size in args.sizes:
+        if size > 0:
+            test_cases.extend(
+                generated_case(distribution, size, args.seed)
+                for distribution in args.distributions
+            )
+    if not test_cases:
+        parser.error("nenhum caso de teste selecionado")
+
+    if args.render_dir:
+        os.makedirs(args.render_dir, exist_ok=True)
+    jobs = build_jobs(args.algorithms, test_cases, args.render_dir, args.max_lines)
+    rows = run_batch(jobs, args.workers)
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            write_results(rows, output, args.format, BATCH_FIELDS)
+    else:
+        write_results(rows, sys.stdout, args.format, BATCH_FIELDS)
+
+
+if __name__ == "__main__":
+    main()
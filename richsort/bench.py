@@ -0,0 +1,277 @@
+"""
+Benchmark module for RichSort.
+
+Headless benchmark of the registered algorithms over configurable input sizes
+and distributions. The sort phase (event engine at full speed) and the render
+phase (turning the recorded events into ``rich.text.Text`` lines, either by
+parsing the markup narration or directly with the ``text`` backend) are timed
+separately, and the results are written as JSON or CSV.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from typing import Any, Dict, Iterator, List
+
+from .registry import get_algorithm_visualizer, get_available_algorithms
+from .renderers import BACKENDS
+from .test_cases import DISTRIBUTIONS, generate_array
+
+RESULT_FIELDS = [
+    "algorithm",
+    "distribution",
+    "size",
+    "repeat",
+    "backend",
+    "sort_seconds",
+    "render_seconds",
+    "comparisons",
+    "swaps",
+    "moves",
+    "reads",
+    "writes",
+    "events",
+    "lines",
+    "chars",
+]
+
+
+def benchmark_one(
+    algorithm_id: str,
+    input_array: List[int],
+    render: bool = True,
+    backend: str = "markup",
+) -> Dict[str, Any]:
+    """Time one run of an algorithm; the render phase is optional."""
+    visualizer = get_algorithm_visualizer(algorithm_id)
+
+    start = time.perf_counter()
+    visualizer.sort(input_array)
+    sort_seconds = time.perf_counter() - start
+
+    result = {
+        "backend": backend if render else None,
+        "sort_seconds": sort_seconds,
+        "render_seconds": None,
+        "comparisons": visualizer.comparisons,
+        "swaps": visualizer.swaps,
+        "moves": None,
+        "reads": None,
+        "writes": None,
+        "events": None,
+        "lines": None,
+        "chars": None,
+    }
+
+    # Leituras/escritas vêm de uma segunda execução, fora da medição
+    counts = visualizer.operation_counts(input_array)
+    result["moves"] = counts["moves"]
+    result["reads"] = counts["reads"]
+    result["writes"] = counts["writes"]
+
+    if render:
+        # Os eventos são gravados fora da medição para isolar a renderização
+        events = list(visualizer.iter_events(input_array))
+        renderer = visualizer.renderer_class(input_array, backend=backend)
+        lines = 0
+        chars = 0
+
+        # As duas saídas terminam em rich.text.Text, como na exibição: o
+        # markup só é comparável depois de passar pelo parser do Rich
+        from rich.text import Text
+
+        start = time.perf_counter()
+        if backend == "markup":
+            for line in renderer.render(events):
+                text = Text.from_markup(line)
+                lines += 1
+                chars += len(text) + 1
+        else:
+            for text in renderer.render(events):
+                lines += 1
+                chars += len(text) + 1
+        result["render_seconds"] = time.perf_counter() - start
+
+        result["events"] = len(events)
+        result["lines"] = lines
+        result["chars"] = max(0, chars - 1)
+
+    return result
+
+
+def run_benchmarks(
+    algorithms: List[str],
+    sizes: List[int],
+    distributions: List[str],
+    repeats: int = 1,
+    seed: int = 0,
+    render_max_size: int = 200,
+    backend: str = "markup",
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result row per (algorithm, distribution, size, repeat)."""
+    for distribution in distributions:
+        for size in sizes:
+            for repeat in range(repeats):
+                # Mesma entrada para todos os algoritmos na mesma repetição;
+                # a repetição r usa a semente seed + r
+                input_array = generate_array(distribution, size, seed + repeat)
+                for algorithm_id in algorithms:
+                    result = benchmark_one(
+                        algorithm_id,
+                        input_array,
+                        render=size <= render_max_size,
+                        backend=backend,
+                    )
+                    yield {
+                        "algorithm": algorithm_id,
+                        "distribution": distribution,
+                        "size": size,
+                        "repeat": repeat,
+                        **result,
+                    }
+
+
+def write_results(
+    rows: Iterator[Dict[str, Any]],
+    output,
+    fmt: str,
+    fields: List[str] = RESULT_FIELDS,
+) -> None:
+    """Write result rows as CSV or JSON lines (streamed), a JSON list or a table."""
+    if fmt == "table":
+        _write_table(rows, output)
+    elif fmt == "jsonl":
+        for row in rows:
+            output.write(json.dumps(row) + "\n")
+            output.flush()
+    elif fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            output.flush()
+    else:
+        json.dump(list(rows), output, indent=2)
+        output.write("\n")
+
+
+def _write_table(rows: Iterator[Dict[str, Any]], output) -> None:
+    """Side-by-side table of the operation counts, one row per run."""
+    from rich.console import Console
+    from rich.table import Table
+
+    columns = [
+        "algorithm",
+        "distribution",
+        "size",
+        "comparisons",
+        "swaps",
+        "moves",
+        "reads",
+        "writes",
+        "sort_seconds",
+    ]
+    table = Table(title="⏱️ RichSort - benchmark")
+    for column in columns:
+        table.add_column(column, justify="left" if column == "algorithm" else "right")
+    for row in rows:
+        table.add_row(
+            *(
+                f"{row[column]:.4f}" if column == "sort_seconds" else str(row[column])
+                for column in columns
+            )
+        )
+    Console(file=output).print(table)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    implemented = [a["id"] for a in get_available_algorithms() if a["implemented"]]
+
+    parser = argparse.ArgumentParser(
+        prog="richsort-bench",
+        description="Benchmark headless dos algoritmos do RichSort.",
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithms",
+        default=",".join(implemented),
+        help="algoritmos separados por vírgula (padrão: todos implementados)",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=_int_list,
+        default=[10, 50, 100, 200],
+        help="tamanhos de entrada separados por vírgula",
+    )
+    parser.add_argument(
+        "-d",
+        "--distributions",
+        default=",".join(DISTRIBUTIONS),
+        help=f"distribuições separadas por vírgula ({', '.join(DISTRIBUTIONS)})",
+    )
+    parser.add_argument("-r", "--repeats", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--render-max-size",
+        type=int,
+        default=200,
+        help="não mede a renderização acima deste tamanho (padrão: 200)",
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=list(BACKENDS),
+        default="markup",
+        help="saída medida na renderização: markup ou rich.text.Text (padrão: markup)",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=["json", "jsonl", "csv", "table"], default="json"
+    )
+    parser.add_argument(
+        "-o", "--output", help="arquivo de saída (padrão: saída padrão)"
+    )
+    return parser
+
+
+def main(argv: List[str] = None):
+    """Entry point for the headless benchmark."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    algorithms = [a for a in args.algorithms.split(",") if a]
+    distributions = [d for d in args.distributions.split(",") if d]
+    for distribution in distributions:
+        if distribution not in DISTRIBUTIONS:
+            parser.error(f"distribuição desconhecida: {distribution}")
+    for algorithm_id in algorithms:
+        try:
+            get_algorithm_visualizer(algorithm_id)
+        except (ValueError, NotImplementedError) as e:
+            parser.error(str(e))
+
+    rows = run_benchmarks(
+        algorithms,
+        args.sizes,
+        distributions,
+        repeats=args.repeats,
+        seed=args.seed,
+        render_max_size=args.render_max_size,
+        backend=args.backend,
+    )
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            write_results(rows, output, args.format)
+    else:
+        write_results(rows, sys.stdout, args.format)
+
+
+if __name__ == "__main__":
+    main()
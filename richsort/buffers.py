@@ -0,0 +1,47 @@
+"""
+Buffer helpers for RichSort.
+
+The sorting engines and the renderers only take the length of an array, index
+it and assign to it, so besides ``list`` they work directly on writable
+objects that support the buffer protocol: ``array.array``, NumPy arrays,
+``memoryview`` and ``bytearray``. These helpers copy such objects without
+converting them to a list (no per-element boxing) and format their values
+for display.
+"""
+
+import copy
+from typing import Any, List, Union
+
+# Qualquer sequência mutável de números: lista, array.array, memoryview, NumPy...
+ArrayLike = Union[List[int], Any]
+
+
+def copy_buffer(values: ArrayLike) -> ArrayLike:
+    """Return a copy of ``values`` with the same type and element format."""
+    if isinstance(values, memoryview):
+        # bytearray(view) copia os bytes de uma vez; o cast restaura o formato
+        return memoryview(bytearray(values)).cast(values.format)
+    if hasattr(values, "copy"):
+        # list, bytearray e numpy.ndarray
+        return values.copy()
+    # array.array copia o buffer inteiro em __copy__
+    return copy.copy(values)
+
+
+def check_writable(values: ArrayLike) -> None:
+    """Raise ``TypeError`` if ``values`` cannot be sorted in place."""
+    if isinstance(values, memoryview):
+        readonly = values.readonly
+    elif hasattr(values, "flags") and hasattr(values.flags, "writeable"):
+        readonly = not values.flags.writeable
+    else:
+        readonly = not hasattr(values, "__setitem__")
+    if readonly:
+        raise TypeError(f"Cannot sort a read-only {type(values).__name__} in place")
+
+
+def format_values(values: ArrayLike) -> str:
+    """Format the values like a list (``[1, 2, 3]``) whatever their container."""
+    if isinstance(values, list):
+        return str(values)
+    return "[" + ", ".join(str(value) for value in values) + "]"
@@ -0,0 +1,230 @@
+"""
+Trace cache module for RichSort.
+
+Bounded memoization of the complete visualization of an (algorithm, input)
+pair, so selecting a combination that was already shown does not run the
+algorithm again. Entries are evicted in LRU order when the entry or memory
+limit is exceeded, and may optionally be persisted to a cache directory so
+they survive a restart.
+"""
+
+import hashlib
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .buffers import ArrayLike
+from .profiling import Profiler
+from .registry import get_algorithm_visualizer
+
+# Limites padrão do cache em memória
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Diretório opcional para persistir o cache entre execuções
+CACHE_DIR_ENV = "RICHSORT_CACHE_DIR"
+
+# Versão do formato das saídas em disco: incrementar quando a saída dos
+# renderers mudar, para que entradas gravadas por versões antigas sejam ignoradas
+CACHE_FORMAT = 2
+
+
+def input_fingerprint(input_array: ArrayLike) -> str:
+    """Return a stable fingerprint of an input array.
+
+    Buffers (``array.array``, NumPy, ``memoryview``) are hashed straight from
+    their bytes and element format, without converting them to a list.
+    """
+    if isinstance(input_array, list):
+        return hashlib.blake2b(repr(input_array).encode(), digest_size=16).hexdigest()
+    try:
+        view = memoryview(input_array)
+    except TypeError:
+        data = repr(list(input_array)).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    digest = hashlib.blake2b(view.format.encode() + b":", digest_size=16)
+    digest.update(view if view.c_contiguous else view.tobytes())
+    return digest.hexdigest()
+
+
+def _safe_name(algorithm_id: str) -> str:
+    """File-name-safe form of an algorithm id (plugin ids may contain anything).
+
+    Characters outside ``[A-Za-z0-9_.-]`` become ``_`` and a short hash of the
+    original id is appended, so distinct ids never share a file.
+    """
+    readable = re.sub(r"[^A-Za-z0-9_.-]", "_", algorithm_id)[:40]
+    digest = hashlib.blake2b(algorithm_id.encode(), digest_size=4).hexdigest()
+    return f"{readable}.{digest}"
+
+
+class TraceCache:
+    """LRU cache of rendered traces keyed by algorithm id and input fingerprint."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_dir: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        algorithm_id: str, input_array: List[int], **options
+    ) -> Tuple[str, str]:
+        """Build the cache key; renderer options are part of the fingerprint."""
+        fingerprint = input_fingerprint(input_array)
+        if options:
+            extra = repr(sorted(options.items())).encode()
+            fingerprint = hashlib.blake2b(
+                fingerprint.encode() + extra, digest_size=16
+            ).hexdigest()
+        return algorithm_id, fingerprint
+
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        """Return the cached trace for ``key`` (memory first, then disk)."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        output = self._load(key)
+        if output is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+        self._store(key, output)
+        return output
+
+    def put(self, key: Tuple[str, str], output: str) -> None:
+        """Store a trace, persisting it when a cache directory is configured."""
+        self._store(key, output)
+        self._save(key, output)
+
+    def get_or_compute(
+        self,
+        algorithm_id: str,
+        input_array: List[int],
+        profiler: Optional[Profiler] = None,
+        **options,
+    ) -> str:
+        """Return the cached visualization, running the algorithm on a miss.
+
+        ``profiler`` times the run on a miss and is not part of the key.
+        """
+        key = self.make_key(algorithm_id, input_array, **options)
+        output = self.get(key)
+        if output is None:
+            visualizer = get_algorithm_visualizer(algorithm_id)
+            if profiler is not None:
+                visualizer.enable_profiling(profiler)
+            output = visualizer.sort_complete(input_array, **options)
+            self.put(key, output)
+        return output
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk cache is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _store(self, key: Tuple[str, str], output: str) -> None:
+        size = sys.getsizeof(output)
+        if size > self.max_bytes:
+            # Um trace maior que o limite inteiro nunca fica em memória
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._sizes[key]
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self.total_bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                old_key, _ = self._entries.popitem(last=False)
+                self.total_bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def _path(self, key: Tuple[str, str]) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        algorithm_id, fingerprint = key
+        return os.path.join(
+            self.cache_dir,
+            f"v{CACHE_FORMAT}-{_safe_name(algorithm_id)}-{fingerprint}.txt",
+        )
+
+    def _load(self, key: Tuple[str, str]) -> Optional[str]:
+        path = self._path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _save(self, key: Tuple[str, str], output: str) -> None:
+        path = self._path(key)
+        if not path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(output)
+            os.replace(temp_path, path)
+        except OSError:
+            # O cache em disco é opcional; falhas de escrita não interrompem o uso
+            pass
+
+
+# Cache compartilhado pelas interfaces
+trace_cache = TraceCache(cache_dir=os.environ.get(CACHE_DIR_ENV) or None)
+
+
+def sort_complete_cached(
+    algorithm_id: str,
+    input_array: List[int],
+    profiler: Optional[Profiler] = None,
+    **options,
+) -> str:
+    """Cached equivalent of ``get_algorithm_visualizer(...).sort_complete(...)``."""
+    return trace_cache.get_or_compute(algorithm_id, input_array, profiler, **options)
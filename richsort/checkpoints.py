@@ -0,0 +1,397 @@
+"""
+Checkpointed trace module for RichSort.
+
+Random access to any step of a sort run without regenerating everything
+before it. The event log is kept in a compact ``array`` and a snapshot of the
+array state (plus the comparison and swap counters) is taken every
+``interval`` events, so rebuilding the state at step N only replays the
+events after the nearest snapshot: O(interval + n) instead of O(N). The steps
+where each pass starts are indexed too, for jump-to-pass.
+
+Renderers are positioned the same way: the narration state of a renderer
+is kept at every checkpoint it crosses while seeking, so a later seek in the
+same pass restores from the nearest one and fast-forwards at most
+``interval`` events, without formatting them.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .buffers import ArrayLike, copy_buffer
+from .events import (
+    COMPARE,
+    FROM_AUX,
+    KEY,
+    LOAD,
+    MOVE,
+    PASS_START,
+    STORE,
+    SWAP,
+    TO_AUX,
+    Event,
+)
+from .renderers import LEVEL_FULL
+
+# Intervalo mínimo entre snapshots; arrays maiores usam o próprio tamanho,
+# assim a memória dos snapshots fica proporcional à do log de eventos
+CHECKPOINT_INTERVAL = 1024
+
+
+def _counts(totals: Tuple[int, ...]) -> Dict[str, int]:
+    comparisons, key_compares, swaps, moves, loads, stores = totals
+    return {
+        "comparisons": comparisons,
+        "swaps": swaps,
+        "moves": moves,
+        "reads": 2 * comparisons - key_compares + 2 * swaps + moves + loads,
+        "writes": 2 * swaps + moves + stores,
+    }
+
+
+def advance(
+    state: ArrayLike,
+    aux: Optional[ArrayLike],
+    key: Any,
+    totals: Tuple[int, ...],
+    events: Iterable[Event],
+) -> Tuple[Optional[ArrayLike], Any, Tuple[int, ...]]:
+    """
+    Apply ``events`` to a snapshot of a run, in place.
+
+    Args:
+        state: Array state, updated in place
+        aux: Auxiliary buffer (None until the run uses it), updated in place
+        key: Key register
+        totals: Comparisons, key comparisons, swaps, moves, LOADs and STOREs
+
+    Returns:
+        ``(aux, key, totals)`` after the events (``aux`` is created on the
+        first TO_AUX)
+    """
+    comparisons, key_compares, swaps, moves, loads, stores = totals
+    for opcode, i, j in events:
+        if opcode == COMPARE:
+            comparisons += 1
+            if j == KEY:
+                key_compares += 1
+        elif opcode == SWAP:
+            state[i], state[j] = state[j], state[i]
+            swaps += 1
+        elif opcode == MOVE:
+            state[j] = state[i]
+            moves += 1
+        elif opcode == LOAD:
+            key = state[i]
+            loads += 1
+        elif opcode == STORE:
+            state[i] = key
+            stores += 1
+        elif opcode == TO_AUX:
+            if aux is None:
+                aux = copy_buffer(state)
+            aux[j] = state[i]
+            moves += 1
+        elif opcode == FROM_AUX:
+            state[j] = aux[i]
+            moves += 1
+    return aux, key, (comparisons, key_compares, swaps, moves, loads, stores)
+
+
+class LineIndex:
+    """Line numbers of a rendered trace at the checkpoints and pass starts.
+
+    Filled by ``CheckpointedTrace.render_indexed``; lets a view that shows
+    the whole narration scroll to the line of any step. When the renderer
+    has an output budget, ``summary_step``/``summary_line`` mark where the
+    detailed narration gave way to the per-pass summaries.
+    """
+
+    def __init__(self):
+        self.checkpoint_lines = array("Q")
+        self.pass_lines = array("Q")
+        self.end_line: Optional[int] = None
+        self.summary_step: Optional[int] = None
+        self.summary_line: Optional[int] = None
+
+
+class CheckpointedTrace:
+    """Event log of a sort run with periodic snapshots of the array state.
+
+    A snapshot holds a copy of the array, the operation totals, the key
+    register (for the LOAD/STORE events of the shift-based variants) and, once
+    the run has used it, a copy of the auxiliary buffer (Merge Sort).
+    """
+
+    def __init__(self, input_array: ArrayLike, interval: Optional[int] = None):
+        self.input_array = copy_buffer(input_array)
+        if interval is None:
+            interval = max(CHECKPOINT_INTERVAL, len(self.input_array))
+        self.interval = max(1, interval)
+
+        self._events = array("i")
+        self._pass_steps = array("Q")
+        self._snapshots: List[
+            Tuple[ArrayLike, Tuple[int, ...], Any, Optional[ArrayLike]]
+        ] = []
+
+        # Estado corrente, mantido enquanto os eventos são adicionados
+        self._state = copy_buffer(input_array)
+        self._key = None
+        # Buffer auxiliar, criado no primeiro TO_AUX
+        self._aux: Optional[ArrayLike] = None
+        # comparações, comparações com a chave, trocas, movimentos, LOADs, STOREs
+        self._totals = (0, 0, 0, 0, 0, 0)
+        # Estado da narração nos checkpoints, por renderer e opções:
+        # {(classe, opções): {checkpoint: estado}}
+        self._narrations: Dict[Any, Dict[int, Dict[str, Any]]] = {}
+
+    @classmethod
+    def from_events(
+        cls,
+        input_array: ArrayLike,
+        events: Iterable[Event],
+        interval: Optional[int] = None,
+    ) -> "CheckpointedTrace":
+        """Build a trace from a complete event stream."""
+        trace = cls(input_array, interval)
+        trace.extend(events)
+        return trace
+
+    @classmethod
+    def from_index(
+        cls,
+        input_array: ArrayLike,
+        interval: int,
+        events: Sequence[int],
+        pass_steps: Sequence[int],
+        snapshots: Sequence[
+            Tuple[ArrayLike, Tuple[int, ...], Any, Optional[ArrayLike]]
+        ],
+        final: Tuple[ArrayLike, Tuple[int, ...], Any],
+    ) -> "CheckpointedTrace":
+        """
+        Read-only trace over an existing event log and its snapshots.
+
+        Used to seek in a recorded trace file without loading it: ``events``
+        (int32 triples) and ``pass_steps`` may be views of the mapped file and
+        ``snapshots`` a sequence that reads each snapshot on access. ``final``
+        is the ``(state, totals, key)`` after the last event. Such a trace
+        cannot be extended.
+        """
+        trace = cls(input_array, interval)
+        trace._events = events
+        trace._pass_steps = pass_steps
+        trace._snapshots = snapshots
+        trace._state, trace._totals, trace._key = final
+        return trace
+
+    def append(self, event: Event) -> None:
+        """Add the next event of the run."""
+        self.extend((event,))
+
+    def extend(self, events: Iterable[Event]) -> None:
+        """Add several events."""
+        state = self._state
+        key = self._key
+        aux = self._aux
+        log = self._events
+        pass_steps = self._pass_steps
+        snapshots = self._snapshots
+        interval = self.interval
+        comparisons, key_compares, swaps, moves, loads, stores = self._totals
+        step = len(self)
+
+        for event in events:
+            if step % interval == 0:
+                totals = (comparisons, key_compares, swaps, moves, loads, stores)
+                aux_copy = None if aux is None else copy_buffer(aux)
+                snapshots.append((copy_buffer(state), totals, key, aux_copy))
+            opcode, i, j = event
+            if opcode == COMPARE:
+                comparisons += 1
+                if j == KEY:
+                    key_compares += 1
+            elif opcode == SWAP:
+                state[i], state[j] = state[j], state[i]
+                swaps += 1
+            elif opcode == PASS_START:
+                pass_steps.append(step)
+            elif opcode == MOVE:
+                state[j] = state[i]
+                moves += 1
+            elif opcode == LOAD:
+                key = state[i]
+                loads += 1
+            elif opcode == STORE:
+                state[i] = key
+                stores += 1
+            elif opcode == TO_AUX:
+                if aux is None:
+                    aux = copy_buffer(state)
+                aux[j] = state[i]
+                moves += 1
+            elif opcode == FROM_AUX:
+                state[j] = aux[i]
+                moves += 1
+            log.extend(event)
+            step += 1
+
+        self._key = key
+        self._aux = aux
+        self._totals = (comparisons, key_compares, swaps, moves, loads, stores)
+
+    def __len__(self) -> int:
+        return len(self._events) // 3
+
+    def __getitem__(self, step: int) -> Event:
+        if step < 0:
+            step += len(self)
+        if not 0 <= step < len(self):
+            raise IndexError("event index out of range")
+        base = step * 3
+        return (self._events[base], self._events[base + 1], self._events[base + 2])
+
+    def iter_events(self, start: int = 0, stop: int = None) -> Iterator[Event]:
+        """Yield the events in ``[start, stop)``."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        events = self._events
+        for base in range(start * 3, stop * 3, 3):
+            yield (events[base], events[base + 1], events[base + 2])
+
+    @property
+    def pass_count(self) -> int:
+        """Number of passes started so far."""
+        return len(self._pass_steps)
+
+    def pass_step(self, pass_number: int) -> int:
+        """Return the step where the ``pass_number``-th pass (0-based) starts."""
+        return self._pass_steps[pass_number]
+
+    def pass_at(self, step: int) -> int:
+        """Return the 0-based number of the pass running at ``step`` (-1 before the first)."""
+        return bisect_right(self._pass_steps, step) - 1
+
+    def clamp(self, step: int) -> int:
+        """Limit ``step`` to the valid range ``[0, len(self)]``."""
+        return max(0, min(step, len(self)))
+
+    def state_at(self, step: int) -> Tuple[ArrayLike, Dict[str, int], Any]:
+        """
+        Rebuild the run at ``step`` from the nearest snapshot.
+
+        Returns:
+            ``(array, counts, key)`` after the first ``step`` events, where
+            ``counts`` has the keys of ``events.count_accesses``
+        """
+        step = self.clamp(step)
+        if step == len(self):
+            return copy_buffer(self._state), _counts(self._totals), self._key
+
+        checkpoint = step // self.interval
+        snapshot, totals, key, aux = self._snapshots[checkpoint]
+        state = copy_buffer(snapshot)
+        if aux is not None:
+            aux = copy_buffer(aux)
+        _, key, totals = advance(
+            state, aux, key, totals, self.iter_events(checkpoint * self.interval, step)
+        )
+        return state, _counts(totals), key
+
+    def array_at(self, step: int) -> ArrayLike:
+        """Return the array state after the first ``step`` events."""
+        return self.state_at(step)[0]
+
+    def renderer_at(self, step: int, renderer_class, **options):
+        """
+        Return a renderer positioned at ``step``, ready to ``feed`` the next event.
+
+        The renderer is restored from the nearest checkpoint of the current
+        pass whose narration state is known (or else at the pass start) and
+        fast-forwarded to ``step`` without formatting, so it narrates exactly
+        as if it had seen the whole run. The narration state at the
+        checkpoints crossed on the way is kept for the next seeks.
+        """
+        step = self.clamp(step)
+        renderer = renderer_class(self.input_array, **options)
+        pass_number = self.pass_at(step)
+        if pass_number < 0:
+            renderer.fast_forward(self.iter_events(0, step))
+            return renderer
+
+        pass_start = self._pass_steps[pass_number]
+        narrations = self._narrations.setdefault(
+            (renderer_class, tuple(sorted(options.items()))), {}
+        )
+        # Checkpoints dentro do passo: antes dele, a narração é de outro passo
+        first = -(-pass_start // self.interval)
+        checkpoint = step // self.interval
+        while checkpoint >= first and checkpoint not in narrations:
+            checkpoint -= 1
+
+        if checkpoint >= first:
+            start = checkpoint * self.interval
+            state, totals, key, aux = self._snapshots[checkpoint]
+            renderer.restore(state, _counts(totals), key, aux)
+            renderer.load_narration(narrations[checkpoint])
+        else:
+            start = pass_start
+            renderer.restore(*self.state_at(start))
+
+        for checkpoint in range(start // self.interval + 1, step // self.interval + 1):
+            renderer.fast_forward(self.iter_events(start, checkpoint * self.interval))
+            start = checkpoint * self.interval
+            if start < len(self):
+                # Só onde há snapshot: depois do último evento não há
+                narrations[checkpoint] = renderer.narration_state()
+        renderer.fast_forward(self.iter_events(start, step))
+        return renderer
+
+    def render_indexed(
+        self, renderer, events: Iterable[Event], index: LineIndex
+    ) -> Iterator:
+        """
+        Record ``events`` while rendering them, indexing the output lines.
+
+        Yields the same lines as ``renderer.render(events)``.
+        """
+        lines = 0
+        for line in renderer.header():
+            lines += 1
+            yield line
+
+        for event in events:
+            if len(self) % self.interval == 0:
+                index.checkpoint_lines.append(lines)
+            if event[0] == PASS_START:
+                index.pass_lines.append(lines)
+            self.append(event)
+
+            output = renderer.feed(event)
+            if index.summary_step is None and renderer.level != LEVEL_FULL:
+                index.summary_step = len(self) - 1
+                index.summary_line = lines
+            lines += len(output)
+            yield from output
+
+        index.end_line = lines
+        yield from renderer.footer()
+
+    def line_of_step(
+        self, step: int, index: LineIndex, renderer_class, **options
+    ) -> int:
+        """Return the first output line of ``step`` in a trace indexed by ``index``."""
+        step = self.clamp(step)
+        if step == len(self):
+            return index.end_line
+        if index.summary_step is not None and step >= index.summary_step:
+            # Sem narração detalhada: a linha do resumo do passo
+            pass_number = self.pass_at(step)
+            line = index.pass_lines[pass_number] if pass_number >= 0 else 0
+            return max(line, index.summary_line)
+
+        checkpoint = step // self.interval
+        start = checkpoint * self.interval
+        renderer = self.renderer_at(start, renderer_class, **options)
+        line = index.checkpoint_lines[checkpoint]
+        return line + renderer.fast_forward(self.iter_events(start, step))
@@ -0,0 +1,167 @@
+"""
+Command line dispatcher for RichSort.
+
+``richsort <command> ...`` runs one of the tools in ``COMMANDS``. A command's
+module is only imported when that command runs, so ``richsort --help``,
+``richsort list`` and ``richsort stats`` never import Rich or Textual, and
+``richsort list`` does not even import the algorithms. Without a command,
+``richsort`` opens the Rich interface, as before.
+"""
+
+import argparse
+import os
+import sys
+from importlib import import_module
+from typing import List
+
+# Comando -> ("módulo:função" que recebe argv, descrição)
+COMMANDS = {
+    "rich": ("richsort.sort_rich:main", "interface interativa com Rich (padrão)"),
+    "textual": ("richsort.sort_textual:main", "interface TUI com Textual"),
+    "bench": ("richsort.bench:main", "benchmark headless dos algoritmos"),
+    "batch": ("richsort.batch:main", "todos os algoritmos × casos, em paralelo"),
+    "trace": ("richsort.tracefile:main", "grava e reproduz traces binários"),
+    "complexity": (
+        "richsort.complexity:main",
+        "ajusta curvas de crescimento em tamanhos crescentes",
+    ),
+    "stats": ("richsort.cli:stats_main", "contadores de uma execução, sem narração"),
+    "list": ("richsort.cli:list_main", "lista os algoritmos registrados"),
+    "startup": ("richsort.startup:main", "mede o tempo de import dos comandos"),
+}
+
+DEFAULT_COMMAND = "rich"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    commands = "\n".join(
+        f"  {name:<12}{description}" for name, (_, description) in COMMANDS.items()
+    )
+    parser = argparse.ArgumentParser(
+        prog="richsort",
+        description="Visualizador de algoritmos de ordenação.",
+        epilog=(
+            f"comandos:\n{commands}\n\n"
+            "Sem comando, abre a interface Rich. "
+            "Use 'richsort <comando> --help' para as opções de cada comando."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("command", choices=list(COMMANDS), metavar="comando")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: List[str] = None):
+    """Entry point of the ``richsort`` command."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        # "richsort" e "richsort --profile" continuam abrindo a interface Rich
+        argv = [DEFAULT_COMMAND, *argv]
+
+    args = build_parser().parse_args(argv)
+    module_name, _, function = COMMANDS[args.command][0].partition(":")
+    command_main = getattr(import_module(module_name), function)
+    try:
+        return command_main(args.args)
+    except BrokenPipeError:
+        # A saída foi fechada antes do fim (ex.: "richsort list | head"): o
+        # resto vai para o devnull, para que o flush na saída não falhe de novo
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
+
+def _input_parser(prog: str, description: str) -> argparse.ArgumentParser:
+    """Parser with the algorithm and the input (values or a distribution)."""
+    from .test_cases import DISTRIBUTIONS, GENERATED_SIZE
+
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument("algorithm", help="id do algoritmo (ex.: bubble)")
+    parser.add_argument(
+        "values", nargs="*", type=int, help="elementos do array de entrada"
+    )
+    parser.add_argument(
+        "-d",
+        "--distribution",
+        choices=list(DISTRIBUTIONS),
+        help="gera a entrada com esta distribuição em vez de usar os valores",
+    )
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=GENERATED_SIZE,
+        help="tamanho da entrada gerada",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="semente da entrada gerada")
+    return parser
+
+
+def stats_main(argv: List[str] = None):
+    """Print the counters of a run as JSON, without rendering anything."""
+    import json
+
+    from .registry import get_algorithm_visualizer
+    from .test_cases import generate_array
+
+    parser = _input_parser(
+        "richsort stats", "Contadores de uma execução, sem narração."
+    )
+    parser.add_argument(
+        "--accesses",
+        action="store_true",
+        help="executa os eventos para contar também deslocamentos, leituras e escritas",
+    )
+    args = parser.parse_args(argv)
+
+    values = args.values
+    if args.distribution is not None:
+        if values:
+            parser.error("informe os valores ou --distribution, não ambos")
+        values = generate_array(args.distribution, args.size, args.seed)
+    elif not values:
+        parser.error("informe os valores do array ou --distribution")
+
+    try:
+        visualizer = get_algorithm_visualizer(args.algorithm)
+    except (ValueError, NotImplementedError) as e:
+        parser.error(str(e))
+
+    result = {"algorithm": args.algorithm, "size": len(values)}
+    if args.accesses:
+        result.update(visualizer.operation_counts(values))
+    else:
+        # Fórmulas exatas quando existem; senão, o motor de eventos
+        visualizer.sort_stats(values)
+        result["comparisons"] = visualizer.comparisons
+        result["swaps"] = visualizer.swaps
+    json.dump(result, sys.stdout)
+    sys.stdout.write("\n")
+
+
+def list_main(argv: List[str] = None):
+    """List the registered algorithms without importing any of them."""
+    import json
+
+    from .registry import get_available_algorithms
+
+    parser = argparse.ArgumentParser(
+        prog="richsort list", description="Lista os algoritmos registrados."
+    )
+    parser.add_argument("-f", "--format", choices=["text", "json"], default="text")
+    args = parser.parse_args(argv)
+
+    algorithms = get_available_algorithms()
+    if args.format == "json":
+        json.dump(algorithms, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+    for algorithm in algorithms:
+        status = "" if algorithm["implemented"] else " (em desenvolvimento)"
+        print(f"{algorithm['id']:<18} {algorithm['name']}{status}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+Complexity analysis module for RichSort.
+
+Runs an algorithm over a geometric range of input sizes and fits what it
+measured (comparisons, swaps and sort time) to growth curves, instead of
+assuming one:
+
+- a power law ``a · n^b``, by least squares on the log-log points, which gives
+  the empirical exponent ``b`` and constant ``a``;
+- each candidate class of ``CURVES`` (n, n log n, n², ...) with its best
+  constant; the class whose shape leaves the smallest residual is reported.
+
+The comparisons are also set against the information-theoretic lower bound
+``log2(n!)``: no comparison sort can do fewer in the worst case.
+"""
+
+import argparse
+import json
+import sys
+import time
+from math import exp, log, log2, sqrt
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .registry import get_algorithm_visualizer
+from .stats import log2_factorial
+from .test_cases import DISTRIBUTIONS, generate_array
+
+# Curvas candidatas: nome -> f(n)
+CURVES: Dict[str, Callable[[int], float]] = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * log2(n),
+    "n²": lambda n: n**2,
+    "n³": lambda n: n**3,
+}
+
+# Métricas ajustadas, com o nome mostrado na tabela
+METRICS = {
+    "comparisons": "Comparações",
+    "swaps": "Trocas",
+    "seconds": "Tempo",
+    "lower_bound": "log₂(n!)",
+}
+
+
+def geometric_sizes(min_size: int, max_size: int, factor: float = 2) -> List[int]:
+    """Sizes from ``min_size`` to ``max_size``, each ``factor`` times the previous."""
+    if min_size < 2 or max_size < min_size or factor <= 1:
+        raise ValueError(
+            f"Invalid size range: {min_size}..{max_size} (factor {factor})"
+        )
+    sizes = []
+    size = float(min_size)
+    while round(size) <= max_size:
+        if not sizes or round(size) != sizes[-1]:
+            sizes.append(round(size))
+        size *= factor
+    return sizes
+
+
+def _log_points(sizes: List[int], values: List[float]) -> List[Tuple[float, float]]:
+    # Só pontos positivos entram no ajuste em escala logarítmica
+    return [(log(n), log(y)) for n, y in zip(sizes, values) if n > 1 and y > 0]
+
+
+def fit_power(sizes: List[int], values: List[float]) -> Optional[Tuple[float, float]]:
+    """
+    Fit ``values ≈ a · n^b`` by least squares on the log-log points.
+
+    Returns:
+        ``(b, a)``, or None with fewer than two positive values
+    """
+    points = _log_points(sizes, values)
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    return exponent, exp(mean_y - exponent * mean_x)
+
+
+def fit_curve(
+    sizes: List[int], values: List[float], curve: Callable[[int], float]
+) -> Optional[Tuple[float, float]]:
+    """
+    Fit ``values ≈ c · curve(n)``.
+
+    The constant is the geometric mean of ``value / curve(n)``, and the error
+    is the RMS of the log residuals, so curves are compared by shape whatever
+    the scale of the metric.
+
+    Returns:
+        ``(c, error)``, or None without positive values
+    """
+    residuals = [
+        log(y) - log(curve(n)) for n, y in zip(sizes, values) if n > 1 and y > 0
+    ]
+    if not residuals:
+        return None
+    offset = sum(residuals) / len(residuals)
+    error = sqrt(sum((r - offset) ** 2 for r in residuals) / len(residuals))
+    return exp(offset), error
+
+
+def fit_metric(sizes: List[int], values: List[float]) -> Dict[str, Any]:
+    """Power law and best candidate curve of one metric (see ``fit_power``/``fit_curve``)."""
+    fit = {
+        "exponent": None,
+        "constant": None,
+        "curve": None,
+        "curve_constant": None,
+        "error": None,
+    }
+    power = fit_power(sizes, values)
+    if power is not None:
+        fit["exponent"], fit["constant"] = power
+
+    for name, curve in CURVES.items():
+        candidate = fit_curve(sizes, values, curve)
+        if candidate is None:
+            continue
+        constant, error = candidate
+        if fit["error"] is None or error < fit["error"]:
+            fit.update(curve=name, curve_constant=constant, error=error)
+    return fit
+
+
+def measure(
+    algorithm_id: str,
+    sizes: List[int],
+    distribution: str = "random",
+    repeats: int = 3,
+    seed: int = 0,
+    max_seconds: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Sort one input per size and repeat, without rendering.
+
+    Counters are averaged over the repeats (repeat r uses seed ``seed + r``)
+    and the time is the fastest repeat. Once one size takes longer than
+    ``max_seconds``, the larger sizes are skipped.
+
+    Raises:
+        ValueError: If the algorithm or the distribution is unknown
+        NotImplementedError: If the algorithm is only a placeholder
+    """
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    rows = []
+    for size in sizes:
+        comparisons = 0
+        swaps = 0
+        best = None
+        for repeat in range(repeats):
+            input_array = generate_array(distribution, size, seed + repeat)
+            start = time.perf_counter()
+            visualizer.sort(input_array, in_place=True)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            comparisons += visualizer.comparisons
+            swaps += visualizer.swaps
+
+        rows.append(
+            {
+                "size": size,
+                "comparisons": comparisons / repeats,
+                "swaps": swaps / repeats,
+                "seconds": best,
+                "lower_bound": log2_factorial(size),
+            }
+        )
+        if max_seconds is not None and best > max_seconds:
+            break
+    return rows
+
+
+def analyze(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Fit every metric of ``METRICS`` over the rows of ``measure``."""
+    sizes = [row["size"] for row in rows]
+    return {
+        metric: fit_metric(sizes, [row[metric] for row in rows]) for metric in METRICS
+    }
+
+
+def _format_number(value: Optional[float], digits: int = 3) -> str:
+    if value is None:
+        return "-"
+    if value == 0 or 1e-3 <= abs(value) < 1e6:
+        return f"{value:.{digits}g}"
+    return f"{value:.{digits}e}"
+
+
+def _write_tables(
+    algorithm_id: str,
+    distribution: str,
+    rows: List[Dict[str, Any]],
+    fits: Dict[str, Dict[str, Any]],
+    output,
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console(file=output)
+
+    table = Table(title=f"📈 {algorithm_id} - medições ({distribution})")
+    table.add_column("n", justify="right")
+    table.add_column("Comparações", justify="right")
+    table.add_column("Trocas", justify="right")
+    table.add_column("Tempo (ms)", justify="right")
+    table.add_column("log₂(n!)", justify="right")
+    table.add_column("Comparações / log₂(n!)", justify="right")
+    for row in rows:
+        table.add_row(
+            str(row["size"]),
+            f"{row['comparisons']:.0f}",
+            f"{row['swaps']:.0f}",
+            f"{row['seconds'] * 1000:.2f}",
+            f"{row['lower_bound']:.0f}",
+            f"{row['comparisons'] / row['lower_bound']:.2f}×",
+        )
+    console.print(table)
+
+    table = Table(title="📐 Crescimento ajustado")
+    table.add_column("Métrica")
+    table.add_column("Lei de potência a·nᵇ")
+    table.add_column("Expoente b", justify="right")
+    table.add_column("Melhor curva")
+    table.add_column("Erro (log)", justify="right")
+    for metric, label in METRICS.items():
+        fit = fits[metric]
+        if fit["exponent"] is None:
+            power = "-"
+        else:
+            power = f"{_format_number(fit['constant'])} · n^{fit['exponent']:.2f}"
+        curve = "-"
+        if fit["curve"] is not None:
+            curve = f"{_format_number(fit['curve_constant'])} · {fit['curve']}"
+        table.add_row(
+            label,
+            power,
+            _format_number(fit["exponent"]),
+            curve,
+            _format_number(fit["error"], 2),
+        )
+    console.print(table)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="richsort complexity",
+        description=(
+            "Mede um algoritmo em tamanhos crescentes e ajusta curvas de "
+            "crescimento às comparações, trocas e ao tempo."
+        ),
+    )
+    parser.add_argument("algorithm", help="id do algoritmo (ex.: bubble)")
+    parser.add_argument(
+        "-d",
+        "--distribution",
+        choices=list(DISTRIBUTIONS),
+        default="random",
+        help="distribuição das entradas (padrão: random)",
+    )
+    parser.add_argument("--min-size", type=int, default=64)
+    parser.add_argument("--max-size", type=int, default=4096)
+    parser.add_argument(
+        "--factor", type=float, default=2, help="razão entre tamanhos consecutivos"
+    )
+    parser.add_argument("-r", "--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        help="não mede tamanhos maiores depois de uma execução mais lenta que isso",
+    )
+    parser.add_argument("-f", "--format", choices=["table", "json"], default="table")
+    return parser
+
+
+def main(argv: List[str] = None):
+    """Entry point for the complexity analysis."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = geometric_sizes(args.min_size, args.max_size, args.factor)
+        rows = measure(
+            args.algorithm,
+            sizes,
+            args.distribution,
+            max(1, args.repeats),
+            args.seed,
+            args.max_seconds,
+        )
+    except (ValueError, NotImplementedError) as e:
+        parser.error(str(e))
+    fits = analyze(rows)
+
+    if args.format == "json":
+        result = {
+            "algorithm": args.algorithm,
+            "distribution": args.distribution,
+            "measurements": rows,
+            "fits": fits,
+        }
+        json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        _write_tables(args.algorithm, args.distribution, rows, fits, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
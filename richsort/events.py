@@ -0,0 +1,125 @@
+"""
+Step events module for RichSort.
+
+Sorting algorithms report their progress as a stream of compact step events
+instead of building output directly. Each event is a ``(opcode, i, j)`` tuple
+of integers, so the same stream can be counted, rendered or stored without
+caring about which algorithm produced it.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+# Event opcodes
+# (PASS_START, pass_index, bound) - bound is the end of the range the pass
+# scans when the algorithm reports it (0 otherwise)
+PASS_START = 0
+COMPARE = 1  # (COMPARE, i, j) - compares the elements at positions i and j
+SWAP = 2  # (SWAP, i, j) - exchanges the elements at positions i and j
+PASS_END = 3  # (PASS_END, pass_index, 0)
+MOVE = 4  # (MOVE, src, dst) - copies the element at src over position dst
+LOAD = 5  # (LOAD, i, 0) - copies the element at i into the key register
+STORE = 6  # (STORE, i, 0) - writes the key register into position i
+# (TO_AUX, src, dst) - copies the element at src into position dst of the
+# auxiliary buffer (same size as the array; a pass only reads auxiliary
+# positions it has written itself, so the buffer is never part of the state
+# carried from one pass to the next)
+TO_AUX = 7
+FROM_AUX = 8  # (FROM_AUX, src, dst) - copies auxiliary position src over dst
+# Annotations, they change nothing: (RANGE, lo, hi) - the pass works on the
+# positions lo..hi (a Merge Sort pass reports its two runs); (PIVOT, p, 0) -
+# the element at p is the pivot of the pass
+RANGE = 9
+PIVOT = 10
+
+# Used as ``j`` of a COMPARE event: the key register instead of a position
+KEY = -1
+
+OPCODE_NAMES = {
+    PASS_START: "pass_start",
+    COMPARE: "compare",
+    SWAP: "swap",
+    PASS_END: "pass_end",
+    MOVE: "move",
+    LOAD: "load",
+    STORE: "store",
+    TO_AUX: "to_aux",
+    FROM_AUX: "from_aux",
+    RANGE: "range",
+    PIVOT: "pivot",
+}
+
+Event = Tuple[int, int, int]
+
+
+def apply_events(array: List[int], events: Iterable[Event]) -> List[int]:
+    """Replay the writes (swaps, moves, stores) of an event stream on ``array``."""
+    key = None
+    aux = {}
+    for opcode, i, j in events:
+        if opcode == SWAP:
+            array[i], array[j] = array[j], array[i]
+        elif opcode == MOVE:
+            array[j] = array[i]
+        elif opcode == LOAD:
+            key = array[i]
+        elif opcode == STORE:
+            array[i] = key
+        elif opcode == TO_AUX:
+            aux[j] = array[i]
+        elif opcode == FROM_AUX:
+            array[j] = aux[i]
+    return array
+
+
+def count_events(events: Iterable[Event]) -> Tuple[int, int]:
+    """Return the ``(comparisons, swaps)`` counters of an event stream."""
+    comparisons = 0
+    swaps = 0
+    for opcode, _, _ in events:
+        if opcode == COMPARE:
+            comparisons += 1
+        elif opcode == SWAP:
+            swaps += 1
+    return comparisons, swaps
+
+
+def count_accesses(events: Iterable[Event]) -> Dict[str, int]:
+    """
+    Count the operations and array accesses of an event stream.
+
+    A comparison reads two elements (one when compared with the key), a swap
+    reads and writes two, a move reads and writes one, LOAD reads one and
+    STORE writes one. Copies to and from the auxiliary buffer count as moves.
+
+    Returns:
+        ``comparisons``, ``swaps``, ``moves``, ``reads`` and ``writes``
+    """
+    counts = new_counts()
+    for event in events:
+        add_event(counts, event)
+    return counts
+
+
+def new_counts() -> Dict[str, int]:
+    """Return zeroed operation counters (see ``count_accesses``)."""
+    return {"comparisons": 0, "swaps": 0, "moves": 0, "reads": 0, "writes": 0}
+
+
+def add_event(counts: Dict[str, int], event: Event) -> None:
+    """Add one event to counters created by ``new_counts``."""
+    opcode, _, j = event
+    if opcode == COMPARE:
+        counts["comparisons"] += 1
+        counts["reads"] += 1 if j == KEY else 2
+    elif opcode == SWAP:
+        counts["swaps"] += 1
+        counts["reads"] += 2
+        counts["writes"] += 2
+    elif opcode == MOVE or opcode == TO_AUX or opcode == FROM_AUX:
+        counts["moves"] += 1
+        counts["reads"] += 1
+        counts["writes"] += 1
+    elif opcode == LOAD:
+        counts["reads"] += 1
+    elif opcode == STORE:
+        counts["writes"] += 1
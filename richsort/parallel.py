@@ -0,0 +1,122 @@
+"""
+Parallel sorting module for RichSort.
+
+Runs ``ParallelMergeSortVisualizer`` across processes: the array is copied
+once into a ``multiprocessing.shared_memory`` block, each worker of a process
+pool attaches to it by name and sorts its own run through a ``memoryview`` of
+that memory (the event engines work on any writable buffer), and the k-way
+merge of the runs happens in the calling process. Only the block name and
+the run bounds are pickled, never the values.
+
+Values are shared in their own binary format: ``array.array``, NumPy arrays
+and ``memoryview`` keep theirs, and lists of integers use 64-bit integers
+(``shared_format`` returns None for anything else, which runs serially).
+"""
+
+import array
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+from .algorithms import ParallelMergeSortVisualizer, chunk_bounds
+from .buffers import ArrayLike, copy_buffer
+
+# Formato usado para listas: inteiros de 64 bits
+LIST_FORMAT = "q"
+_LIST_MIN = -(2**63)
+_LIST_MAX = 2**63 - 1
+
+# Formatos nativos aceitos por ``memoryview.cast``
+FORMATS = frozenset("bBhHiIlLqQfd")
+
+
+def shared_format(values: ArrayLike) -> Optional[str]:
+    """``struct`` format to share ``values`` in, or None if they cannot be shared."""
+    if isinstance(values, list):
+        if all(type(value) is int for value in values) and (
+            not values or _LIST_MIN <= min(values) and max(values) <= _LIST_MAX
+        ):
+            return LIST_FORMAT
+        return None
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    with view:
+        # Só buffers de uma dimensão, contíguos, de números em formato nativo
+        if view.ndim != 1 or not view.c_contiguous or view.format not in FORMATS:
+            return None
+        return view.format
+
+
+def _sort_chunk(
+    visualizer_class: type, name: str, fmt: str, length: int, lo: int, hi: int
+) -> Tuple[int, int]:
+    """Sort ``lo..hi`` of the shared block ``name`` (runs in a worker process)."""
+    shared = SharedMemory(name=name)
+    try:
+        block = shared.buf[: length * struct.calcsize(fmt)]
+        # As vistas são liberadas antes de fechar o bloco
+        with block, block.cast(fmt) as values, values[lo : hi + 1] as run:
+            visualizer = visualizer_class()
+            deque(visualizer._sort_run(run, copy_buffer(run), 0, hi - lo), maxlen=0)
+        return visualizer.comparisons, visualizer.swaps
+    finally:
+        shared.close()
+
+
+def parallel_sort(
+    visualizer: ParallelMergeSortVisualizer, values: ArrayLike, workers: int
+) -> Tuple[int, int]:
+    """
+    Sort ``values`` in place with ``workers`` processes.
+
+    Args:
+        visualizer: Gives the runs (``chunk_count``) and the k-way merge
+        values: List or buffer accepted by ``shared_format``
+        workers: Processes of the pool
+
+    Returns:
+        ``(comparisons, swaps)``, the same as the event engine's
+    """
+    fmt = shared_format(values)
+    length = len(values)
+    nbytes = length * struct.calcsize(fmt)
+    runs = chunk_bounds(length, visualizer.chunk_count(length))
+
+    if isinstance(values, list):
+        source = memoryview(array.array(fmt, values))
+    else:
+        source = memoryview(values)
+
+    shared = SharedMemory(create=True, size=max(1, nbytes))
+    try:
+        with source, source.cast("B") as raw:
+            shared.buf[:nbytes] = raw
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _sort_chunk, type(visualizer), shared.name, fmt, length, lo, hi
+                    )
+                    for lo, hi in runs
+                ]
+                counts = [future.result() for future in futures]
+
+            with shared.buf[:nbytes] as block, block.cast(fmt) as merged:
+                visualizer.reset_stats()
+                deque(
+                    visualizer._kway_merge(merged, copy_buffer(merged), runs), maxlen=0
+                )
+                if isinstance(values, list):
+                    values[:] = merged.tolist()
+                else:
+                    raw[:] = block
+    finally:
+        shared.close()
+        shared.unlink()
+
+    comparisons = visualizer.comparisons + sum(count[0] for count in counts)
+    swaps = visualizer.swaps + sum(count[1] for count in counts)
+    return comparisons, swaps
@@ -0,0 +1,124 @@
+"""
+Profiling module for RichSort.
+
+Per-phase timers and counters for the sort → format → render pipeline, so a
+slow run can be attributed to the algorithm loop, the narration, the
+``_create_visual_array*`` helpers, joining lines or the final Rich/Textual
+rendering. A ``Profiler`` is only consulted when one is attached (see
+``SortingVisualizer.profiler``); without it the pipeline runs unchanged.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Fases conhecidas, na ordem do pipeline, com o rótulo mostrado no resumo
+PHASES = {
+    "sort": "Algoritmo (eventos)",
+    "format": "Narração (renderer)",
+    "visual": "Células do array (_create_visual_array*)",
+    "join": "Junção das linhas",
+    "display": "Exibição (Rich/Textual)",
+}
+
+
+class Profiler:
+    """Accumulates wall time and call counts per phase, plus free counters.
+
+    Each phase is expected to be recorded from a single thread (the Textual
+    worker times the pipeline while the UI thread times the display).
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        """Add ``seconds`` spent in ``phase``."""
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase the counter ``name``."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def timed_iter(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from ``iterable``, timing each ``next`` call as ``name``.
+
+        Only the time spent producing items is counted, not the time the
+        consumer spends between two items.
+        """
+        iterator = iter(iterable)
+        perf_counter = time.perf_counter
+        elapsed = 0.0
+        calls = 0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += perf_counter() - start
+                    return
+                elapsed += perf_counter() - start
+                calls += 1
+                yield item
+        finally:
+            self.add(name, elapsed, calls)
+
+    def reset(self) -> None:
+        """Drop all the measurements."""
+        self.seconds.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+    def as_dict(self) -> Dict[str, Dict]:
+        """Return the measurements as plain dictionaries."""
+        return {
+            "seconds": dict(self.seconds),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters),
+        }
+
+    def summary_table(self):
+        """Build a ``rich.table.Table`` with the time per phase and the counters."""
+        from rich.table import Table
+
+        total = sum(self.seconds.values())
+        table = Table(title="⏱️ Perfil de execução", title_style="bold cyan")
+        table.add_column("Fase")
+        table.add_column("Tempo (s)", justify="right")
+        table.add_column("%", justify="right")
+        table.add_column("Chamadas", justify="right")
+
+        phases = [name for name in PHASES if name in self.seconds]
+        phases += sorted(name for name in self.seconds if name not in PHASES)
+        for name in phases:
+            seconds = self.seconds[name]
+            share = 100 * seconds / total if total else 0.0
+            table.add_row(
+                PHASES.get(name, name),
+                f"{seconds:.4f}",
+                f"{share:.1f}",
+                str(self.calls.get(name, 0)),
+            )
+        table.add_section()
+        table.add_row("[bold]Total[/]", f"[bold]{total:.4f}[/]", "", "")
+
+        if self.counters:
+            table.add_section()
+            for name in sorted(self.counters):
+                table.add_row(f"[dim]{name}[/]", "", "", str(self.counters[name]))
+        return table
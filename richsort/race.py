@@ -0,0 +1,157 @@
+"""
+Race module for RichSort.
+
+Runs several algorithms on the same input in lockstep, driven by one shared
+clock: on every tick each algorithm that has not finished consumes the same
+number of step events, so the one that needs fewer operations crosses the
+line first. Racers that finish in the same tick are ranked by the events
+they consumed, and share the place when those are equal. Between ticks the
+interfaces read a snapshot of every racer (its counters, the race time when
+it finished and a sample of its array), all at once, so a single screen
+update shows all of them.
+"""
+
+import time
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from .buffers import ArrayLike, copy_buffer
+from .registry import get_algorithm_visualizer
+
+# Intervalo do relógio compartilhado entre dois tiques, em segundos
+RACE_TICK = 0.05
+
+# Um tique avança cada algoritmo em cerca de n / RACE_SPEED_DIVISOR eventos
+RACE_SPEED_DIVISOR = 4
+
+
+def default_events_per_tick(length: int) -> int:
+    """Events each racer consumes per tick for an input of ``length`` elements."""
+    return max(1, length // RACE_SPEED_DIVISOR)
+
+
+def sample_values(array: ArrayLike, count: int) -> List[int]:
+    """Return ``count`` evenly spaced elements of ``array`` (all if it is smaller)."""
+    length = len(array)
+    if length <= count:
+        return list(array)
+    return [array[i * length // count] for i in range(count)]
+
+
+class Racer:
+    """One algorithm of a race: its event stream over a private copy of the input."""
+
+    def __init__(
+        self, algorithm_id: str, input_array: ArrayLike, name: Optional[str] = None
+    ):
+        self.algorithm_id = algorithm_id
+        self.name = name or algorithm_id
+        self.visualizer = get_algorithm_visualizer(algorithm_id)
+        self.array = copy_buffer(input_array)
+        self._events = self.visualizer.iter_events(self.array, in_place=True)
+        self.events = 0
+        # Tempo de CPU gasto nos eventos deste algoritmo
+        self.busy = 0.0
+        # Tempo do relógio da corrida ao terminar, e a colocação
+        self.finished_at: Optional[float] = None
+        self.place: Optional[int] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def advance(self, count: int) -> bool:
+        """Consume up to ``count`` events; returns True once the run is over."""
+        start = time.perf_counter()
+        consumed = len(list(islice(self._events, count)))
+        self.busy += time.perf_counter() - start
+        self.events += consumed
+        return consumed < count
+
+
+class Race:
+    """Several algorithms sorting the same input, one tick at a time.
+
+    Raises:
+        ValueError: If an algorithm id is unknown (see ``get_algorithm_visualizer``)
+        NotImplementedError: If an algorithm is only a placeholder
+    """
+
+    def __init__(
+        self,
+        algorithm_ids: List[str],
+        input_array: ArrayLike,
+        names: Optional[Dict[str, str]] = None,
+    ):
+        names = names or {}
+        self.racers = [
+            Racer(algorithm_id, input_array, names.get(algorithm_id))
+            for algorithm_id in algorithm_ids
+        ]
+        self.length = len(input_array)
+        # Faixa de valores da entrada, para a escala dos gráficos
+        self.low = min(input_array) if self.length else 0
+        self.high = max(input_array) if self.length else 0
+        self.ticks = 0
+        self.started_at: Optional[float] = None
+        self._places = 0
+
+    @property
+    def finished(self) -> bool:
+        return all(racer.finished for racer in self.racers)
+
+    def elapsed(self) -> float:
+        """Time on the race clock since the first tick."""
+        if self.started_at is None:
+            return 0.0
+        return time.perf_counter() - self.started_at
+
+    def tick(self, events_per_racer: int) -> bool:
+        """Advance every running racer by ``events_per_racer`` events.
+
+        Returns:
+            True while some racer has not finished
+        """
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+        finishers = []
+        for racer in self.racers:
+            if racer.finished:
+                continue
+            if racer.advance(events_per_racer):
+                finishers.append(racer)
+
+        if finishers:
+            # Quem termina no mesmo tique cruza a linha no mesmo instante; a
+            # colocação entre eles vem dos eventos consumidos, e empates
+            # dividem o lugar (a ordem da lista não conta)
+            finished_at = self.elapsed()
+            finishers.sort(key=lambda racer: racer.events)
+            for index, racer in enumerate(finishers):
+                racer.finished_at = finished_at
+                previous = finishers[index - 1] if index else None
+                if previous is not None and previous.events == racer.events:
+                    racer.place = previous.place
+                else:
+                    racer.place = self._places + index + 1
+            self._places += len(finishers)
+        self.ticks += 1
+        return not self.finished
+
+    def snapshot(self, width: int) -> List[Dict[str, Any]]:
+        """State of every racer, with ``width`` samples of its array."""
+        now = self.elapsed()
+        return [
+            {
+                "id": racer.algorithm_id,
+                "name": racer.name,
+                "comparisons": racer.visualizer.comparisons,
+                "swaps": racer.visualizer.swaps,
+                "events": racer.events,
+                "elapsed": now if racer.finished_at is None else racer.finished_at,
+                "busy": racer.busy,
+                "place": racer.place,
+                "samples": sample_values(racer.array, width),
+            }
+            for racer in self.racers
+        ]
@@ -0,0 +1,231 @@
+"""
+Algorithm registry for RichSort.
+
+Algorithms are registered by id with the import path of their visualizer
+class (``"package.module:ClassName"``) instead of the class itself, so listing
+them imports nothing: a visualizer module is only imported the first time its
+algorithm is selected.
+
+Besides the built-in algorithms, other packages can ship their own through the
+``richsort.algorithms`` entry point group. The entry point name is the
+algorithm id and its value the visualizer class::
+
+    [project.entry-points."richsort.algorithms"]
+    shell = "my_package.shell:ShellSortVisualizer"
+
+Entry points are read once, when the algorithms are listed or an unknown id
+is looked up (``importlib.metadata`` is slow to import, so selecting a
+built-in algorithm never touches it), and never override a built-in id.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .algorithms import SortingVisualizer
+
+# Grupo de entry points em que pacotes externos registram algoritmos
+ENTRY_POINT_GROUP = "richsort.algorithms"
+
+# Algoritmos embutidos; "target" é o caminho da classe do visualizador.
+# "variant": "didactic" favorece a clareza da visualização; "efficient" é a
+# versão usada na prática, para comparar leituras/escritas lado a lado.
+ALGORITHMS: Dict[str, Dict[str, Any]] = {
+    "bubble": {
+        "name": "🫧 Bubble Sort",
+        "target": "richsort.algorithms:BubbleSortVisualizer",
+        "implemented": True,
+        "variant": "didactic",
+    },
+    "bubble_last_swap": {
+        "name": "🫧 Bubble Sort (última troca)",
+        "target": "richsort.algorithms:BubbleLastSwapVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "bubble",
+    },
+    "selection": {
+        "name": "🔄 Selection Sort",
+        "target": "richsort.algorithms:SelectionSortVisualizer",
+        "implemented": True,
+        "variant": "didactic",
+    },
+    "insertion": {
+        "name": "📍 Insertion Sort",
+        "target": "richsort.algorithms:InsertionSortVisualizer",
+        "implemented": True,
+        "variant": "didactic",
+    },
+    "insertion_shift": {
+        "name": "📍 Insertion Sort (deslocamentos)",
+        "target": "richsort.algorithms:InsertionShiftVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "insertion",
+    },
+    "insertion_binary": {
+        "name": "📍 Insertion Sort (busca binária)",
+        "target": "richsort.algorithms:InsertionBinaryVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "insertion",
+    },
+    "quick": {
+        "name": "🚀 Quick Sort",
+        "target": "richsort.algorithms:QuickSortVisualizer",
+        "implemented": True,
+        "variant": "didactic",
+    },
+    "quick_first": {
+        "name": "🚀 Quick Sort (pivô: primeiro)",
+        "target": "richsort.algorithms:QuickFirstVisualizer",
+        "implemented": True,
+        "variant": "didactic",
+        "base": "quick",
+    },
+    "quick_random": {
+        "name": "🚀 Quick Sort (pivô aleatório)",
+        "target": "richsort.algorithms:QuickRandomVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "quick",
+    },
+    "quick_3way": {
+        "name": "🚀 Quick Sort (partição em três)",
+        "target": "richsort.algorithms:QuickThreeWayVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "quick",
+    },
+    "merge": {
+        "name": "🔀 Merge Sort",
+        "target": "richsort.algorithms:MergeSortVisualizer",
+        "implemented": True,
+        "variant": "didactic",
+    },
+    "merge_bottom_up": {
+        "name": "🔀 Merge Sort (bottom-up)",
+        "target": "richsort.algorithms:MergeBottomUpVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "merge",
+    },
+    "merge_parallel": {
+        "name": "🔀 Merge Sort (paralelo)",
+        "target": "richsort.algorithms:ParallelMergeSortVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "merge",
+    },
+    "odd_even": {
+        "name": "⚡ Odd-Even Transposition Sort",
+        "target": "richsort.algorithms:OddEvenSortVisualizer",
+        "implemented": True,
+        "variant": "efficient",
+        "base": "bubble",
+    },
+}
+
+# Classes já importadas, por id
+_loaded: Dict[str, type] = {}
+_entry_points_loaded = False
+
+
+def register_algorithm(
+    algorithm_id: str,
+    target: str,
+    name: Optional[str] = None,
+    variant: str = "didactic",
+    base: Optional[str] = None,
+    source: Optional[str] = None,
+) -> None:
+    """
+    Register an algorithm without importing it.
+
+    Args:
+        algorithm_id: Id used to select the algorithm
+        target: Visualizer class as ``"package.module:ClassName"``
+        name: Name shown in the UIs (derived from the id if omitted)
+        variant: ``"didactic"`` or ``"efficient"``
+        base: Id of the didactic algorithm an efficient variant improves on
+        source: Distribution that provides the algorithm (entry points)
+    """
+    if name is None:
+        name = "🧩 " + algorithm_id.replace("_", " ").title()
+    info = {"name": name, "target": target, "implemented": True, "variant": variant}
+    if base is not None:
+        info["base"] = base
+    if source is not None:
+        info["source"] = source
+    ALGORITHMS[algorithm_id] = info
+    _loaded.pop(algorithm_id, None)
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in ALGORITHMS:
+            continue
+        dist = getattr(entry_point, "dist", None)
+        register_algorithm(
+            entry_point.name,
+            entry_point.value,
+            source=dist.name if dist is not None else None,
+        )
+
+
+def load_visualizer_class(algorithm_id: str) -> type:
+    """Import and return the visualizer class of an algorithm.
+
+    Raises:
+        ValueError: If the id is unknown or its module cannot be imported
+        NotImplementedError: If the algorithm is only a placeholder
+    """
+    if algorithm_id in _loaded:
+        return _loaded[algorithm_id]
+
+    if algorithm_id not in ALGORITHMS:
+        _load_entry_points()
+    if algorithm_id not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm_id}")
+
+    algo_info = ALGORITHMS[algorithm_id]
+    if not algo_info["implemented"]:
+        raise NotImplementedError(f"Algorithm {algorithm_id} is not yet implemented")
+
+    module_name, _, attribute = algo_info["target"].partition(":")
+    try:
+        visualizer_class = import_module(module_name)
+        for part in attribute.split("."):
+            visualizer_class = getattr(visualizer_class, part)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot load algorithm {algorithm_id}: {e}") from e
+
+    _loaded[algorithm_id] = visualizer_class
+    return visualizer_class
+
+
+def get_algorithm_visualizer(algorithm_id: str) -> "SortingVisualizer":
+    """Get a visualizer instance for the specified algorithm."""
+    return load_visualizer_class(algorithm_id)()
+
+
+def get_available_algorithms() -> List[Dict[str, Any]]:
+    """Get list of all available algorithms with their metadata (no imports)."""
+    _load_entry_points()
+    return [
+        {
+            "id": algo_id,
+            "name": algo_info["name"],
+            "implemented": algo_info["implemented"],
+            "variant": algo_info.get("variant", "didactic"),
+            "base": algo_info.get("base", algo_id),
+            "source": algo_info.get("source", "richsort"),
+        }
+        for algo_id, algo_info in ALGORITHMS.items()
+    ]
@@ -0,0 +1,2014 @@
+"""
+Renderers module for RichSort.
+
+Renderers turn the step events produced by the sorting algorithms into the
+Rich-formatted narration shown by the UIs. They keep their own copy of the
+array and replay the events on it, so text is only built when someone asks
+for it and the algorithms themselves never touch markup.
+"""
+
+import time
+from bisect import bisect_right
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .buffers import ArrayLike, copy_buffer, format_values
+from .events import (
+    COMPARE,
+    FROM_AUX,
+    KEY,
+    LOAD,
+    MOVE,
+    PASS_END,
+    PASS_START,
+    PIVOT,
+    RANGE,
+    STORE,
+    SWAP,
+    TO_AUX,
+    Event,
+)
+from .stats import log2_factorial
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    from .profiling import Profiler
+
+# Célula do array já estilizada: (estilo Rich, valor)
+Cell = Tuple[str, int]
+
+# Backends de saída: linhas com markup Rich ou objetos rich.text.Text prontos
+BACKENDS = ("markup", "text")
+
+# Uma linha de saída: markup (str) ou rich.text.Text, conforme o backend
+Line = Union[str, "Text"]
+
+# Arrays maiores que isso usam o modo delta quando ``delta`` não é informado
+DELTA_AUTO_SIZE = 50
+
+# Quantidade mínima de linhas de array entre dois quadros-chave no modo delta
+# (arrays maiores usam o próprio tamanho, mantendo o custo amortizado constante)
+KEYFRAME_INTERVAL = 64
+
+# Orçamento de saída sugerido para as interfaces (``max_lines``/``max_bytes``)
+OUTPUT_MAX_LINES = 50_000
+OUTPUT_MAX_BYTES = 8 * 1024 * 1024
+
+# Resumos por passo emitidos depois do orçamento, antes de restar só o final
+SUMMARY_MAX_LINES = 200
+
+# Níveis de detalhe da saída com orçamento
+LEVEL_FULL = "full"
+LEVEL_PASSES = "passes"
+LEVEL_FINAL = "final"
+
+# Fora do estado da narração: o array, o buffer auxiliar e o registrador vêm
+# dos snapshots do trace (``restore``), e o profiler é da instância
+_NARRATION_EXCLUDED = frozenset({"input_array", "array", "aux", "key", "profiler"})
+
+
+class TraceRenderer:
+    """Base class for the event renderers.
+
+    In delta mode (``delta=True``, or automatically for arrays larger than
+    ``DELTA_AUTO_SIZE``) array lines only show the cells that changed since the
+    previous array line plus the highlighted positions, each prefixed by its
+    index. Every ``keyframe_interval`` array lines a keyframe with the whole
+    array is emitted, so the full state can always be rebuilt from the last
+    keyframe and the deltas after it.
+
+    With ``backend="text"`` every line is a ``rich.text.Text`` instead of a
+    markup string; array lines are then built from cached styles without ever
+    going through the markup parser (see ``text_backend``).
+
+    ``attach_profiler`` swaps in timed versions of ``feed`` and ``array_line``
+    that record the narration as the ``format`` phase and the array lines as
+    the ``visual`` phase; renderers without a profiler run the plain methods.
+
+    Seeking restores a renderer in the middle of a run: ``restore`` sets the
+    array state, ``narration_state``/``load_narration`` copy the per-pass
+    state of the narration, and ``fast_forward`` applies events without
+    formatting their array lines.
+
+    ``max_lines``/``max_bytes`` set an output budget for the narration of the
+    events: once it is used up the renderer stops narrating and only emits
+    one summary line per pass, and after ``summary_lines`` of those nothing
+    until the footer. The array and the counters are still updated for every
+    event, so the footer reports the exact totals; ``level`` tells which of
+    ``LEVEL_FULL``, ``LEVEL_PASSES`` or ``LEVEL_FINAL`` is in effect.
+    """
+
+    title = ""
+    description: List[str] = []
+    profiler: Optional["Profiler"] = None
+    # Mostra movimentos, leituras e escritas no rodapé (variantes eficientes)
+    show_accesses = False
+
+    def __init__(
+        self,
+        input_array: List[int],
+        delta: Optional[bool] = None,
+        keyframe_interval: Optional[int] = None,
+        backend: str = "markup",
+        max_lines: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        summary_lines: int = SUMMARY_MAX_LINES,
+    ):
+        # Cópias no mesmo tipo da entrada (lista, array.array, NumPy...)
+        self.input_array = copy_buffer(input_array)
+        self.array = copy_buffer(input_array)
+        self.length = len(self.array)
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        self.reads = 0
+        self.writes = 0
+        # Registrador da chave (eventos LOAD/STORE)
+        self.key = None
+        # Buffer auxiliar (eventos TO_AUX/FROM_AUX), criado no primeiro uso
+        self.aux = None
+
+        self.delta = self.length > DELTA_AUTO_SIZE if delta is None else delta
+        if keyframe_interval is None:
+            keyframe_interval = max(KEYFRAME_INTERVAL, self.length)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._array_lines = 0
+        self._changed = set()
+        # Avançando sem saída (``fast_forward``): linhas de array vazias
+        self._quiet = False
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        if backend == "text":
+            # Importado só quando usado: o backend padrão não depende do Rich
+            from . import text_backend
+
+            self._text_backend = text_backend
+
+        self.level = LEVEL_FULL
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.summary_lines = summary_lines
+        if max_lines is not None or max_bytes is not None:
+            # Sem orçamento, ``feed`` continua sem nenhuma verificação extra
+            self._output_lines = 0
+            self._output_bytes = 0
+            self._events_seen = 0
+            self._events_narrated = 0
+            self._summaries = 0
+            self._pass_number = 0
+            self._pass_totals = (0, 0, 0)
+            self.feed = self._feed_budgeted
+
+    def render(self, events: Iterable[Event]) -> Iterator[Line]:
+        """Yield the narration lines for a complete event stream."""
+        yield from self.header()
+        for event in events:
+            yield from self.feed(event)
+        yield from self.footer()
+
+    def feed(self, event: Event) -> List[Line]:
+        """Consume a single event and return the lines it produces."""
+        return self._finish(self._dispatch(event))
+
+    def attach_profiler(self, profiler: "Profiler") -> None:
+        """Time ``feed`` and ``array_line`` with ``profiler`` from now on."""
+        self.profiler = profiler
+        self._plain_feed = self.feed
+        self._plain_array_line = self.array_line
+        self.feed = self._feed_profiled
+        self.array_line = self._array_line_profiled
+
+    def _feed_profiled(self, event: Event) -> List[Line]:
+        profiler = self.profiler
+        visual_before = profiler.seconds.get("visual", 0.0)
+        start = time.perf_counter()
+        lines = self._plain_feed(event)
+        elapsed = time.perf_counter() - start
+
+        # O tempo das linhas de array já foi contado como "visual"
+        visual = profiler.seconds.get("visual", 0.0) - visual_before
+        profiler.add("format", elapsed - visual)
+        profiler.count("events")
+        profiler.count("lines", len(lines))
+        return lines
+
+    def _feed_budgeted(self, event: Event) -> List[Line]:
+        self._events_seen += 1
+        if event[0] == PASS_START:
+            self._pass_number += 1
+
+        output = []
+        if self.level == LEVEL_FULL:
+            if not self._over_budget():
+                lines = self._finish(self._dispatch(event))
+                self._events_narrated += 1
+                self._output_lines += len(lines)
+                if self.max_bytes is not None:
+                    self._output_bytes += sum(_line_bytes(line) for line in lines)
+                return lines
+
+            self.level = LEVEL_PASSES
+            self._pass_totals = (self.comparisons, self.swaps, self.moves)
+            output.append("")
+            output.append(
+                f"[yellow]✂️ Limite de saída atingido ({self._output_lines} linhas):"
+                " a partir daqui, um resumo por passo[/]"
+            )
+            output.append("")
+
+        self._apply(event)
+        if event[0] == PASS_END and self.level == LEVEL_PASSES:
+            if self._summaries < self.summary_lines:
+                self._summaries += 1
+                output.append(self._pass_summary())
+            else:
+                self.level = LEVEL_FINAL
+                output.append(
+                    "[yellow]✂️ Limite de resumos atingido:"
+                    " só o resultado final será mostrado[/]"
+                )
+        return self._finish(output)
+
+    def _over_budget(self) -> bool:
+        if self.max_lines is not None and self._output_lines >= self.max_lines:
+            return True
+        return self.max_bytes is not None and self._output_bytes >= self.max_bytes
+
+    def _apply(self, event: Event) -> None:
+        """Update the array and the counters for an event, without narration."""
+        opcode, i, j = event
+        if opcode == COMPARE:
+            self.comparisons += 1
+            self.reads += 1 if j == KEY else 2
+        elif opcode == SWAP:
+            self.swaps += 1
+            self.reads += 2
+            self.writes += 2
+            self.swap(i, j)
+        elif opcode == MOVE:
+            self.moves += 1
+            self.reads += 1
+            self.writes += 1
+            self.move(i, j)
+        elif opcode == LOAD:
+            self.reads += 1
+            self.key = self.array[i]
+        elif opcode == STORE:
+            self.writes += 1
+            self.store(i)
+        elif opcode == TO_AUX:
+            self.moves += 1
+            self.reads += 1
+            self.writes += 1
+            self.to_aux(i, j)
+        elif opcode == FROM_AUX:
+            self.moves += 1
+            self.reads += 1
+            self.writes += 1
+            self.from_aux(i, j)
+
+    def _pass_summary(self) -> str:
+        comparisons, swaps, moves = self._pass_totals
+        self._pass_totals = (self.comparisons, self.swaps, self.moves)
+        summary = (
+            f"    [dim]📦 Passo {self._pass_number}: "
+            f"{self.comparisons - comparisons} comparações, "
+            f"{self.swaps - swaps} trocas"
+        )
+        if self.show_accesses:
+            summary += f", {self.moves - moves} deslocamentos"
+        return summary + "[/]"
+
+    def fast_forward(self, events: Iterable[Event]) -> int:
+        """
+        Consume ``events`` without formatting their output (used when seeking).
+
+        The handlers still run, so the narration state stays exact, but the
+        array lines are left empty. Returns the number of lines the events
+        would have produced.
+        """
+        lines = 0
+        self._quiet = True
+        try:
+            for event in events:
+                lines += len(self._dispatch(event))
+        finally:
+            self._quiet = False
+        self.keyframe_next()
+        return lines
+
+    def restore(
+        self, array: ArrayLike, counts: Dict[str, int], key=None, aux=None
+    ) -> None:
+        """Continue from a given state of the run (used when seeking).
+
+        ``counts`` has the keys of ``events.count_accesses``; ``aux`` is the
+        auxiliary buffer, needed when restoring in the middle of a pass.
+        """
+        self.array = copy_buffer(array)
+        self.aux = None if aux is None else copy_buffer(aux)
+        self.comparisons = counts["comparisons"]
+        self.swaps = counts["swaps"]
+        self.moves = counts["moves"]
+        self.reads = counts["reads"]
+        self.writes = counts["writes"]
+        self.key = key
+        self.keyframe_next()
+
+    def narration_state(self) -> Dict[str, Any]:
+        """Copy of the narration state: everything ``restore`` does not set."""
+        state = {}
+        for name, value in vars(self).items():
+            if name in _NARRATION_EXCLUDED or callable(value):
+                continue
+            if isinstance(value, (list, set, dict)):
+                value = type(value)(value)
+            state[name] = value
+        return state
+
+    def load_narration(self, state: Dict[str, Any]) -> None:
+        """Continue the narration from a copy made by ``narration_state``."""
+        for name, value in state.items():
+            if isinstance(value, (list, set, dict)):
+                value = type(value)(value)
+            setattr(self, name, value)
+
+    def keyframe_next(self) -> None:
+        """Make the next array line a full keyframe (delta mode)."""
+        self._array_lines = 0
+        self._changed.clear()
+
+    def _finish(self, lines: List[Line]) -> List[Line]:
+        """Convert the remaining markup lines when using the text backend."""
+        if self.backend == "markup":
+            return lines
+        markup_text = self._text_backend.markup_text
+        return [
+            line if not isinstance(line, str) else markup_text(line) for line in lines
+        ]
+
+    def _dispatch(self, event: Event) -> List[Line]:
+        opcode, i, j = event
+        if opcode == COMPARE:
+            self.comparisons += 1
+            self.reads += 1 if j == KEY else 2
+            return self.on_compare(i, j)
+        if opcode == SWAP:
+            self.swaps += 1
+            self.reads += 2
+            self.writes += 2
+            return self.on_swap(i, j)
+        if opcode == PASS_START:
+            return self.on_pass_start(i)
+        if opcode == PASS_END:
+            return self.on_pass_end(i)
+        if opcode == MOVE:
+            self.moves += 1
+            self.reads += 1
+            self.writes += 1
+            return self.on_move(i, j)
+        if opcode == LOAD:
+            self.reads += 1
+            return self.on_load(i)
+        if opcode == STORE:
+            self.writes += 1
+            return self.on_store(i)
+        if opcode == TO_AUX:
+            self.moves += 1
+            self.reads += 1
+            self.writes += 1
+            return self.on_to_aux(i, j)
+        if opcode == FROM_AUX:
+            self.moves += 1
+            self.reads += 1
+            self.writes += 1
+            return self.on_from_aux(i, j)
+        if opcode == RANGE:
+            return self.on_range(i, j)
+        if opcode == PIVOT:
+            return self.on_pivot(i)
+        return []
+
+    def swap(self, i: int, j: int) -> None:
+        """Apply a swap to the renderer's copy of the array."""
+        self.array[i], self.array[j] = self.array[j], self.array[i]
+        if self.delta:
+            self._changed.add(i)
+            self._changed.add(j)
+
+    def move(self, src: int, dst: int) -> None:
+        """Apply a move (copy of ``src`` over ``dst``) to the renderer's array."""
+        self.array[dst] = self.array[src]
+        if self.delta:
+            self._changed.add(dst)
+
+    def store(self, i: int) -> None:
+        """Write the key register into position ``i`` of the renderer's array."""
+        self.array[i] = self.key
+        if self.delta:
+            self._changed.add(i)
+
+    def to_aux(self, src: int, dst: int) -> None:
+        """Copy position ``src`` of the renderer's array into the auxiliary buffer."""
+        if self.aux is None:
+            self.aux = copy_buffer(self.array)
+        self.aux[dst] = self.array[src]
+
+    def from_aux(self, src: int, dst: int) -> None:
+        """Copy auxiliary position ``src`` over position ``dst`` of the array."""
+        self.array[dst] = self.aux[src]
+        if self.delta:
+            self._changed.add(dst)
+
+    def array_line(
+        self,
+        label: str,
+        highlights: List[int],
+        create_visual: Callable[..., List[Cell]],
+        *args,
+        **kwargs,
+    ) -> Line:
+        """
+        Format one array line, in full or as a delta.
+
+        Args:
+            label: Text shown before the cells
+            highlights: Positions the visual helper highlights on this line
+            create_visual: One of the ``_create_visual_array*`` helpers, called
+                with ``*args``/``**kwargs`` and the positions to render
+        """
+        if self._quiet:
+            return ""
+        keyframe = not self.delta or self._array_lines % self.keyframe_interval == 0
+        self._array_lines += 1
+
+        if keyframe:
+            self._changed.clear()
+            positions = None
+            visual_array = create_visual(*args, **kwargs)
+        else:
+            positions = sorted(self._changed.union(p for p in highlights if p >= 0))
+            self._changed.clear()
+            visual_array = create_visual(*args, positions=positions, **kwargs)
+
+        if self.backend == "text":
+            return self._text_backend.cells_text(label, visual_array, positions)
+
+        if positions is None:
+            cells = " ".join(f"[{style}] {val} [/]" for style, val in visual_array)
+            return f"{label} {cells}"
+
+        cells = " ".join(
+            f"[dim]{position}:[/][{style}] {val} [/]"
+            for position, (style, val) in zip(positions, visual_array)
+        )
+        return f"{label} [dim]Δ[/] {cells}"
+
+    def _array_line_profiled(self, *args, **kwargs) -> Line:
+        start = time.perf_counter()
+        line = self._plain_array_line(*args, **kwargs)
+        self.profiler.add("visual", time.perf_counter() - start)
+        self.profiler.count("array_lines")
+        return line
+
+    def header(self) -> List[Line]:
+        output = []
+        output.append(f"[bold cyan]{self.title}[/]")
+        output.append("")
+        output.append(f"[white]Array inicial:[/] {format_values(self.input_array)}")
+        output.append(f"[white]Tamanho:[/] {self.length} elementos")
+        output.append("")
+        output.extend(self.description)
+        output.append("─" * 60)
+        output.append("")
+        return self._finish(output)
+
+    def footer(self) -> List[Line]:
+        output = []
+        output.append("")
+        output.append("[bold green]🎉 ORDENAÇÃO CONCLUÍDA![/]")
+        output.append("")
+        output.append(
+            f"[white]Array final:[/] [bold cyan]{format_values(self.array)}[/]"
+        )
+        output.append("")
+        output.append("[white]📊 Estatísticas:[/]")
+        output.append(f"[white]  • Comparações:[/] [yellow]{self.comparisons}[/]")
+        output.append(f"[white]  • Trocas realizadas:[/] [yellow]{self.swaps}[/]")
+        if self.show_accesses:
+            output.append(f"[white]  • Deslocamentos:[/] [yellow]{self.moves}[/]")
+            output.append(f"[white]  • Leituras do array:[/] [yellow]{self.reads}[/]")
+            output.append(f"[white]  • Escritas no array:[/] [yellow]{self.writes}[/]")
+        if self.level != LEVEL_FULL:
+            output.append(
+                f"[white]  • Eventos narrados:[/] [yellow]{self._events_narrated}"
+                f"/{self._events_seen}[/] [dim](saída resumida)[/]"
+            )
+        output.append(self._complexity_line())
+        return self._finish(output)
+
+    def _complexity_line(self) -> str:
+        """Comparisons of this run against the lower bound log2(n!)."""
+        bound = log2_factorial(self.length)
+        line = f"[white]  • Limite inferior:[/] log₂({self.length}!) ≈ {bound:.0f} comparações"
+        if bound >= 1:
+            line += f" [dim](esta execução: {self.comparisons / bound:.2f}×)[/]"
+        return line
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        return []
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        return []
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        self.swap(i, j)
+        return []
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        return []
+
+    def on_move(self, src: int, dst: int) -> List[Line]:
+        self.move(src, dst)
+        return []
+
+    def on_load(self, i: int) -> List[Line]:
+        self.key = self.array[i]
+        return []
+
+    def on_store(self, i: int) -> List[Line]:
+        self.store(i)
+        return []
+
+    def on_to_aux(self, src: int, dst: int) -> List[Line]:
+        self.to_aux(src, dst)
+        return []
+
+    def on_from_aux(self, src: int, dst: int) -> List[Line]:
+        self.from_aux(src, dst)
+        return []
+
+    def on_range(self, lo: int, hi: int) -> List[Line]:
+        return []
+
+    def on_pivot(self, i: int) -> List[Line]:
+        return []
+
+
+def budget_options(
+    max_lines: Optional[int] = OUTPUT_MAX_LINES, delta: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Renderer options for the interfaces' output budget (0/None: unlimited).
+
+    ``delta`` is passed to the renderer when given: the interactive views use
+    ``delta=False``, since they show each array line on its own and never
+    rebuild it from a keyframe; None keeps the automatic choice.
+    """
+    options: Dict[str, Any] = {}
+    if max_lines:
+        options.update(max_lines=max_lines, max_bytes=OUTPUT_MAX_BYTES)
+    if delta is not None:
+        options["delta"] = delta
+    return options
+
+
+def _line_bytes(line: Line) -> int:
+    """Size of an output line in UTF-8 (the plain text of a ``Text``)."""
+    if isinstance(line, str):
+        return len(line.encode())
+    return len(line.plain.encode())
+
+
+class BubbleSortRenderer(TraceRenderer):
+    """Narration for Bubble Sort events."""
+
+    title = "🫧 BUBBLE SORT"
+    description = [
+        "[dim]O Bubble Sort compara elementos adjacentes e os troca[/]",
+        "[dim]se estiverem fora de ordem.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.iteration = 0
+        self.swapped = False
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.iteration = pass_index
+        self.swapped = False
+
+        output = []
+        output.append(
+            f"[bold blue]🔄 PASSO {pass_index + 1}/{self.length}[/] - Estado atual: {format_values(self.array)}"
+        )
+        if pass_index == 0:
+            output.append(
+                "[dim]💡 A cada passo, o maior elemento restante irá para sua posição final[/]"
+            )
+        output.append("")
+        return output
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        cur_element = self.array[i]
+        adj_element = self.array[j]
+
+        output = []
+        output.append(
+            f"    🔍 Comparando {cur_element} (pos: {i}) com {adj_element} (pos: {j})"
+        )
+
+        # Visual representation
+        output.append(
+            self.array_line(
+                "    Array:",
+                [i, j],
+                self._create_visual_array,
+                self.array,
+                [i, j],
+                self.iteration,
+            )
+        )
+
+        if self.iteration > 0:
+            output.append(
+                f"    [dim]Últimos {self.iteration} elementos já estão ordenados ✅[/]"
+            )
+
+        if cur_element > adj_element:
+            output.append(f"    [green]✅ {cur_element} > {adj_element} → TROCAR![/]")
+        else:
+            output.append(f"    [red]❌ {cur_element} ≤ {adj_element} → não trocar[/]")
+            output.append("")
+        return output
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        self.swap(i, j)
+        self.swapped = True
+
+        # Show result after swap
+        visual_array_after = self.array_line(
+            "    Resultado:",
+            [i, j],
+            self._create_visual_array,
+            self.array,
+            [i, j],
+            self.iteration,
+            swap_highlight=True,
+        )
+        return [visual_array_after, ""]
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        if not self.swapped:
+            return [
+                "    [yellow]🎉 Nenhuma troca neste passo! Array pode estar ordenado.[/]"
+            ]
+        return ["─" * 40, ""]
+
+    def _create_visual_array(
+        self,
+        array: List[int],
+        highlight_indices: List[int],
+        sorted_elements: int,
+        swap_highlight: bool = False,
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array with highlighting."""
+        visual_array = []
+        length = len(array)
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if i in highlight_indices:
+                if swap_highlight:
+                    visual_array.append(("green on white", val))
+                elif i == highlight_indices[0]:
+                    visual_array.append(("magenta on white", val))
+                else:
+                    visual_array.append(("cyan on white", val))
+            elif i >= length - sorted_elements:
+                visual_array.append(("dim", val))
+            else:
+                visual_array.append(("white", val))
+
+        return visual_array
+
+
+class SelectionSortRenderer(TraceRenderer):
+    """Narration for Selection Sort events."""
+
+    title = "🔄 SELECTION SORT"
+    description = [
+        "[dim]O Selection Sort encontra o menor elemento[/]",
+        "[dim]e o coloca na posição correta a cada iteração.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.cur_index = 0
+        self.min_index = 0
+        self.swapped = False
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.cur_index = pass_index
+        self.min_index = pass_index
+        self.swapped = False
+
+        output = []
+        output.append(
+            f"[bold blue]🔄 PASSO {pass_index + 1}/{self.length - 1}[/] - Encontrando elemento para posição {pass_index}"
+        )
+        if pass_index == 0:
+            output.append(
+                "[dim]💡 A cada passo, encontramos o menor elemento restante[/]"
+            )
+        output.append("")
+        output.append(
+            f"    🔍 Procurando o menor elemento a partir da posição {pass_index}"
+        )
+        output.append(
+            f"    Candidato inicial: {self.array[pass_index]} (pos: {pass_index})"
+        )
+        output.append("")
+        return output
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        candidate_value = self.array[i]
+        min_value = self.array[self.min_index]
+
+        output = []
+        output.append(
+            f"    🔍 Comparando {candidate_value} (pos: {i}) com atual mínimo {min_value}"
+        )
+
+        # Visual representation during search
+        output.append(
+            self.array_line(
+                "    Array:",
+                [self.cur_index, self.min_index, i],
+                self._create_visual_array_selection,
+                self.array,
+                self.cur_index,
+                self.min_index,
+                i,
+                self.length,
+            )
+        )
+
+        if candidate_value < min_value:
+            self.min_index = i
+            output.append(
+                f"    [green]✅ Novo mínimo encontrado: {candidate_value} na posição {i}[/]"
+            )
+        else:
+            output.append(
+                f"    [red]❌ {candidate_value} ≥ {min_value} → manter mínimo atual[/]"
+            )
+
+        output.append("")
+        return output
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        self.swapped = True
+        min_value = self.array[j]
+
+        output = [self._min_found_line()]
+        output.append(
+            f"    [blue]🔄 Trocando posição {i} ({self.array[i]}) com posição {j} ({min_value})[/]"
+        )
+
+        # Show before swap
+        output.append(
+            self.array_line(
+                "    Antes: ",
+                [i, j],
+                self._create_visual_array_selection,
+                self.array,
+                i,
+                j,
+                -1,
+                self.length,
+                show_swap=True,
+            )
+        )
+
+        self.swap(i, j)
+
+        # Show after swap
+        output.append(
+            self.array_line(
+                "    Depois:",
+                [i],
+                self._create_visual_array_selection,
+                self.array,
+                i,
+                -1,
+                -1,
+                self.length,
+                show_result=True,
+            )
+        )
+        return output
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+        if not self.swapped:
+            output.append(self._min_found_line())
+            output.append(f"    [green]✅ Elemento já está na posição correta![/]")
+
+        if pass_index > 0:
+            output.append(
+                f"    [dim]Primeiros {pass_index + 1} elementos já estão ordenados ✅[/]"
+            )
+
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _min_found_line(self) -> str:
+        return (
+            f"    [yellow]🎯 Menor elemento encontrado: "
+            f"{self.array[self.min_index]} (pos: {self.min_index})[/]"
+        )
+
+    def _create_visual_array_selection(
+        self,
+        array: List[int],
+        current_pos: int,
+        min_pos: int,
+        candidate_pos: int,
+        length: int,
+        show_swap: bool = False,
+        show_result: bool = False,
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array for selection sort."""
+        visual_array = []
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if show_result and i <= current_pos:
+                # Show sorted portion in green
+                visual_array.append(("bold green", val))
+            elif show_swap and (i == current_pos or i == min_pos):
+                # Show elements being swapped
+                visual_array.append(("yellow on blue", val))
+            elif i == current_pos:
+                # Current position being filled
+                visual_array.append(("bold blue on white", val))
+            elif i == min_pos:
+                # Current minimum found
+                visual_array.append(("bold green on white", val))
+            elif i == candidate_pos:
+                # Element being compared
+                visual_array.append(("magenta on white", val))
+            elif i < current_pos:
+                # Already sorted portion
+                visual_array.append(("dim green", val))
+            else:
+                # Unsorted portion
+                visual_array.append(("white", val))
+
+        return visual_array
+
+
+class InsertionSortRenderer(TraceRenderer):
+    """Narration for the swap-based Insertion Sort events."""
+
+    title = "📍 INSERTION SORT"
+    description = [
+        "[dim]O Insertion Sort insere cada elemento[/]",
+        "[dim]na posição correta fazendo trocas com elementos maiores.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.cur_index = 0
+        self.cur_value = None
+        self.current_pos = 0
+        self.swaps_in_step = 0
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.cur_index = pass_index
+        self.cur_value = self.array[pass_index]
+        self.current_pos = pass_index
+        self.swaps_in_step = 0
+
+        output = []
+        output.append(
+            f"[bold blue]🔄 PASSO {pass_index}/{self.length - 1}[/] - Inserindo {self.cur_value} na posição correta"
+        )
+        if pass_index == 1:
+            output.append(
+                "[dim]💡 A cada passo, inserimos o elemento atual na posição correta à esquerda[/]"
+            )
+        output.append("")
+
+        output.append(
+            f"    🎯 Elemento a inserir: {self.cur_value} (posição {pass_index})"
+        )
+
+        # Show initial state
+        output.append(
+            self.array_line(
+                "    Array inicial:",
+                [pass_index],
+                self._create_visual_array_insertion,
+                self.array,
+                pass_index,
+                pass_index,
+                self.length,
+            )
+        )
+        output.append("")
+        return output
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        left_value = self.array[i]
+
+        output = []
+        output.append(f"    🔍 Comparando {self.cur_value} com {left_value} (pos {i})")
+
+        if left_value > self.cur_value:
+            output.append(f"    [green]✅ {left_value} > {self.cur_value} → TROCAR![/]")
+
+            # Show before swap
+            output.append(
+                self.array_line(
+                    "    Antes: ",
+                    [self.cur_index, i, j],
+                    self._create_visual_array_insertion,
+                    self.array,
+                    self.cur_index,
+                    self.current_pos,
+                    self.length,
+                    show_swap_positions=[i, j],
+                )
+            )
+        else:
+            output.append(
+                f"    [red]❌ {left_value} ≤ {self.cur_value} → posição encontrada![/]"
+            )
+            output.append("")
+        return output
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        self.swap(i, j)
+        self.swaps_in_step += 1
+        self.current_pos = i
+
+        # Show after swap
+        visual_after = self.array_line(
+            "    Depois:",
+            [self.cur_index, self.current_pos],
+            self._create_visual_array_insertion,
+            self.array,
+            self.cur_index,
+            self.current_pos,
+            self.length,
+            show_result=True,
+        )
+        return [visual_after, ""]
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+
+        # Summary of this step
+        if self.swaps_in_step > 0:
+            output.append(
+                f"    [yellow]📍 Elemento {self.cur_value} inserido na posição {self.current_pos} após {self.swaps_in_step} trocas[/]"
+            )
+        else:
+            output.append(
+                f"    [green]✅ Elemento {self.cur_value} já estava na posição correta![/]"
+            )
+
+        if pass_index > 1:
+            output.append(
+                f"    [dim]Primeiros {pass_index + 1} elementos já estão ordenados ✅[/]"
+            )
+
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _create_visual_array_insertion(
+        self,
+        array: List[int],
+        original_pos: int,
+        current_pos: int,
+        length: int,
+        show_swap_positions: List[int] = None,
+        show_result: bool = False,
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array for insertion sort."""
+        visual_array = []
+        show_swap_positions = show_swap_positions or []
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if show_result and i == current_pos:
+                # Show element in its new correct position
+                visual_array.append(("bold green on white", val))
+            elif show_swap_positions and i in show_swap_positions:
+                # Show elements being swapped
+                visual_array.append(("yellow on blue", val))
+            elif i == current_pos:
+                # Current position of the element being inserted
+                visual_array.append(("bold blue on white", val))
+            elif i == original_pos and i != current_pos:
+                # Original position (if different from current)
+                visual_array.append(("magenta on white", val))
+            elif i < original_pos:
+                # Already sorted portion
+                visual_array.append(("dim green", val))
+            else:
+                # Unsorted portion
+                visual_array.append(("white", val))
+
+        return visual_array
+
+
+class BubbleLastSwapRenderer(BubbleSortRenderer):
+    """Narration for the Bubble Sort bounded by the last swap of each pass."""
+
+    title = "🫧 BUBBLE SORT (ÚLTIMA TROCA)"
+    description = [
+        "[dim]Variante eficiente: cada passo termina na posição da última troca[/]",
+        "[dim]do passo anterior, pois tudo depois dela já está ordenado.[/]",
+    ]
+    show_accesses = True
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.bound = self.length
+        self.last_swap = 0
+
+    def _dispatch(self, event: Event) -> List[Line]:
+        # O evento de início de passo traz o limite do passo
+        if event[0] == PASS_START:
+            self.bound = event[2]
+        return super()._dispatch(event)
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        output = super().on_pass_start(pass_index)
+        # Elementos a partir do limite já estão na posição final
+        self.iteration = self.length - self.bound
+        self.last_swap = 0
+        if pass_index > 0:
+            output.insert(
+                -1,
+                f"[dim]📌 Comparando só até a posição {self.bound - 1} (última troca do passo anterior)[/]",
+            )
+        return output
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        self.last_swap = j
+        return super().on_swap(i, j)
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = super().on_pass_end(pass_index)
+        if self.swapped and self.last_swap > 1:
+            output.insert(
+                0,
+                f"    [dim]📌 Última troca na posição {self.last_swap}: "
+                f"{self.length - self.last_swap} elementos já estão no lugar[/]",
+            )
+        return output
+
+
+class InsertionShiftRenderer(TraceRenderer):
+    """Narration for the shift-based Insertion Sort events."""
+
+    title = "📍 INSERTION SORT (DESLOCAMENTOS)"
+    description = [
+        "[dim]Variante eficiente: o elemento é guardado como chave e os maiores[/]",
+        "[dim]deslizam uma posição para a direita, sem trocas.[/]",
+    ]
+    show_accesses = True
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.cur_index = 0
+        self.hole = 0
+        self.moves_in_step = 0
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.cur_index = pass_index
+        self.hole = pass_index
+        self.moves_in_step = 0
+
+        output = []
+        output.append(
+            f"[bold blue]🔄 PASSO {pass_index}/{self.length - 1}[/] - Inserindo {self.array[pass_index]} na posição correta"
+        )
+        if pass_index == 1:
+            output.append(
+                "[dim]💡 A posição do elemento fica livre e os maiores deslizam para a direita[/]"
+            )
+        output.append("")
+        return output
+
+    def on_load(self, i: int) -> List[Line]:
+        self.key = self.array[i]
+        return [
+            f"    🔑 Chave: {self.key} (posição {i} fica livre)",
+            self._hole_line("    Array inicial:"),
+            "",
+        ]
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        value = self.array[i]
+
+        output = []
+        output.append(f"    🔍 Comparando {self.key} com {value} (pos {i})")
+        if value > self.key:
+            output.append(
+                f"    [green]✅ {value} > {self.key} → deslocar para a direita![/]"
+            )
+        else:
+            output.append(f"    [red]❌ {value} ≤ {self.key} → posição encontrada![/]")
+            output.append("")
+        return output
+
+    def on_move(self, src: int, dst: int) -> List[Line]:
+        self.move(src, dst)
+        self.hole = src
+        self.moves_in_step += 1
+        return [self._hole_line("    Depois:", moved=dst), ""]
+
+    def on_store(self, i: int) -> List[Line]:
+        self.store(i)
+        self.hole = i
+        return [
+            f"    [blue]📥 Chave {self.key} gravada na posição {i}[/]",
+            self.array_line(
+                "    Array:",
+                [self.cur_index, i],
+                self._create_visual_array_shift,
+                self.array,
+                self.cur_index,
+                -1,
+                i,
+            ),
+        ]
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+        if self.moves_in_step > 0:
+            output.append(
+                f"    [yellow]📍 Elemento {self.key} inserido na posição {self.hole} após {self.moves_in_step} deslocamentos[/]"
+            )
+        else:
+            output.append(
+                f"    [green]✅ Elemento {self.key} já estava na posição correta![/]"
+            )
+
+        if pass_index > 1:
+            output.append(
+                f"    [dim]Primeiros {pass_index + 1} elementos já estão ordenados ✅[/]"
+            )
+
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _hole_line(self, label: str, moved: int = -1) -> Line:
+        return self.array_line(
+            label,
+            [self.cur_index, self.hole, moved],
+            self._create_visual_array_shift,
+            self.array,
+            self.cur_index,
+            self.hole,
+            moved,
+        )
+
+    def _create_visual_array_shift(
+        self,
+        array: List[int],
+        original_pos: int,
+        hole: int,
+        written: int,
+        highlight: int = -1,
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array for the shift-based insertion."""
+        visual_array = []
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if i == written:
+                # Element just written (shifted value or the key)
+                visual_array.append(("bold green on white", val))
+            elif i == hole:
+                # Free position: its value is a stale copy until overwritten
+                visual_array.append(("yellow on blue", val))
+            elif i == highlight:
+                # Element being compared with the key
+                visual_array.append(("magenta on white", val))
+            elif i <= original_pos:
+                # Already sorted portion
+                visual_array.append(("dim green", val))
+            else:
+                # Unsorted portion
+                visual_array.append(("white", val))
+
+        return visual_array
+
+
+class InsertionBinaryRenderer(InsertionShiftRenderer):
+    """Narration for the binary Insertion Sort events."""
+
+    title = "📍 INSERTION SORT (BUSCA BINÁRIA)"
+    description = [
+        "[dim]Variante eficiente: a posição da chave é encontrada por busca binária[/]",
+        "[dim]na parte já ordenada; depois os maiores deslizam para a direita.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.low = 0
+        self.high = 0
+
+    def on_load(self, i: int) -> List[Line]:
+        self.low = 0
+        self.high = i
+        return super().on_load(i)
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        value = self.array[i]
+
+        output = []
+        output.append(
+            f"    🔍 Busca binária em [{self.low}, {self.high}): meio {i} ({value})"
+        )
+        output.append(
+            self.array_line(
+                "    Array:",
+                [self.cur_index, self.hole, i],
+                self._create_visual_array_shift,
+                self.array,
+                self.cur_index,
+                self.hole,
+                -1,
+                i,
+            )
+        )
+        if value <= self.key:
+            self.low = i + 1
+            output.append(f"    [cyan]➡️ {value} ≤ {self.key} → procurar à direita[/]")
+        else:
+            self.high = i
+            output.append(f"    [cyan]⬅️ {value} > {self.key} → procurar à esquerda[/]")
+
+        if self.low == self.high:
+            output.append(f"    [green]🎯 Posição encontrada: {self.low}[/]")
+        output.append("")
+        return output
+
+
+class QuickSortRenderer(TraceRenderer):
+    """Narration for Quick Sort events (Lomuto partition, pivot at the start)."""
+
+    title = "🚀 QUICK SORT"
+    description = [
+        "[dim]O Quick Sort escolhe um pivô, separa os menores[/]",
+        "[dim]à esquerda e os maiores à direita e repete em cada parte.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.pass_index = 0
+        self.lo = 0
+        self.hi = -1
+        self.pivot_value = None
+        self.pivot_pos = None
+        self.partitioning = False
+        # Última posição da parte menor que o pivô e última já comparada
+        self.store = 0
+        self.scanned = 0
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.pass_index = pass_index
+        self.pivot_value = None
+        self.pivot_pos = None
+        self.partitioning = False
+        return []
+
+    def on_range(self, lo: int, hi: int) -> List[Line]:
+        self.lo = lo
+        self.hi = hi
+        self.store = lo
+        self.scanned = lo
+
+        output = []
+        output.append(
+            f"[bold blue]🔄 PARTIÇÃO {self.pass_index + 1}[/] - Posições {lo}..{hi} ({hi - lo + 1} elementos)"
+        )
+        if self.pass_index == 0:
+            output.append(
+                "[dim]💡 Depois de cada partição o pivô está na posição final e as duas partes são ordenadas separadamente[/]"
+            )
+        output.append("")
+        output.append(self._range_line("    Array:"))
+        return output
+
+    def on_pivot(self, i: int) -> List[Line]:
+        self.pivot_value = self.array[i]
+        self.pivot_pos = i
+        return [f"    [yellow]🎯 Pivô escolhido: {self.pivot_value} (pos {i})[/]"]
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        if self.pivot_value is None:
+            # Comparações da mediana de três, antes de o pivô ser escolhido
+            return [
+                f"    🔍 Mediana de três: comparando {self.array[i]} (pos {i}) com {self.array[j]} (pos {j})"
+            ]
+
+        self.partitioning = True
+        self.scanned = i
+        value = self.array[i]
+        output = []
+        output.append(
+            f"    🔍 Comparando {value} (pos {i}) com o pivô {self.pivot_value}"
+        )
+        output.append(self._range_line("    Array:", i))
+        output.extend(self._classify(value))
+        output.append("")
+        return output
+
+    def _classify(self, value: int) -> List[Line]:
+        """Update the partition bounds for the element just compared."""
+        if value < self.pivot_value:
+            self.store += 1
+            return [f"    [green]✅ {value} < {self.pivot_value} → parte menor[/]"]
+        return [f"    [red]❌ {value} ≥ {self.pivot_value} → parte maior[/]"]
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        output = []
+        if not self.partitioning:
+            self.pivot_pos = i
+            output.append(
+                f"    [blue]↪️ Levando o pivô {self.array[j]} para o início (pos {i})[/]"
+            )
+        elif i == self.pivot_pos:
+            self.pivot_pos = j
+            output.append(
+                f"    [blue]📍 Pivô {self.array[i]} vai para a posição {j}, entre as duas partes[/]"
+            )
+        else:
+            output.append(
+                f"    [blue]🔄 Trocando posição {i} ({self.array[i]}) com posição {j} ({self.array[j]})[/]"
+            )
+        self.swap(i, j)
+        output.append(self._range_line("    Depois:", -1, (i, j)))
+        output.append("")
+        return output
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+        output.append(
+            f"    [yellow]📍 Pivô {self.pivot_value} fixado na posição {self.store}: "
+            f"{self.store - self.lo} menores à esquerda, {self.hi - self.store} maiores ou iguais à direita[/]"
+        )
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _range_line(
+        self, label: str, highlight: int = -1, swapped: Tuple[int, ...] = ()
+    ) -> Line:
+        return self.array_line(
+            label,
+            [self.lo, highlight, *swapped],
+            self._create_visual_array_quick,
+            self.array,
+            highlight,
+            swapped,
+        )
+
+    def _region_style(self, i: int) -> str:
+        """Style of a position of the current range by partition region."""
+        if i == self.pivot_pos:
+            return "bold yellow"
+        if self.pivot_pos is not None and self.lo <= i <= self.store:
+            # Menores que o pivô
+            return "cyan"
+        if self.store < i <= self.scanned:
+            # Maiores ou iguais ao pivô
+            return "blue"
+        return "white"
+
+    def _create_visual_array_quick(
+        self,
+        array: List[int],
+        highlight: int,
+        swapped: Tuple[int, ...],
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array for quick sort."""
+        visual_array = []
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if i < self.lo or i > self.hi:
+                # Fora do intervalo da partição
+                visual_array.append(("dim", val))
+            elif i in swapped:
+                # Elements just swapped
+                visual_array.append(("green on white", val))
+            elif i == highlight:
+                # Element being compared with the pivot
+                visual_array.append(("magenta on white", val))
+            else:
+                visual_array.append((self._region_style(i), val))
+
+        return visual_array
+
+
+class QuickThreeWayRenderer(QuickSortRenderer):
+    """Narration for the three-way partition Quick Sort events."""
+
+    title = "🚀 QUICK SORT (PARTIÇÃO EM TRÊS)"
+    description = [
+        "[dim]Variante para entradas com muitas repetições: os iguais ao pivô[/]",
+        "[dim]ficam no meio e não entram em nenhuma das partes seguintes.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        # Menores em lo..lt-1, iguais em lt..scan-1, maiores em gt+1..hi
+        self.lt = 0
+        self.scan = 0
+        self.gt = -1
+
+    def on_range(self, lo: int, hi: int) -> List[Line]:
+        self.lt = lo
+        self.scan = lo + 1
+        self.gt = hi
+        return super().on_range(lo, hi)
+
+    def _classify(self, value: int) -> List[Line]:
+        if value < self.pivot_value:
+            self.lt += 1
+            self.scan += 1
+            return [f"    [green]✅ {value} < {self.pivot_value} → parte menor[/]"]
+        if value > self.pivot_value:
+            self.gt -= 1
+            return [f"    [red]❌ {value} > {self.pivot_value} → parte maior[/]"]
+        self.scan += 1
+        return [f"    [yellow]🟰 {value} = {self.pivot_value} → fica no meio[/]"]
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        if not self.partitioning:
+            return super().on_swap(i, j)
+
+        output = []
+        output.append(
+            f"    [blue]🔄 Trocando posição {i} ({self.array[i]}) com posição {j} ({self.array[j]})[/]"
+        )
+        self.swap(i, j)
+        output.append(self._range_line("    Depois:", -1, (i, j)))
+        output.append("")
+        return output
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+        output.append(
+            f"    [yellow]📍 {self.gt - self.lt + 1} elemento(s) igual(is) ao pivô {self.pivot_value} "
+            f"fixado(s) nas posições {self.lt}..{self.gt}: "
+            f"{self.lt - self.lo} menores à esquerda, {self.hi - self.gt} maiores à direita[/]"
+        )
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _region_style(self, i: int) -> str:
+        if self.pivot_pos is None:
+            return "white"
+        if not self.partitioning:
+            return "bold yellow" if i == self.pivot_pos else "white"
+        if i < self.lt:
+            return "cyan"
+        if i < self.scan:
+            return "bold yellow"
+        if i > self.gt:
+            return "blue"
+        return "white"
+
+
+class MergeSortRenderer(TraceRenderer):
+    """Narration for Merge Sort events (each pass merges two sorted runs)."""
+
+    title = "🔀 MERGE SORT"
+    description = [
+        "[dim]O Merge Sort intercala partes já ordenadas: os elementos vão, em ordem,[/]",
+        "[dim]para um único buffer auxiliar e depois voltam para o array.[/]",
+    ]
+    show_accesses = True
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.pass_index = 0
+        self.runs: List[Tuple[int, int]] = []
+        self.lo = 0
+        self.mid = 0
+        self.hi = -1
+        self.checked = False
+        # Próximo elemento de cada parte e próxima posição livre do auxiliar
+        self.left = 0
+        self.right = 0
+        self.written = 0
+        self.compared = False
+        self.merged = False
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.pass_index = pass_index
+        self.runs = []
+        self.checked = False
+        self.compared = False
+        self.merged = False
+        return []
+
+    def on_range(self, lo: int, hi: int) -> List[Line]:
+        self.runs.append((lo, hi))
+        if len(self.runs) < 2:
+            return []
+
+        (self.lo, self.mid), (_, self.hi) = self.runs
+        self.left = self.lo
+        self.right = self.mid + 1
+        self.written = self.lo
+
+        output = []
+        output.append(
+            f"[bold blue]🔀 INTERCALAÇÃO {self.pass_index + 1}/{self.length - 1}[/] - "
+            f"Posições {self.lo}..{self.mid} com {self.mid + 1}..{self.hi}"
+        )
+        if self.pass_index == 0:
+            output.append(
+                "[dim]💡 Cada intercalação junta duas partes ordenadas numa só[/]"
+            )
+        output.append("")
+        output.append(self._runs_line("    Array:"))
+        return output
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        left_value = self.array[i]
+        right_value = self.array[j]
+
+        if not self.checked:
+            # Primeira comparação: último da esquerda com primeiro da direita
+            self.checked = True
+            if left_value <= right_value:
+                return [
+                    f"    [green]✅ {left_value} ≤ {right_value}: as duas partes já estão em ordem[/]"
+                ]
+            return [f"    🔍 {left_value} > {right_value}: é preciso intercalar"]
+
+        self.compared = True
+        output = []
+        output.append(
+            f"    🔍 Comparando {left_value} (pos {i}) com {right_value} (pos {j})"
+        )
+        output.append(self._runs_line("    Array:", (i, j)))
+        return output
+
+    def on_to_aux(self, src: int, dst: int) -> List[Line]:
+        self.to_aux(src, dst)
+        if src <= self.mid:
+            self.left = src + 1
+        else:
+            self.right = src + 1
+        self.written = dst + 1
+
+        value = self.aux[dst]
+        line = f"    [cyan]📤 {value} (pos {src}) → auxiliar[{dst}][/]"
+        if not self.compared:
+            line += " [dim](resto da esquerda)[/]"
+        self.compared = False
+        return [line]
+
+    def on_from_aux(self, src: int, dst: int) -> List[Line]:
+        self.from_aux(src, dst)
+
+        output = []
+        if dst == self.lo:
+            output.append("")
+            output.append(
+                f"    [blue]📥 Copiando auxiliar[{self.lo}..{self.written - 1}] de volta para o array[/]"
+            )
+            if self.written <= self.hi:
+                output.append(
+                    f"    [dim]Posições {self.written}..{self.hi} já estão no lugar (resto da direita)[/]"
+                )
+        if dst == self.written - 1:
+            self.merged = True
+            output.append(self._runs_line("    Depois:"))
+        return output
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+        output.append(
+            f"    [yellow]📍 Posições {self.lo}..{self.hi} ordenadas ({self.hi - self.lo + 1} elementos)[/]"
+        )
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _runs_line(self, label: str, compared: Tuple[int, ...] = ()) -> Line:
+        return self.array_line(
+            label,
+            list(compared),
+            self._create_visual_array_merge,
+            self.array,
+            compared,
+        )
+
+    def _create_visual_array_merge(
+        self,
+        array: List[int],
+        compared: Tuple[int, ...],
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array for merge sort."""
+        visual_array = []
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if i < self.lo or i > self.hi:
+                # Fora das duas partes intercaladas
+                visual_array.append(("dim", val))
+            elif self.merged:
+                # Result of the merge
+                visual_array.append(("bold green", val))
+            elif i in compared:
+                # Elements being compared
+                visual_array.append(("magenta on white", val))
+            elif i < self.left or self.mid < i < self.right:
+                # Already copied to the auxiliary buffer
+                visual_array.append(("dim cyan", val))
+            elif i <= self.mid:
+                # Left run
+                visual_array.append(("cyan", val))
+            else:
+                # Right run
+                visual_array.append(("blue", val))
+
+        return visual_array
+
+
+class OddEvenSortRenderer(TraceRenderer):
+    """Narration for odd-even transposition sort: one block per phase."""
+
+    title = "⚡ ODD-EVEN TRANSPOSITION SORT"
+    description = [
+        "[dim]Cada fase compara, ao mesmo tempo, todos os pares vizinhos (i, i+1)[/]",
+        "[dim]com i par ou com i ímpar, alternando: é o Bubble Sort em paralelo.[/]",
+    ]
+
+    def __init__(self, input_array: List[int], **options):
+        super().__init__(input_array, **options)
+        self.phase = 0
+        self.start = 0
+        self.pairs = 0
+        self.swapped: List[int] = []
+        # Fases seguidas sem trocas (duas bastam para o array estar ordenado)
+        self.quiet = 0
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.phase = pass_index
+        self.start = pass_index % 2
+        self.pairs = max(0, (self.length - self.start) // 2)
+        self.swapped = []
+
+        parity = "par" if self.start == 0 else "ímpar"
+        output = []
+        output.append(
+            f"[bold blue]⚡ FASE {pass_index + 1}/{self.length}[/] - "
+            f"{self.pairs} pares (i, i+1) com i {parity}"
+        )
+        if pass_index == 0:
+            output.append(
+                "[dim]💡 Os pares de uma fase não se sobrepõem: as comparações são independentes[/]"
+            )
+            output.append(self._phase_line("    Antes:"))
+        return output
+
+    def on_swap(self, i: int, j: int) -> List[Line]:
+        self.swap(i, j)
+        self.swapped.append(i)
+        return []
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        swaps = len(self.swapped)
+        self.quiet = 0 if swaps else self.quiet + 1
+
+        output = []
+        output.append(self._phase_line("    Depois:"))
+        if swaps:
+            pairs = ", ".join(f"({i}, {i + 1})" for i in self.swapped[:8])
+            if swaps > 8:
+                pairs += ", ..."
+            output.append(
+                f"    [green]✅ {self.pairs} comparações e {swaps} trocas num único passo paralelo:[/] {pairs}"
+            )
+        elif self.quiet < 2:
+            output.append("    [yellow]🎉 Nenhuma troca nesta fase[/]")
+        else:
+            output.append(
+                "    [yellow]🎉 Duas fases seguidas sem trocas: todos os vizinhos estão em ordem![/]"
+            )
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _phase_line(self, label: str) -> Line:
+        swapped = [p for i in self.swapped for p in (i, i + 1)]
+        return self.array_line(
+            label,
+            swapped,
+            self._create_visual_array_odd_even,
+            self.array,
+            set(swapped),
+        )
+
+    def _create_visual_array_odd_even(
+        self,
+        array: List[int],
+        swapped: set,
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array with the pairs of the phase."""
+        visual_array = []
+        end = self.start + 2 * self.pairs
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            if i in swapped:
+                # Pair exchanged in this phase
+                visual_array.append(("green on white", val))
+            elif i < self.start or i >= end:
+                # Sem par nesta fase
+                visual_array.append(("dim", val))
+            elif (i - self.start) // 2 % 2 == 0:
+                visual_array.append(("cyan", val))
+            else:
+                visual_array.append(("blue", val))
+
+        return visual_array
+
+
+# Cor de cada worker do Merge Sort paralelo (repetidas a partir do nono)
+WORKER_STYLES = [
+    "cyan",
+    "magenta",
+    "yellow",
+    "blue",
+    "green",
+    "red",
+    "bright_cyan",
+    "bright_magenta",
+]
+
+
+class ParallelMergeSortRenderer(TraceRenderer):
+    """Narration for the parallel Merge Sort: one pass per worker, then a k-way merge.
+
+    The first ``RANGE`` of a pass is its segment: a worker's run, or the whole
+    array for the final merge, whose next ``RANGE`` events are the runs being
+    merged. The merges inside a worker are not narrated one by one.
+
+    ``chunks`` is the number of runs the array was split into (see
+    ``chunk_bounds``): a renderer restored in the middle of the run takes the
+    runs of the workers it did not see from it.
+    """
+
+    title = "🔀 MERGE SORT PARALELO"
+    description = [
+        "[dim]Cada worker (um processo) ordena o seu trecho do array com o Merge Sort,[/]",
+        "[dim]todos ao mesmo tempo; no fim, uma intercalação de k vias junta os trechos.[/]",
+    ]
+    show_accesses = True
+
+    def __init__(self, input_array: List[int], chunks: Optional[int] = None, **options):
+        super().__init__(input_array, **options)
+        if chunks is None:
+            # A mesma divisão do visualizador padrão para este tamanho
+            from .algorithms import ParallelMergeSortVisualizer
+
+            chunks = ParallelMergeSortVisualizer().chunk_count(self.length)
+        self.chunks = chunks
+        self.pass_index = 0
+        # Trechos (lo, hi) vistos até aqui, na ordem dos workers
+        self.segments: List[Tuple[int, int]] = []
+        self.segment: Optional[Tuple[int, int]] = None
+        self.final = False
+        # Intercalação final: próximo elemento de cada trecho
+        self.heads: List[int] = []
+        self.written = 0
+        self.taken = -1
+        self.shown_runs = False
+        self.merged = False
+        self._counts = (0, 0)
+
+    def on_pass_start(self, pass_index: int) -> List[Line]:
+        self.pass_index = pass_index
+        self.segment = None
+        self.final = False
+        self.taken = -1
+        self.merged = False
+        self._counts = (self.comparisons, self.moves)
+        return []
+
+    def on_range(self, lo: int, hi: int) -> List[Line]:
+        if self.segment is None:
+            self.segment = (lo, hi)
+            self.final = self.pass_index > 0 and (lo, hi) == (0, self.length - 1)
+            return self._final_start() if self.final else self._worker_start(lo, hi)
+        if not self.final:
+            # Intercalações internas de um worker
+            return []
+
+        worker = len(self.segments)
+        self.segments.append((lo, hi))
+        self.heads.append(lo)
+        style = self._worker_style(worker)
+        return [
+            f"    [{style}]👷 Worker {worker + 1}:[/] posições {lo}..{hi} ({hi - lo + 1} elementos)"
+        ]
+
+    def _worker_start(self, lo: int, hi: int) -> List[Line]:
+        worker = self.pass_index
+        if worker == 0:
+            self.segments = []
+        elif len(self.segments) != worker:
+            # Restaurado no meio da execução (seek): os trechos dos workers
+            # anteriores não foram vistos, mas vêm da mesma divisão
+            from .algorithms import chunk_bounds
+
+            self.segments = chunk_bounds(self.length, self.chunks)[:worker]
+        self.segments.append((lo, hi))
+
+        output = []
+        output.append(
+            f"[bold blue]👷 WORKER {worker + 1}[/] - "
+            f"ordena as posições {lo}..{hi} ({hi - lo + 1} elementos)"
+        )
+        if worker == 0:
+            output.append(
+                "[dim]💡 Os workers rodam em paralelo; aqui eles aparecem um depois do outro[/]"
+            )
+        output.append("")
+        output.append(self._segments_line("    Antes:"))
+        return output
+
+    def _final_start(self) -> List[Line]:
+        self.segments = []
+        self.heads = []
+        self.written = 0
+        self.shown_runs = False
+
+        output = []
+        output.append(
+            f"[bold blue]🔀 INTERCALAÇÃO DE {self.pass_index} VIAS[/] - "
+            "um torneio escolhe a menor cabeça entre os trechos"
+        )
+        output.append(
+            "[dim]💡 Cada elemento custa ⌈log₂ k⌉ comparações no torneio, não k − 1[/]"
+        )
+        output.append("")
+        return output
+
+    def _show_runs(self) -> List[Line]:
+        if self.shown_runs:
+            return []
+        self.shown_runs = True
+        return [self._segments_line("    Trechos:"), ""]
+
+    def on_compare(self, i: int, j: int) -> List[Line]:
+        if self.final:
+            return self._show_runs()
+        return []
+
+    def on_to_aux(self, src: int, dst: int) -> List[Line]:
+        self.to_aux(src, dst)
+        if not self.final:
+            return []
+
+        output = self._show_runs()
+        worker = self._owner(src)
+        self.heads[worker] = src + 1
+        self.written = dst + 1
+        self.taken = src
+
+        matches = self.comparisons - self._counts[0]
+        self._counts = (self.comparisons, self._counts[1])
+        style = self._worker_style(worker)
+        output.append(
+            f"    [{style}]📤 {self.aux[dst]} (worker {worker + 1}, pos {src})[/] → auxiliar[{dst}]"
+            f" [dim]({matches} {'comparação' if matches == 1 else 'comparações'} no torneio)[/]"
+        )
+        return output
+
+    def on_from_aux(self, src: int, dst: int) -> List[Line]:
+        self.from_aux(src, dst)
+        if not self.final:
+            return []
+
+        output = []
+        if dst == 0:
+            output.append("")
+            output.append(
+                f"    [blue]📥 Copiando auxiliar[0..{self.written - 1}] de volta para o array[/]"
+            )
+            if self.written < self.length:
+                output.append(
+                    f"    [dim]Posições {self.written}..{self.length - 1} já estão no lugar "
+                    "(resto do último trecho)[/]"
+                )
+        if dst == self.written - 1:
+            self.merged = True
+            self.taken = -1
+            output.append(self._segments_line("    Depois:"))
+        return output
+
+    def on_pass_end(self, pass_index: int) -> List[Line]:
+        output = []
+        if self.final:
+            output.append(
+                f"    [yellow]📍 Array inteiro ordenado a partir de {len(self.segments)} trechos[/]"
+            )
+        elif self.segment is not None:
+            comparisons, moves = self._counts
+            output.append(self._segments_line("    Depois:"))
+            output.append(
+                f"    [green]✅ Worker {pass_index + 1}: trecho ordenado com "
+                f"{self.comparisons - comparisons} comparações e "
+                f"{self.moves - moves} deslocamentos[/]"
+            )
+        output.append("─" * 40)
+        output.append("")
+        return output
+
+    def _owner(self, i: int) -> int:
+        """Index of the segment that contains position ``i`` (-1 if none)."""
+        return bisect_right([lo for lo, _ in self.segments], i) - 1
+
+    def _worker_style(self, worker: int) -> str:
+        return WORKER_STYLES[worker % len(WORKER_STYLES)]
+
+    def _segments_line(self, label: str) -> Line:
+        highlights = [self.taken] if self.taken >= 0 else []
+        return self.array_line(
+            label,
+            highlights,
+            self._create_visual_array_parallel,
+            self.array,
+        )
+
+    def _create_visual_array_parallel(
+        self,
+        array: List[int],
+        positions: List[int] = None,
+    ) -> List[Cell]:
+        """Create visual representation of array colored by worker."""
+        visual_array = []
+        starts = [lo for lo, _ in self.segments]
+
+        for i in range(len(array)) if positions is None else positions:
+            val = array[i]
+            worker = bisect_right(starts, i) - 1
+            if self.merged:
+                # Result of the final merge
+                visual_array.append(("bold green", val))
+            elif worker < 0 or i > self.segments[worker][1]:
+                # Trecho de um worker que ainda não começou
+                visual_array.append(("dim", val))
+            elif i == self.taken:
+                # Head just moved to the auxiliary buffer
+                visual_array.append(("green on white", val))
+            elif self.final and i < self.heads[worker]:
+                # Already in the auxiliary buffer
+                visual_array.append(("dim", val))
+            elif not self.final and worker == len(self.segments) - 1:
+                # Segment of the current worker
+                visual_array.append((f"bold {self._worker_style(worker)}", val))
+            else:
+                visual_array.append((self._worker_style(worker), val))
+
+        return visual_array
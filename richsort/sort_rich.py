@@ -1,6 +1,11 @@
+import argparse
+import os
+import select
 import sys
+import time
+from collections import deque
 from time import sleep
-from typing import Any, Dict, List
+from typing import Iterable, List, Optional
 
 from rich.align import Align
 from rich.console import Console
@@ -10,22 +15,193 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from .algorithms import get_algorithm_visualizer, get_available_algorithms
-from .test_cases import get_test_cases
+from .buffers import format_values
+from .cache import sort_complete_cached, trace_cache
+from .checkpoints import CheckpointedTrace
+from .profiling import Profiler
+from .registry import get_algorithm_visualizer, get_available_algorithms
+from .renderers import OUTPUT_MAX_LINES, budget_options
+from .test_cases import GENERATED_SIZE, array_preview, get_test_cases
 
 console = Console()
 
+# Lotes do modo streaming: imprime ao atingir o número de linhas ou o intervalo
+STREAM_BATCH_LINES = 200
+STREAM_BATCH_INTERVAL = 0.05
+
+
+def stream_lines(
+    lines: Iterable[str],
+    batch_lines: int = STREAM_BATCH_LINES,
+    interval: float = STREAM_BATCH_INTERVAL,
+    profiler: Optional[Profiler] = None,
+) -> int:
+    """Imprime as linhas conforme são produzidas, em lotes, com memória constante"""
+    batch = []
+    count = 0
+    # A primeira linha é impressa imediatamente
+    last_flush = 0.0
+
+    for line in lines:
+        batch.append(line)
+        now = time.monotonic()
+        if len(batch) >= batch_lines or now - last_flush >= interval:
+            _print_batch(batch, profiler)
+            count += len(batch)
+            batch = []
+            last_flush = now
+
+    if batch:
+        _print_batch(batch, profiler)
+        count += len(batch)
+
+    return count
+
+
+def _print_batch(batch: List, profiler: Optional[Profiler] = None) -> None:
+    """Imprime um lote de linhas (markup ou rich.text.Text) e descarrega a saída"""
+    if profiler is None:
+        console.print(_join_lines(batch))
+        console.file.flush()
+        return
+
+    with profiler.phase("join"):
+        text = _join_lines(batch)
+    with profiler.phase("display"):
+        console.print(text)
+        console.file.flush()
+
+
+def _join_lines(batch: List):
+    if isinstance(batch[0], Text):
+        return Text("\n").join(batch)
+    return "\n".join(batch)
+
+
+# Teto do markup guardado durante o streaming: saídas maiores só são impressas,
+# para a memória continuar constante (o cache aceita até 64 MB)
+STREAM_RECORD_MAX_BYTES = 1024 * 1024
+
+
+class MarkupRecorder:
+    """
+    Keep the markup of streamed lines, to store the output in the trace cache.
+
+    Recording stops, and what was kept is dropped, once the markup passes
+    ``max_bytes``; the lines are still passed through.
+    """
+
+    def __init__(self, max_bytes: int = STREAM_RECORD_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.lines: Optional[List[str]] = []
+
+    def record(self, lines: Iterable) -> Iterable:
+        """Pass ``lines`` through unchanged, keeping the markup of each one."""
+        for line in lines:
+            if self.lines is not None:
+                markup = line.markup if isinstance(line, Text) else line
+                self.size += len(markup) + 1
+                if self.size > self.max_bytes:
+                    self.lines = None
+                else:
+                    self.lines.append(markup)
+            yield line
+
+    def output(self) -> Optional[str]:
+        """The whole output, as ``sort_complete`` gives it, or None past the cap."""
+        if self.lines is None:
+            return None
+        return "\n".join(self.lines)
+
+
+# Reprodução animada: velocidade inicial (passos/s), limites e taxa máxima de quadros
+PLAYBACK_SPEED = 4.0
+PLAYBACK_MIN_SPEED = 0.25
+PLAYBACK_MAX_SPEED = 100_000.0
+PLAYBACK_MAX_FPS = 20
+# Máximo de passos processados entre dois quadros, para não acumular atraso
+PLAYBACK_MAX_STEPS_PER_FRAME = 5_000
+
+
+class KeyReader:
+    """Lê teclas sem bloquear enquanto a animação roda"""
 
-class SortTUI:
     def __init__(self):
+        self._fd = None
+        self._old_settings = None
+
+    def __enter__(self):
+        if os.name != "nt" and sys.stdin.isatty():
+            import termios
+            import tty
+
+            self._fd = sys.stdin.fileno()
+            self._old_settings = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._old_settings is not None:
+            import termios
+
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._old_settings)
+
+    @property
+    def interactive(self) -> bool:
+        return os.name == "nt" or self._fd is not None
+
+    def read(self) -> str:
+        """Retorna as teclas pressionadas desde a última leitura"""
+        if os.name == "nt":
+            import msvcrt
+
+            keys = []
+            while msvcrt.kbhit():
+                keys.append(msvcrt.getwch())
+            return "".join(keys)
+
+        if self._fd is None:
+            return ""
+
+        keys = ""
+        while select.select([self._fd], [], [], 0)[0]:
+            keys += os.read(self._fd, 32).decode(errors="ignore")
+        # Setas: direita avança um evento, esquerda volta um
+        return keys.replace("\x1b[C", "n").replace("\x1b[D", "b")
+
+
+class SortTUI:
+    def __init__(
+        self,
+        streaming: bool = True,
+        profile: bool = False,
+        max_lines: Optional[int] = OUTPUT_MAX_LINES,
+        size: int = GENERATED_SIZE,
+        seed: int = 0,
+    ):
         self.algorithms = get_available_algorithms()
-        self.test_cases = get_test_cases()
+        # Os casos gerados só montam o array quando são executados
+        self.test_cases = get_test_cases(size, seed)
+        self.streaming = streaming
+        # Com --profile, acumula o tempo de cada fase de todas as execuções
+        self.profiler = Profiler() if profile else None
+        # Orçamento de saída: acima dele a narração vira um resumo por passo.
+        # Sem linhas delta: a tela mostra cada linha do array inteira
+        self.output_options = budget_options(max_lines, delta=False)
 
         self.selected_algorithm = 0
         self.selected_test_case = 0
         self.current_step = 0
+        # Durante a reprodução: janela com as linhas mais recentes da execução
         self.sort_steps = []
         self.is_running = False
+        self.is_finished = False
+        self.speed = PLAYBACK_SPEED
+        self.dropped_frames = 0
+        self.total_steps = 0
+        # Dígitos digitados para "ir para o evento N" (G) ou "ir para o passo N" (P)
+        self.seek_input = ""
 
     def create_layout(self):
         """Cria o layout da TUI"""
@@ -65,8 +241,9 @@ class SortTUI:
     def render_footer(self):
         """Renderiza o rodapé com comandos"""
         commands = (
-            "[yellow]↑↓[/] Navegar | [yellow]Tab[/] Trocar painel | "
-            "[yellow]Enter[/] Executar | [yellow]Space[/] Pausar/Continuar | [yellow]R[/] Reset | [yellow]Q[/] Sair"
+            "[yellow]Espaço[/] Pausar | [yellow]N/→ B/←[/] Evento | "
+            "[yellow][ ][/] Passo | [yellow]Nº+G/P[/] Ir para evento/passo | "
+            "[yellow]E[/] Fim | [yellow]+/-[/] Velocidade | [yellow]Q[/] Sair"
         )
         return Panel(Align.center(commands), style="green")
 
@@ -100,7 +277,7 @@ class SortTUI:
             if i == self.selected_test_case:
                 table.add_row(f"► [bold yellow]{test_case['name']}[/]")
                 table.add_row(f"   [dim]{test_case['description']}[/]")
-                table.add_row(f"   [cyan]Array: {test_case['array']}[/]")
+                table.add_row(f"   [cyan]Array: {array_preview(test_case)}[/]")
             else:
                 table.add_row(f"  [white]{test_case['name']}[/]")
 
@@ -127,18 +304,20 @@ class SortTUI:
                 border_style="magenta",
             )
 
-        # Se temos passos, mostra o passo atual
-        if self.current_step < len(self.sort_steps):
-            step_data = self.sort_steps[self.current_step]
-            content = step_data["content"]
-        else:
-            content = "Execução concluída!"
+        # Se temos passos, mostra as linhas mais recentes da reprodução
+        content = Text("\n", overflow="crop", no_wrap=True).join(self.sort_steps)
 
-        progress = (
-            f"Passo {self.current_step + 1}/{len(self.sort_steps)}"
-            if self.sort_steps
-            else ""
-        )
+        if self.is_finished:
+            status = "✅ Concluído"
+        elif self.is_running:
+            status = f"▶ {self.speed:g} passos/s"
+        else:
+            status = "⏸ Pausado"
+        progress = f"Evento {self.current_step}/{self.total_steps} | {status}"
+        if self.dropped_frames:
+            progress += f" | {self.dropped_frames} quadros pulados"
+        if self.seek_input:
+            progress += f" | Ir para: {self.seek_input}_"
 
         return Panel(
             content,
@@ -146,6 +325,14 @@ class SortTUI:
             border_style="magenta",
         )
 
+    def update_layout(self, layout: Layout) -> None:
+        """Atualiza todos os painéis do layout"""
+        layout["header"].update(self.render_header())
+        layout["footer"].update(self.render_footer())
+        layout["algorithms"].update(self.render_algorithms_panel())
+        layout["test_cases"].update(self.render_test_cases_panel())
+        layout["right"].update(self.render_main_panel())
+
     def run(self):
         """Executa a TUI"""
         self.selected_panel = "algorithms"
@@ -166,7 +353,7 @@ class SortTUI:
                 f"[bold]Caso de teste selecionado:[/] {self.test_cases[self.selected_test_case]['name']}"
             )
             console.print(
-                f"[dim]Array: {self.test_cases[self.selected_test_case]['array']}[/]"
+                f"[dim]Array: {array_preview(self.test_cases[self.selected_test_case])}[/]"
             )
             console.print("─" * 80)
 
@@ -175,9 +362,10 @@ class SortTUI:
             console.print("1. Mudar algoritmo")
             console.print("2. Mudar caso de teste")
             console.print("3. Executar algoritmo")
-            console.print("4. Sair")
+            console.print("4. Reproduzir passo a passo (animado)")
+            console.print("5. Sair")
 
-            choice = input("\nSua escolha (1-4): ").strip()
+            choice = input("\nSua escolha (1-5): ").strip()
 
             if choice == "1":
                 self.select_algorithm()
@@ -186,6 +374,8 @@ class SortTUI:
             elif choice == "3":
                 self.execute_algorithm()
             elif choice == "4":
+                self.play_algorithm()
+            elif choice == "5":
                 console.print("[bold green]👋 Obrigado por usar o RichSort![/]")
                 break
             else:
@@ -227,7 +417,7 @@ class SortTUI:
             marker = "►" if i == self.selected_test_case else " "
             console.print(f"{marker} {i + 1}. {test_case['name']}")
             console.print(f"   {test_case['description']}")
-            console.print(f"   Array: {test_case['array']}\n")
+            console.print(f"   Array: {array_preview(test_case)}\n")
 
         try:
             choice = int(input("Escolha um caso de teste (número): ")) - 1
@@ -258,31 +448,308 @@ class SortTUI:
             f"[yellow]Caso de teste:[/] {self.test_cases[self.selected_test_case]['name']}"
         )
         console.print(
-            f"[yellow]Array inicial:[/] {self.test_cases[self.selected_test_case]['array']}\n"
+            f"[yellow]Array inicial:[/] {array_preview(self.test_cases[self.selected_test_case])}\n"
         )
 
         # Execute algorithm using the shared algorithm module
         algorithm_id = self.algorithms[self.selected_algorithm]["id"]
+        input_array = self.test_cases[self.selected_test_case]["array"]
         try:
-            visualizer = get_algorithm_visualizer(algorithm_id)
-            output = visualizer.sort_complete(
-                self.test_cases[self.selected_test_case]["array"]
-            )
-            console.print(output)
+            if self.streaming:
+                # Imprime enquanto o algoritmo executa, sem montar a saída inteira
+                key = trace_cache.make_key(
+                    algorithm_id, input_array, **self.output_options
+                )
+                cached = trace_cache.get(key)
+                if cached is not None:
+                    self._print(cached)
+                else:
+                    visualizer = self._get_visualizer(algorithm_id)
+                    # Guarda a saída no cache ao terminar, se for pequena
+                    recorder = MarkupRecorder()
+                    stream_lines(
+                        recorder.record(
+                            visualizer.render_lines(
+                                input_array, backend="text", **self.output_options
+                            )
+                        ),
+                        profiler=self.profiler,
+                    )
+                    output = recorder.output()
+                    if output is not None:
+                        trace_cache.put(key, output)
+            else:
+                self._print(
+                    sort_complete_cached(
+                        algorithm_id,
+                        input_array,
+                        self.profiler,
+                        **self.output_options,
+                    )
+                )
         except (ValueError, NotImplementedError) as e:
             console.print(f"[red]Erro: {str(e)}[/]")
 
         input("\n\nPressione Enter para voltar ao menu principal...")
 
+    def play_algorithm(self, max_fps: int = PLAYBACK_MAX_FPS):
+        """Reproduz a execução passo a passo com animação (rich.live.Live)
 
-def main():
+        Cada evento do algoritmo é um passo. Os passos avançam de acordo com o
+        tempo decorrido e a velocidade escolhida, mas a tela é redesenhada no
+        máximo ``max_fps`` vezes por segundo: quando o terminal não acompanha,
+        os quadros intermediários são pulados em vez de acumular atraso. Só
+        esses contam em ``dropped_frames``: avançar vários passos num quadro,
+        em velocidades altas, não é um quadro perdido.
+
+        A execução é gravada antes com snapshots periódicos
+        (``CheckpointedTrace``), então saltar para qualquer evento ou passo
+        custa o mesmo no início e no fim de um trace com milhões de eventos.
+        """
+        if not self.algorithms[self.selected_algorithm]["implemented"]:
+            console.print("[red]Este algoritmo ainda não foi implementado![/]")
+            input("Pressione Enter para continuar...")
+            return
+
+        algorithm_id = self.algorithms[self.selected_algorithm]["id"]
+        input_array = self.test_cases[self.selected_test_case]["array"]
+        try:
+            visualizer = self._get_visualizer(algorithm_id)
+        except (ValueError, NotImplementedError) as e:
+            console.print(f"[red]Erro: {str(e)}[/]")
+            input("Pressione Enter para continuar...")
+            return
+
+        with console.status("Gravando a execução..."):
+            trace = CheckpointedTrace.from_events(
+                input_array, visualizer.iter_events(input_array)
+            )
+
+        # Linhas já estilizadas: cada quadro é montado sem reprocessar markup
+        renderer = visualizer.new_renderer(input_array, backend="text", delta=False)
+
+        # Só as linhas que cabem no painel principal ficam em memória
+        window = max(5, console.size.height - 8)
+        self.sort_steps = deque(renderer.header(), maxlen=window)
+        self.current_step = 0
+        self.total_steps = len(trace)
+        self.is_running = True
+        self.is_finished = False
+        self.dropped_frames = 0
+        self.seek_input = ""
+
+        layout = self.create_layout()
+        frame_interval = 1 / max_fps
+        pending = 0.0
+
+        with KeyReader() as keys, Live(
+            layout, console=console, auto_refresh=False, screen=True
+        ) as live:
+            self._refresh(live, layout)
+            last_time = time.monotonic()
+            # Instante em que o próximo quadro deveria começar
+            deadline = last_time + frame_interval
+
+            while True:
+                steps = 0
+                pressed = keys.read()
+                if "q" in pressed.lower():
+                    break
+                if " " in pressed:
+                    self.is_running = not self.is_running
+                if "n" in pressed.lower() and not self.is_running:
+                    steps += pressed.lower().count("n")
+                for key in pressed:
+                    if key in "+=":
+                        self.speed = min(self.speed * 2, PLAYBACK_MAX_SPEED)
+                    elif key in "-_":
+                        self.speed = max(self.speed / 2, PLAYBACK_MIN_SPEED)
+                    else:
+                        target = self._seek_target(key.lower(), trace)
+                        if target is not None:
+                            renderer = self._seek(visualizer, trace, target)
+                            steps = 0
+
+                now = time.monotonic()
+                late = now - deadline
+                if late >= frame_interval:
+                    # O quadro anterior passou do prazo: os quadros que
+                    # caberiam nesse atraso não foram desenhados
+                    self.dropped_frames += int(late / frame_interval)
+                deadline = now + frame_interval
+
+                if self.is_running and not self.is_finished:
+                    pending = min(
+                        pending + (now - last_time) * self.speed,
+                        PLAYBACK_MAX_STEPS_PER_FRAME,
+                    )
+                    steps += int(pending)
+                    pending -= int(pending)
+                last_time = now
+
+                for _ in range(steps):
+                    if not self._advance(renderer, trace):
+                        break
+
+                if steps or pressed:
+                    self._refresh(live, layout)
+
+                if self.is_finished and not keys.interactive:
+                    break
+
+                # Dorme até o próximo quadro, descontando o tempo já gasto
+                sleep(max(0.0, frame_interval - (time.monotonic() - now)))
+
+        self.sort_steps = []
+
+    def _get_visualizer(self, algorithm_id: str):
+        """Cria o visualizador, ligando o profiler quando ``--profile`` está ativo"""
+        visualizer = get_algorithm_visualizer(algorithm_id)
+        if self.profiler is not None:
+            visualizer.enable_profiling(self.profiler)
+        return visualizer
+
+    def _print(self, output: str) -> None:
+        """Imprime uma saída completa, medindo a exibição com ``--profile``"""
+        if self.profiler is None:
+            console.print(output)
+            return
+        with self.profiler.phase("display"):
+            console.print(output)
+
+    def _refresh(self, live: Live, layout: Layout) -> None:
+        """Redesenha um quadro da reprodução animada"""
+        if self.profiler is None:
+            self.update_layout(layout)
+            live.refresh()
+            return
+        with self.profiler.phase("display"):
+            self.update_layout(layout)
+            live.refresh()
+        self.profiler.count("frames")
+
+    def _advance(self, renderer, trace: CheckpointedTrace) -> bool:
+        """Processa um evento; retorna False quando a execução termina"""
+        if self.is_finished:
+            return False
+
+        if self.current_step >= len(trace):
+            self.sort_steps.extend(renderer.footer())
+            self.is_finished = True
+            self.is_running = False
+            return False
+
+        self.sort_steps.extend(renderer.feed(trace[self.current_step]))
+        self.current_step += 1
+        return True
+
+    def _seek_target(self, key: str, trace: CheckpointedTrace):
+        """Interpreta uma tecla de navegação; retorna o evento de destino ou None"""
+        if key.isdigit():
+            self.seek_input += key
+            return None
+
+        number = int(self.seek_input) if self.seek_input else None
+        self.seek_input = ""
+
+        if key == "g":
+            return 0 if number is None else number
+        if key == "p":
+            # Passos numerados a partir de 1, como na narração
+            if not trace.pass_count:
+                return 0
+            number = 1 if number is None else number
+            return trace.pass_step(max(0, min(number, trace.pass_count) - 1))
+        if key == "e":
+            return len(trace)
+        if key == "b":
+            return self.current_step - 1
+        if key == "[":
+            # Volta ao início do passo atual, ou do anterior se já estiver nele
+            pass_number = trace.pass_at(self.current_step - 1)
+            return trace.pass_step(pass_number) if pass_number >= 0 else 0
+        if key == "]":
+            pass_number = trace.pass_at(self.current_step) + 1
+            if pass_number < trace.pass_count:
+                return trace.pass_step(pass_number)
+            return len(trace)
+        return None
+
+    def _seek(self, visualizer, trace: CheckpointedTrace, step: int):
+        """Salta para o evento ``step``; retorna o renderer posicionado nele"""
+        step = trace.clamp(step)
+        renderer = trace.renderer_at(
+            step, visualizer.renderer_class, backend="text", delta=False
+        )
+        if self.profiler is not None:
+            renderer.attach_profiler(self.profiler)
+
+        self.sort_steps.clear()
+        self.sort_steps.append(
+            Text.from_markup(
+                f"[bold magenta]⏩ Evento {step}/{len(trace)}[/] - "
+                f"Estado atual: {format_values(renderer.array)}"
+            )
+        )
+        self.sort_steps.append(Text(""))
+        self.current_step = step
+        self.is_finished = False
+        if step == len(trace):
+            self._advance(renderer, trace)
+        return renderer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="richsort",
+        description="Visualizador de algoritmos de ordenação com Rich.",
+    )
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="monta a saída inteira antes de imprimir (usa o cache de execuções)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="mede o tempo de cada fase e mostra um resumo ao sair",
+    )
+    parser.add_argument(
+        "--max-lines",
+        type=int,
+        default=OUTPUT_MAX_LINES,
+        help="linhas de narração antes de resumir por passo (0 = sem limite)",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=GENERATED_SIZE,
+        help="tamanho dos casos de teste gerados (0 = só os casos fixos)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="semente dos casos de teste gerados"
+    )
+    return parser
+
+
+def main(argv: List[str] = None):
     """Entry point for the Rich-based TUI application."""
+    args = build_parser().parse_args(argv)
+    tui = SortTUI(
+        streaming=not args.no_stream,
+        profile=args.profile,
+        max_lines=args.max_lines,
+        size=args.size,
+        seed=args.seed,
+    )
     try:
-        tui = SortTUI()
         tui.run()
     except KeyboardInterrupt:
         console.print("\n[bold green]👋 Obrigado por usar o RichSort![/]")
         sys.exit(0)
+    finally:
+        if tui.profiler is not None:
+            console.print(tui.profiler.summary_table())
 
 
 if __name__ == "__main__":
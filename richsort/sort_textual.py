@@ -1,65 +1,241 @@
+import argparse
 import sys
-from typing import List
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional
 
 from rich.console import Console
-from textual import on
+from rich.errors import MarkupError
+from rich.text import Text
+from textual import on, work
+from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Horizontal, ScrollableContainer, Vertical
+from textual.cache import LRUCache
+from textual.containers import Container, Horizontal, Vertical
+from textual.geometry import Size
+from textual.message import Message
 from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.widgets import Footer, Header, ListItem, ListView, Static
+from textual.worker import Worker, get_current_worker
 
-from .algorithms import get_algorithm_visualizer, get_available_algorithms
-from .test_cases import get_test_cases
+from .cache import trace_cache
+from .checkpoints import CheckpointedTrace, LineIndex
+from .profiling import Profiler
+from .race import RACE_TICK, Race, default_events_per_tick
+from .registry import get_algorithm_visualizer, get_available_algorithms
+from .renderers import OUTPUT_MAX_LINES, budget_options
+from .test_cases import GENERATED_SIZE, array_preview, get_test_cases
 
 console = Console()
 
 
+# Caracteres das barras dos gráficos da corrida, de 0 a 8 oitavos
+BAR_EIGHTHS = " ▁▂▃▄▅▆▇█"
+
+
 class AlgorithmList(ListView):
     """Widget for displaying and selecting sorting algorithms."""
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.algorithms = get_available_algorithms()
+        # Ids marcados para a corrida, na ordem em que foram marcados
+        self.marked: List[str] = []
 
     def compose(self) -> ComposeResult:
         for algo in self.algorithms:
-            if algo["implemented"]:
-                yield ListItem(Static(algo["name"]), name=algo["id"])
-            else:
-                yield ListItem(
-                    Static(f"[dim]{algo['name']} (Em breve)[/]"), name=algo["id"]
-                )
+            yield ListItem(Static(self._label(algo)), name=algo["id"])
+
+    def _label(self, algo: Dict[str, Any]) -> str:
+        if not algo["implemented"]:
+            return f"[dim]{algo['name']} (Em breve)[/]"
+        if algo["id"] in self.marked:
+            return f"🏁 {algo['name']}"
+        return algo["name"]
+
+    def toggle_mark(self, index: int) -> bool:
+        """Mark or unmark the algorithm at ``index`` for a race; True if now marked."""
+        algo = self.algorithms[index]
+        if algo["id"] in self.marked:
+            self.marked.remove(algo["id"])
+        else:
+            self.marked.append(algo["id"])
+        self.children[index].query_one(Static).update(self._label(algo))
+        return algo["id"] in self.marked
 
 
 class TestCaseList(ListView):
     """Widget for displaying and selecting test cases."""
 
-    def __init__(self, **kwargs):
+    def __init__(self, size: int = GENERATED_SIZE, seed: int = 0, **kwargs):
         super().__init__(**kwargs)
-        self.test_cases = get_test_cases()
+        # Os casos gerados só montam o array quando são executados
+        self.test_cases = get_test_cases(size, seed)
 
     def compose(self) -> ComposeResult:
         for i, test_case in enumerate(self.test_cases):
-            content = f"{test_case['name']}\n[dim]{test_case['description']}[/]\n[cyan]Array: {test_case['array']}[/]"
+            content = f"{test_case['name']}\n[dim]{test_case['description']}[/]\n[cyan]Array: {array_preview(test_case)}[/]"
             yield ListItem(Static(content), name=f"test_{i}")
 
 
-class ExecutionPanel(ScrollableContainer):
+class TraceView(ScrollView):
+    """Virtualized view over a Rich-markup trace of any length.
+
+    The trace is stored as text chunks plus an index of line offsets. Only the
+    lines inside the viewport are parsed and rendered (with a small cache), so
+    scrolling costs the same for a 10-line trace and for a 100k-line one.
+    Every line must be self-contained markup (tags opened and closed on it).
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._chunks: List[str] = []
+        self._line_chunks = array("I")
+        self._line_offsets = array("I")
+        self._max_width = 0
+        self._strip_cache: LRUCache[int, Strip] = LRUCache(1024)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the trace."""
+        return len(self._line_offsets)
+
+    def clear(self) -> None:
+        """Remove the whole trace."""
+        self._chunks.clear()
+        self._line_chunks = array("I")
+        self._line_offsets = array("I")
+        self._max_width = 0
+        self._strip_cache.clear()
+        self.virtual_size = Size(0, 0)
+        self.refresh()
+
+    def set_trace(self, text: str) -> None:
+        """Replace the trace with ``text``."""
+        self.clear()
+        self.append_text(text)
+
+    def append_text(self, text: str) -> None:
+        """Append one or more lines of markup to the end of the trace."""
+        chunk_index = len(self._chunks)
+        self._chunks.append(text)
+
+        # Index the start of every line; the width is an upper bound
+        # because it still counts the markup tags.
+        start = 0
+        while True:
+            self._line_chunks.append(chunk_index)
+            self._line_offsets.append(start)
+            end = text.find("\n", start)
+            if end == -1:
+                self._max_width = max(self._max_width, len(text) - start)
+                break
+            self._max_width = max(self._max_width, end - start)
+            start = end + 1
+
+        self.virtual_size = Size(self._max_width, self.line_count)
+        self.refresh()
+
+    def get_line(self, index: int) -> str:
+        """Return the raw markup of the line at ``index``."""
+        chunk = self._chunks[self._line_chunks[index]]
+        start = self._line_offsets[index]
+        end = chunk.find("\n", start)
+        return chunk[start:] if end == -1 else chunk[start:end]
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._strip_cache.clear()
+
+    def render_line(self, y: int) -> Strip:
+        """Render only the requested line of the viewport."""
+        profiler = getattr(self.app, "profiler", None)
+        if profiler is None:
+            return self._render_line(y)
+        start = time.perf_counter()
+        strip = self._render_line(y)
+        profiler.add("display", time.perf_counter() - start)
+        return strip
+
+    def _render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.size.width
+        rich_style = self.rich_style
+
+        if index >= self.line_count:
+            return Strip.blank(width, rich_style)
+
+        strip = self._strip_cache.get(index)
+        if strip is None:
+            line = self.get_line(index)
+            try:
+                text = Text.from_markup(line, style=rich_style, end="")
+            except MarkupError:
+                # Cada linha precisa fechar suas próprias tags; se não fechar,
+                # mostramos o texto cru em vez de quebrar a renderização
+                text = Text(line, style=rich_style, end="")
+            text.no_wrap = True
+            strip = Strip(text.render(self.app.console), text.cell_len)
+            self._strip_cache[index] = strip
+
+        strip = strip.crop_extend(scroll_x, scroll_x + width, rich_style)
+        return strip.apply_offsets(scroll_x, index)
+
+
+class ExecutionPanel(TraceView):
     """Main panel for displaying algorithm execution."""
 
+    # Intervalo mínimo entre dois envios de saída parcial para a interface
+    BATCH_INTERVAL = 0.1
+
+    BINDINGS = [
+        Binding("left_square_bracket", "previous_pass", "Passo anterior"),
+        Binding("right_square_bracket", "next_pass", "Próximo passo"),
+        Binding("g", "seek_step", "Ir para evento"),
+        Binding("p", "seek_pass", "Ir para passo"),
+        Binding("e", "seek_end", "Fim"),
+    ]
+
     execution_output = reactive("")
 
+    class Progress(Message):
+        """Posted while a trace is being generated in the background.
+
+        ``comparisons`` and ``swaps`` are None when the trace came from the cache.
+        """
+
+        def __init__(
+            self,
+            lines: int,
+            comparisons: Optional[int],
+            swaps: Optional[int],
+            finished: bool,
+        ):
+            super().__init__()
+            self.lines = lines
+            self.comparisons = comparisons
+            self.swaps = swaps
+            self.finished = finished
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_algorithm = None
         self.current_test_case = None
-        self.content_widget = Static("")
+        # Índice para navegação: snapshots da execução e linhas de cada passo
+        self._visualizer = None
+        self._input_array = None
+        self._trace: Optional[CheckpointedTrace] = None
+        self._line_index: Optional[LineIndex] = None
+        self._pending_seek = None
+        self._seek_input = ""
 
     def on_mount(self) -> None:
-        """Mount the content widget inside the scroll view."""
-        self.mount(self.content_widget)
-        # Initialize with waiting state content
+        """Initialize with waiting state content."""
         self.update_content()
 
     def render_content(self) -> str:
@@ -78,19 +254,21 @@ class ExecutionPanel(ScrollableContainer):
     def update_content(self) -> None:
         """Update the scrollable content."""
         content = self.render_content()
-        self.content_widget.update(content)
+        self.set_trace(content)
         # Scroll to top when content updates
         self.scroll_home(animate=False)
 
     def _render_waiting_state(self) -> str:
         return (
-            "[dim]Selecione um algoritmo e caso de teste para começar\n\n"
-            "🎮 Controles:\n"
-            "• Tab/Shift+Tab: Circular entre painéis\n"
-            "• ↑↓: Navegar nas listas\n"
-            "• Espaço: Selecionar item destacado\n"
-            "• Enter: Focar no painel principal para rolar\n"
-            # "• R/Esc: Resetar execução[/]"
+            "[dim]Selecione um algoritmo e caso de teste para começar[/]\n\n"
+            "[dim]🎮 Controles:[/]\n"
+            "[dim]• Tab/Shift+Tab: Circular entre painéis[/]\n"
+            "[dim]• ↑↓: Navegar nas listas[/]\n"
+            "[dim]• Espaço: Selecionar item destacado[/]\n"
+            "[dim]• Enter: Focar no painel principal para rolar[/]\n"
+            "[dim]• [ ]: Passo anterior/próximo | E: Fim da execução[/]\n"
+            "[dim]• Nº + G/P: Ir para o evento/passo Nº[/]\n"
+            # "[dim]• R/Esc: Resetar execução[/]"
         )
 
     def _render_ready_state(self) -> str:
@@ -98,7 +276,7 @@ class ExecutionPanel(ScrollableContainer):
             f"[bold cyan]Executando automaticamente...[/]\n\n"
             f"[white]Algoritmo:[/] {self.current_algorithm}\n"
             f"[white]Caso de Teste:[/] {self.current_test_case['name']}\n"
-            f"[white]Array:[/] {self.current_test_case['array']}"
+            f"[white]Array:[/] {array_preview(self.current_test_case)}"
         )
 
     def set_algorithm_and_test_case(self, algorithm: str, test_case: dict):
@@ -117,18 +295,370 @@ class ExecutionPanel(ScrollableContainer):
         algorithm_id = None
         algorithms = get_available_algorithms()
         for algo in algorithms:
-            if algo["name"] in self.current_algorithm:
+            if algo["name"] == self.current_algorithm:
                 algorithm_id = algo["id"]
                 break
 
         if algorithm_id:
+            self._reset_index()
             try:
                 visualizer = get_algorithm_visualizer(algorithm_id)
-                self.execution_output = visualizer.sort_complete(
-                    self.current_test_case["array"]
-                )
             except (ValueError, NotImplementedError) as e:
+                self.workers.cancel_group(self, "trace")
                 self.execution_output = f"[red]Erro: {str(e)}[/]"
+                return
+
+            if self.app.profiler is not None:
+                visualizer.enable_profiling(self.app.profiler)
+
+            self.set_reactive(ExecutionPanel.execution_output, "")
+            input_array = self.current_test_case["array"]
+            self._visualizer = visualizer
+            self._input_array = input_array
+            key = trace_cache.make_key(
+                algorithm_id, input_array, **self.app.output_options
+            )
+            cached = trace_cache.get(key)
+            if cached is not None:
+                # Combinação já executada: nada a recalcular
+                self.workers.cancel_group(self, "trace")
+                self.set_trace(cached)
+                self.scroll_home(animate=False)
+                self.post_message(self.Progress(self.line_count, None, None, True))
+                return
+
+            self.update_content()
+            self.run_trace(visualizer, input_array, key)
+
+    @work(thread=True, exclusive=True, group="trace")
+    def run_trace(self, visualizer, input_array: List[int], key=None) -> None:
+        """Generate the trace in a worker thread, sending partial output in batches.
+
+        Starting a new run cancels the one in flight (``exclusive=True``); the
+        worker notices it at the next batch and stops generating lines. A run
+        that finishes is stored in the trace cache under ``key``, and its
+        checkpoints become the index used by the seek commands.
+        """
+        worker = get_current_worker()
+        trace = CheckpointedTrace(input_array)
+        index = LineIndex()
+        renderer = visualizer.new_renderer(input_array, **self.app.output_options)
+        chunks = []
+        batch = []
+        lines = 0
+        first = True
+        last_flush = time.monotonic()
+
+        output = trace.render_indexed(
+            renderer, visualizer.iter_events(input_array), index
+        )
+        for line in output:
+            batch.append(line)
+            now = time.monotonic()
+            if now - last_flush < self.BATCH_INTERVAL:
+                continue
+
+            if worker.is_cancelled:
+                return
+            lines += len(batch)
+            chunks.append(self._join(batch))
+            self.app.call_from_thread(self._add_batch, worker, chunks[-1], first)
+            self.post_message(
+                self.Progress(lines, visualizer.comparisons, visualizer.swaps, False)
+            )
+            batch = []
+            first = False
+            last_flush = now
+
+        if worker.is_cancelled:
+            return
+        lines += len(batch)
+        chunks.append(self._join(batch))
+        self.app.call_from_thread(self._add_batch, worker, chunks[-1], first)
+        self.post_message(
+            self.Progress(lines, visualizer.comparisons, visualizer.swaps, True)
+        )
+        self.app.call_from_thread(self._set_index, worker, trace, index)
+        if key is not None:
+            trace_cache.put(key, self._join(chunks))
+
+    def _join(self, lines: List[str]) -> str:
+        """Join lines, timed as the ``join`` phase when profiling."""
+        profiler = self.app.profiler
+        if profiler is None:
+            return "\n".join(lines)
+        with profiler.phase("join"):
+            return "\n".join(lines)
+
+    @work(thread=True, exclusive=True, group="trace")
+    def build_index(self, visualizer, input_array: List[int]) -> None:
+        """Index a trace that came from the cache, so it can be seeked.
+
+        The narration is rendered only to count lines and then discarded.
+        """
+        worker = get_current_worker()
+        trace = CheckpointedTrace(input_array)
+        index = LineIndex()
+        renderer = visualizer.new_renderer(input_array, **self.app.output_options)
+        output = trace.render_indexed(
+            renderer, visualizer.iter_events(input_array), index
+        )
+        for count, _ in enumerate(output):
+            if count % 10000 == 0 and worker.is_cancelled:
+                return
+        self.app.call_from_thread(self._set_index, worker, trace, index)
+
+    def _reset_index(self) -> None:
+        self._visualizer = None
+        self._input_array = None
+        self._trace = None
+        self._line_index = None
+        self._pending_seek = None
+        self._seek_input = ""
+        self.border_subtitle = ""
+
+    def _set_index(
+        self, worker: Worker, trace: CheckpointedTrace, index: LineIndex
+    ) -> None:
+        """Keep the index built by ``worker`` and run a seek waiting for it."""
+        if worker.is_cancelled:
+            return
+        self._trace = trace
+        self._line_index = index
+        pending, self._pending_seek = self._pending_seek, None
+        if pending is not None:
+            pending()
+
+    def _with_index(self, seek) -> None:
+        """Run ``seek`` now, or once the index of the current trace is ready."""
+        if self._trace is not None:
+            seek()
+            return
+        if self._visualizer is None:
+            return
+
+        first_request = self._pending_seek is None
+        self._pending_seek = seek
+        if not first_request:
+            return
+        if any(worker.is_running for worker in self.workers):
+            self.notify("Aguarde: a execução ainda está sendo gerada")
+        else:
+            self.notify("Indexando a execução para navegação...")
+            self.build_index(self._visualizer, self._input_array)
+
+    def _take_seek_input(self) -> Optional[int]:
+        number = int(self._seek_input) if self._seek_input else None
+        self._seek_input = ""
+        self.border_subtitle = ""
+        return number
+
+    def _scroll_to_line(self, line: int) -> None:
+        self.scroll_to(y=line, animate=False)
+
+    def on_key(self, event: events.Key) -> None:
+        """Collect the digits typed before ``g`` (event) or ``p`` (pass)."""
+        if event.character and event.character.isdigit():
+            self._seek_input += event.character
+            self.border_subtitle = f"Ir para: {self._seek_input}_"
+            event.stop()
+
+    def action_seek_step(self) -> None:
+        """Scroll to the narration of event N (digits typed before ``g``)."""
+        step = self._take_seek_input() or 0
+
+        def seek():
+            line = self._trace.line_of_step(
+                step,
+                self._line_index,
+                self._visualizer.renderer_class,
+                **self.app.output_options,
+            )
+            self._scroll_to_line(line)
+            self.notify(f"Evento {self._trace.clamp(step)}/{len(self._trace)}")
+
+        self._with_index(seek)
+
+    def action_seek_pass(self) -> None:
+        """Scroll to pass N (digits typed before ``p``, counted from 1)."""
+        number = self._take_seek_input() or 1
+
+        def seek():
+            pass_lines = self._line_index.pass_lines
+            if pass_lines:
+                self._scroll_to_line(pass_lines[min(number, len(pass_lines)) - 1])
+
+        self._with_index(seek)
+
+    def action_previous_pass(self) -> None:
+        """Scroll to the start of the previous pass."""
+
+        def seek():
+            pass_lines = self._line_index.pass_lines
+            position = bisect_left(pass_lines, self.scroll_offset.y) - 1
+            self._scroll_to_line(pass_lines[position] if position >= 0 else 0)
+
+        self._with_index(seek)
+
+    def action_next_pass(self) -> None:
+        """Scroll to the start of the next pass (or to the end of the run)."""
+
+        def seek():
+            pass_lines = self._line_index.pass_lines
+            position = bisect_right(pass_lines, self.scroll_offset.y)
+            if position < len(pass_lines):
+                self._scroll_to_line(pass_lines[position])
+            else:
+                self._scroll_to_line(self._line_index.end_line)
+
+        self._with_index(seek)
+
+    def action_seek_end(self) -> None:
+        """Scroll to the end of the run (final state and statistics)."""
+        self._with_index(lambda: self._scroll_to_line(self._line_index.end_line))
+
+    def _add_batch(self, worker: Worker, text: str, first: bool) -> None:
+        """Show a batch of lines produced by ``worker`` (ignored if it was cancelled)."""
+        if worker.is_cancelled:
+            return
+        if first:
+            self.set_trace(text)
+            self.scroll_home(animate=False)
+        else:
+            self.append_text(text)
+
+
+class RacePane(Static):
+    """One algorithm of a race: bar chart of its array and live counters."""
+
+    # Linhas do gráfico de barras
+    CHART_HEIGHT = 6
+
+    def show(self, status: Dict[str, Any], low: int, high: int) -> None:
+        """Redraw the pane from one racer of ``Race.snapshot``."""
+        if status["place"] is not None:
+            color = "green"
+            self.border_subtitle = f"🏁 {status['place']}º lugar"
+        else:
+            color = "cyan"
+            self.border_subtitle = "⏳ correndo"
+
+        lines = [
+            f"[{color}]{row}[/]" for row in self._chart(status["samples"], low, high)
+        ]
+        lines.append(
+            f"🔍 [yellow]{status['comparisons']}[/] comparações | "
+            f"🔄 [yellow]{status['swaps']}[/] trocas"
+        )
+        lines.append(
+            f"⏱️ [yellow]{status['elapsed']:.2f}s[/] [dim](CPU {status['busy']:.2f}s)[/] | "
+            f"{status['events']} eventos"
+        )
+        self.update("\n".join(lines))
+
+    def _chart(self, samples: List[int], low: int, high: int) -> List[str]:
+        """Bar chart rows, top to bottom, one column per sample."""
+        height = self.CHART_HEIGHT
+        span = high - low
+        levels = [
+            height * 8 if span == 0 else 1 + (value - low) * (height * 8 - 1) // span
+            for value in samples
+        ]
+        return [
+            "".join(BAR_EIGHTHS[max(0, min(8, level - row * 8))] for level in levels)
+            for row in range(height - 1, -1, -1)
+        ]
+
+
+class RaceView(Container):
+    """Race mode: one ``RacePane`` per algorithm, all driven by one clock.
+
+    A single worker thread ticks the ``Race`` every ``RACE_TICK`` seconds and,
+    at most every ``BATCH_INTERVAL``, sends the snapshot of all racers to the
+    interface in one call, however many events ran in between. This keeps the
+    screen responsive with several large runs at once.
+    """
+
+    BATCH_INTERVAL = 0.1
+
+    class Progress(Message):
+        """Posted with each batch of race updates."""
+
+        def __init__(self, elapsed: float, running: int, total: int, speed: int):
+            super().__init__()
+            self.elapsed = elapsed
+            self.running = running
+            self.total = total
+            self.speed = speed
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.race: Optional[Race] = None
+        self.events_per_tick = 1
+        self.chart_width = 20
+        self._panes: List[RacePane] = []
+
+    def start(self, race: Race) -> None:
+        """Replace the current race (if any) by ``race`` and run it."""
+        self.stop()
+        self.remove_children()
+        self.race = race
+        self.events_per_tick = default_events_per_tick(race.length)
+        self._panes = []
+        for racer in race.racers:
+            pane = RacePane()
+            pane.border_title = racer.name
+            self._panes.append(pane)
+        self.mount(*self._panes)
+        self.styles.grid_size_columns = min(2, len(self._panes))
+        self.run_race(race)
+
+    def stop(self) -> None:
+        """Cancel the race in progress."""
+        self.workers.cancel_group(self, "race")
+
+    def on_resize(self, event: events.Resize) -> None:
+        # Largura útil de um painel (bordas e espaçamento descontados)
+        columns = max(1, min(2, len(self._panes)))
+        self.chart_width = max(10, event.size.width // columns - 6)
+
+    def change_speed(self, factor: float) -> None:
+        """Multiply the events each algorithm runs per tick by ``factor``."""
+        self.events_per_tick = max(1, int(self.events_per_tick * factor))
+
+    @work(thread=True, exclusive=True, group="race")
+    def run_race(self, race: Race) -> None:
+        """Tick ``race`` on the shared clock, sending coalesced updates."""
+        worker = get_current_worker()
+        last_flush = 0.0
+        running = True
+        while running:
+            tick_start = time.monotonic()
+            running = race.tick(self.events_per_tick)
+            if worker.is_cancelled:
+                return
+
+            now = time.monotonic()
+            if not running or now - last_flush >= self.BATCH_INTERVAL:
+                snapshot = race.snapshot(self.chart_width)
+                self.app.call_from_thread(self._show, worker, snapshot)
+                last_flush = now
+            if running:
+                # Relógio compartilhado: no máximo um tique a cada RACE_TICK
+                time.sleep(max(0.0, RACE_TICK - (time.monotonic() - tick_start)))
+
+    def _show(self, worker: Worker, snapshot: List[Dict[str, Any]]) -> None:
+        """Redraw every pane from one snapshot (ignored if ``worker`` was cancelled)."""
+        if worker.is_cancelled:
+            return
+        race = self.race
+        for pane, status in zip(self._panes, snapshot):
+            pane.show(status, race.low, race.high)
+        running = sum(1 for status in snapshot if status["place"] is None)
+        elapsed = max((status["elapsed"] for status in snapshot), default=0.0)
+        self.post_message(
+            self.Progress(elapsed, running, len(snapshot), self.events_per_tick)
+        )
 
 
 class RichSortApp(App):
@@ -211,14 +741,24 @@ class RichSortApp(App):
     ExecutionPanel {
         height: 100%;
         scrollbar-gutter: stable;
+        padding: 1;
     }
     
     ExecutionPanel:focus {
         border: solid $error;
     }
-    
-    ExecutionPanel > Static {
-        padding: 1;
+
+    RaceView {
+        display: none;
+        layout: grid;
+        grid-size: 2;
+        height: 100%;
+    }
+
+    RacePane {
+        height: 100%;
+        border: round $primary;
+        padding: 0 1;
     }
     """
 
@@ -230,12 +770,33 @@ class RichSortApp(App):
         # Binding("escape", "reset", "Reset"),
         Binding("enter", "focus_execution", "Focus Main Panel", priority=True),
         Binding("space", "select_item", "Select Item"),
+        Binding("m", "mark_race", "Marcar p/ corrida"),
+        Binding("c", "start_race", "Corrida"),
+        Binding("plus", "race_speed(2)", "Corrida mais rápida", show=False),
+        Binding("minus", "race_speed(0.5)", "Corrida mais lenta", show=False),
     ]
 
-    def __init__(self):
+    def __init__(
+        self,
+        profile: bool = False,
+        max_lines: Optional[int] = OUTPUT_MAX_LINES,
+        size: int = GENERATED_SIZE,
+        seed: int = 0,
+        race: Optional[List[str]] = None,
+    ):
         super().__init__()
+        self.test_case_size = size
+        self.test_case_seed = seed
         self.selected_algorithm = None
         self.selected_test_case = None
+        # Algoritmos da corrida pedidos na linha de comando
+        self.initial_race = race or []
+        self.racing = False
+        # Com --profile, acumula o tempo de cada fase de todas as execuções
+        self.profiler = Profiler() if profile else None
+        # Orçamento de saída: acima dele a narração vira um resumo por passo.
+        # Sem linhas delta: a tela mostra cada linha do array inteira
+        self.output_options = budget_options(max_lines, delta=False)
 
     def compose(self) -> ComposeResult:
         """Create the application layout."""
@@ -250,12 +811,17 @@ class RichSortApp(App):
 
                 with Container(id="test_cases_container"):
                     yield Static("📋 Casos de Teste", id="test_cases_title")
-                    yield TestCaseList(id="test_cases")
+                    yield TestCaseList(
+                        size=self.test_case_size,
+                        seed=self.test_case_seed,
+                        id="test_cases",
+                    )
 
             # Right side with main execution panel
             with Container(id="execution_container"):
                 yield Static("📊 Execução do Algoritmo", id="execution_title")
                 yield ExecutionPanel(id="execution")
+                yield RaceView(id="race")
 
         yield Footer()
 
@@ -268,6 +834,19 @@ class RichSortApp(App):
         algorithms_list = self.query_one("#algorithms", AlgorithmList)
         algorithms_list.focus()
 
+        if self.initial_race:
+            ids = [algo["id"] for algo in algorithms_list.algorithms]
+            for algorithm_id in self.initial_race:
+                if algorithm_id in ids:
+                    algorithms_list.toggle_mark(ids.index(algorithm_id))
+                else:
+                    self.notify(
+                        f"Algoritmo desconhecido: {algorithm_id}", severity="error"
+                    )
+            test_cases_list = self.query_one("#test_cases", TestCaseList)
+            self.selected_test_case = test_cases_list.test_cases[0]
+            self.action_start_race()
+
     @on(ListView.Selected, "#algorithms")
     def on_algorithm_selected(self, event: ListView.Selected) -> None:
         """Handle algorithm selection - now only highlights, doesn't execute."""
@@ -300,6 +879,7 @@ class RichSortApp(App):
             algo = algorithms_list.algorithms[highlighted_index]
             if algo["implemented"]:
                 self.selected_algorithm = algo["name"]
+                self._show_race(False)
                 self.notify(
                     f"Algoritmo selecionado: {algo['name']}", severity="information"
                 )
@@ -324,6 +904,67 @@ class RichSortApp(App):
             )
             self._update_execution_panel()
 
+    def action_mark_race(self) -> None:
+        """Mark or unmark the highlighted algorithm for the race."""
+        algorithms_list = self.query_one("#algorithms", AlgorithmList)
+        index = algorithms_list.index
+        if self.focused is not algorithms_list or index is None:
+            return
+        algo = algorithms_list.algorithms[index]
+        if not algo["implemented"]:
+            self.notify(
+                "Este algoritmo ainda não foi implementado!", severity="warning"
+            )
+            return
+        marked = algorithms_list.toggle_mark(index)
+        action = "marcado para" if marked else "removido da"
+        self.notify(f"{algo['name']} {action} corrida ({len(algorithms_list.marked)})")
+
+    def action_start_race(self) -> None:
+        """Race the marked algorithms on the selected test case."""
+        marked = self.query_one("#algorithms", AlgorithmList).marked
+        if len(marked) < 2:
+            self.notify(
+                "Marque pelo menos dois algoritmos com M para a corrida",
+                severity="warning",
+            )
+            return
+        if self.selected_test_case is None:
+            self.notify("Selecione um caso de teste para a corrida", severity="warning")
+            return
+        self._show_race(True)
+        self._update_execution_panel()
+
+    def action_race_speed(self, factor: float) -> None:
+        """Speed the race up or down (``+``/``-``)."""
+        if not self.racing:
+            return
+        race_view = self.query_one("#race", RaceView)
+        race_view.change_speed(factor)
+        self.notify(f"Velocidade: {race_view.events_per_tick} eventos por tique")
+
+    def _show_race(self, racing: bool) -> None:
+        """Switch the right side between the execution panel and the race."""
+        self.racing = racing
+        race_view = self.query_one("#race", RaceView)
+        execution_panel = self.query_one("#execution", ExecutionPanel)
+        if racing:
+            execution_panel.workers.cancel_group(execution_panel, "trace")
+        else:
+            race_view.stop()
+        race_view.display = racing
+        execution_panel.display = not racing
+
+    def _start_race(self) -> None:
+        marked = self.query_one("#algorithms", AlgorithmList).marked
+        names = {algo["id"]: algo["name"] for algo in get_available_algorithms()}
+        try:
+            race = Race(marked, self.selected_test_case["array"], names)
+        except (ValueError, NotImplementedError) as e:
+            self.notify(f"Erro: {e}", severity="error")
+            return
+        self.query_one("#race", RaceView).start(race)
+
     def action_focus_execution(self) -> None:
         """Focus on the execution panel for scrolling."""
         execution_panel = self.query_one("#execution", ExecutionPanel)
@@ -389,8 +1030,35 @@ class RichSortApp(App):
 
         focus_order[prev_index].focus()
 
+    @on(ExecutionPanel.Progress)
+    def on_execution_progress(self, event: ExecutionPanel.Progress) -> None:
+        """Show the progress of the background run in the execution title."""
+        title = self.query_one("#execution_title", Static)
+        if event.comparisons is None:
+            title.update(f"📊 Execução do Algoritmo - 💾 {event.lines} linhas (cache)")
+            return
+
+        status = "✅" if event.finished else "⏳"
+        title.update(
+            f"📊 Execução do Algoritmo - {status} {event.lines} linhas | "
+            f"{event.comparisons} comparações | {event.swaps} trocas"
+        )
+
+    @on(RaceView.Progress)
+    def on_race_progress(self, event: RaceView.Progress) -> None:
+        """Show the race clock and how many algorithms are still running."""
+        title = self.query_one("#execution_title", Static)
+        status = "✅" if event.running == 0 else "⏳"
+        title.update(
+            f"🏁 Corrida - {status} {event.total - event.running}/{event.total} chegaram | "
+            f"⏱️ {event.elapsed:.2f}s | {event.speed} eventos/tique (+/-)"
+        )
+
     def _update_execution_panel(self) -> None:
         """Update the execution panel with current selections."""
+        if self.racing:
+            self._start_race()
+            return
         execution_panel = self.query_one("#execution", ExecutionPanel)
         if self.selected_algorithm and self.selected_test_case:
             execution_panel.set_algorithm_and_test_case(
@@ -398,10 +1066,56 @@ class RichSortApp(App):
             )
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="richsort-textual",
+        description="Visualizador de algoritmos de ordenação com Textual.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="mede o tempo de cada fase e mostra um resumo ao sair",
+    )
+    parser.add_argument(
+        "--max-lines",
+        type=int,
+        default=OUTPUT_MAX_LINES,
+        help="linhas de narração antes de resumir por passo (0 = sem limite)",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=GENERATED_SIZE,
+        help="tamanho dos casos de teste gerados (0 = só os casos fixos)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="semente dos casos de teste gerados"
+    )
+    parser.add_argument(
+        "--race",
+        type=lambda value: [item for item in value.split(",") if item],
+        default=[],
+        metavar="ALGORITMOS",
+        help="abre uma corrida entre os algoritmos (ex.: quick,merge) no primeiro caso",
+    )
+    return parser
+
+
+def main(argv: List[str] = None):
     """Entry point for the Textual application."""
-    app = RichSortApp()
-    app.run()
+    args = build_parser().parse_args(argv)
+    app = RichSortApp(
+        profile=args.profile,
+        max_lines=args.max_lines,
+        size=args.size,
+        seed=args.seed,
+        race=args.race,
+    )
+    try:
+        app.run()
+    finally:
+        if app.profiler is not None:
+            console.print(app.profiler.summary_table())
 
 
 if __name__ == "__main__":
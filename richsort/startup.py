@@ -0,0 +1,187 @@
+"""
+Startup benchmark for RichSort.
+
+Imports the module behind each command in a fresh interpreter with
+``python -X importtime`` and reports its cumulative import time, how many
+modules it pulled in and which top-level packages cost the most. Run it
+before and after a change to see whether a command got slower to start;
+``--max-ms`` turns it into a check that fails when a command exceeds its
+budget.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+# Comando -> módulo importado quando ele roda (ver ``cli.COMMANDS``)
+ENTRY_MODULES = {
+    "cli": "richsort.cli",
+    "list": "richsort.registry",
+    "stats": "richsort.algorithms",
+    "bench": "richsort.bench",
+    "batch": "richsort.batch",
+    "trace": "richsort.tracefile",
+    "complexity": "richsort.complexity",
+    "rich": "richsort.sort_rich",
+    "textual": "richsort.sort_textual",
+}
+
+# Pacotes mais pesados mostrados por comando
+TOP_PACKAGES = 3
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Import ``module`` in a new interpreter and parse ``-X importtime``.
+
+    Returns:
+        Cumulative import time in microseconds of every module imported
+    """
+    # O diretório que contém o pacote, para rodar também sem instalação
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def measure(name: str, module: str, repeats: int = 5) -> Dict[str, Any]:
+    """Best of ``repeats`` cold imports of ``module``."""
+    best = None
+    for _ in range(repeats):
+        times = import_times(module)
+        if best is None or times[module] < best[module]:
+            best = times
+
+    packages = {
+        package: cumulative
+        for package, cumulative in best.items()
+        if "." not in package and package != module.split(".")[0]
+    }
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "command": name,
+        "module": module,
+        "import_ms": best[module] / 1000,
+        "modules": len(best),
+        "heaviest": [
+            {"package": package, "import_ms": cumulative / 1000}
+            for package, cumulative in heaviest[:TOP_PACKAGES]
+        ],
+    }
+
+
+def _write_table(rows: List[Dict[str, Any]], output) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="⏱️ RichSort - tempo de inicialização")
+    table.add_column("Comando")
+    table.add_column("Módulo")
+    table.add_column("Import (ms)", justify="right")
+    table.add_column("Módulos", justify="right")
+    table.add_column("Mais pesados")
+    for row in rows:
+        heaviest = ", ".join(
+            f"{item['package']} {item['import_ms']:.1f}" for item in row["heaviest"]
+        )
+        table.add_row(
+            row["command"],
+            row["module"],
+            f"{row['import_ms']:.1f}",
+            str(row["modules"]),
+            heaviest,
+        )
+    Console(file=output).print(table)
+
+
+def _budget(value: str) -> Dict[str, float]:
+    command, separator, limit = value.partition("=")
+    if not separator or command not in ENTRY_MODULES:
+        raise argparse.ArgumentTypeError(f"use comando=ms, ex.: cli=30 ({value})")
+    return {command: float(limit)}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="richsort startup",
+        description="Mede o tempo de import (python -X importtime) de cada comando.",
+    )
+    parser.add_argument(
+        "-c",
+        "--commands",
+        default=",".join(ENTRY_MODULES),
+        help=f"comandos separados por vírgula ({', '.join(ENTRY_MODULES)})",
+    )
+    parser.add_argument(
+        "-r", "--repeats", type=int, default=5, help="usa o melhor de N imports"
+    )
+    parser.add_argument("-f", "--format", choices=["json", "table"], default="table")
+    parser.add_argument(
+        "--max-ms",
+        type=_budget,
+        action="append",
+        default=[],
+        metavar="COMANDO=MS",
+        help="falha (código 1) se o import do comando passar de MS milissegundos",
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """Entry point for the startup benchmark."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    commands = [c for c in args.commands.split(",") if c]
+    for command in commands:
+        if command not in ENTRY_MODULES:
+            parser.error(f"comando desconhecido: {command}")
+
+    rows = [
+        measure(command, ENTRY_MODULES[command], max(1, args.repeats))
+        for command in commands
+    ]
+    if args.format == "json":
+        json.dump(rows, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        _write_table(rows, sys.stdout)
+
+    budgets = {}
+    for budget in args.max_ms:
+        budgets.update(budget)
+    failed = [
+        row
+        for row in rows
+        if row["import_ms"] > budgets.get(row["command"], float("inf"))
+    ]
+    for row in failed:
+        print(
+            f"{row['command']}: {row['import_ms']:.1f} ms > {budgets[row['command']]:.1f} ms",
+            file=sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
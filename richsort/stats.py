@@ -0,0 +1,141 @@
+"""
+Statistics module for RichSort.
+
+Closed-form and O(n log n) computations of the counters reported by the
+visualizers (comparisons and swaps), so statistics can be obtained for
+arrays far too large to be sorted step by step.
+"""
+
+from bisect import bisect_right
+from functools import partial
+from heapq import heappop, heapreplace
+from itertools import accumulate
+from math import lgamma, log
+from operator import lt, sub
+from typing import Dict, List, Sequence
+
+# Abaixo deste tamanho a contagem direta é mais rápida que dividir
+_SMALL_BLOCK = 32
+
+
+def log2_factorial(n: int) -> float:
+    """
+    Return ``log2(n!)``, the information-theoretic lower bound on comparisons.
+
+    Any comparison sort must tell apart the n! orders of its input, so in
+    the worst case it needs at least this many comparisons.
+    """
+    return lgamma(n + 1) / log(2)
+
+
+def count_inversions(array: Sequence[int]) -> int:
+    """
+    Count the pairs ``i < j`` with ``array[i] > array[j]``.
+
+    This is exactly the number of swaps done by Bubble Sort and by the
+    swap-based Insertion Sort. Runs in O(n log n); the merge step relies on
+    ``bisect`` and ``sorted`` so the inner loops run in C.
+    """
+    inversions, _ = _sort_and_count(list(array))
+    return inversions
+
+
+def _sort_and_count(array: List[int]):
+    length = len(array)
+    if length <= _SMALL_BLOCK:
+        inversions = 0
+        for i in range(1, length):
+            value = array[i]
+            for j in range(i):
+                if array[j] > value:
+                    inversions += 1
+        return inversions, sorted(array)
+
+    middle = length // 2
+    left_inversions, left = _sort_and_count(array[:middle])
+    right_inversions, right = _sort_and_count(array[middle:])
+
+    # Para cada elemento da direita, contamos os maiores da esquerda
+    not_greater = sum(map(partial(bisect_right, left), right))
+    cross_inversions = len(left) * len(right) - not_greater
+
+    return left_inversions + right_inversions + cross_inversions, sorted(left + right)
+
+
+def max_left_greater(array: Sequence[int]) -> int:
+    """
+    Largest number of strictly greater elements to the left of any element.
+
+    It equals the largest leftward displacement between the array and its
+    stable sorted order, which is also the number of Bubble Sort passes that
+    perform at least one swap.
+    """
+    length = len(array)
+    if length == 0:
+        return 0
+    order = sorted(range(length), key=array.__getitem__)
+    return max(0, max(map(sub, order, range(length))))
+
+
+def count_new_minima(array: Sequence[int]) -> int:
+    """Count the positions ``i > 0`` holding a value smaller than all before it."""
+    if len(array) < 2:
+        return 0
+    prefix_minima = list(accumulate(array, min))
+    return sum(map(lt, array[1:], prefix_minima[:-1]))
+
+
+def bubble_sort_stats(array: Sequence[int]) -> Dict[str, int]:
+    """Comparisons and swaps of ``BubbleSortVisualizer`` (with early exit)."""
+    length = len(array)
+    if length == 0:
+        return {"comparisons": 0, "swaps": 0}
+
+    # Passos com trocas + um passo final sem trocas que encerra o algoritmo
+    passes = max_left_greater(array) + 1
+    comparisons = passes * (length - 1) - passes * (passes - 1) // 2
+    return {"comparisons": comparisons, "swaps": count_inversions(array)}
+
+
+def insertion_sort_stats(array: Sequence[int]) -> Dict[str, int]:
+    """Comparisons and swaps of the swap-based ``InsertionSortVisualizer``."""
+    length = len(array)
+    swaps = count_inversions(array)
+
+    # Cada troca custa uma comparação, e cada passo termina com uma comparação
+    # extra, exceto quando o elemento chega ao início do array (novo mínimo)
+    comparisons = swaps + max(0, length - 1) - count_new_minima(array)
+    return {"comparisons": comparisons, "swaps": swaps}
+
+
+def selection_sort_stats(array: Sequence[int]) -> Dict[str, int]:
+    """
+    Comparisons and swaps of ``SelectionSortVisualizer``.
+
+    The comparison count is always n(n-1)/2. The swaps are simulated in
+    O(n log n) with one heap of positions per value: at each step the
+    leftmost occurrence of the smallest remaining value is the one selected.
+    """
+    length = len(array)
+    comparisons = length * (length - 1) // 2
+
+    values = list(array)
+    positions: Dict[int, List[int]] = {}
+    for index, value in enumerate(values):
+        # Posições inseridas em ordem crescente já formam um heap válido
+        positions.setdefault(value, []).append(index)
+
+    swaps = 0
+    for cur_index, min_value in enumerate(sorted(values)):
+        cur_value = values[cur_index]
+        if cur_value == min_value:
+            heappop(positions[cur_value])
+            continue
+
+        # cur_index é sempre a menor posição restante de cur_value
+        min_index = heappop(positions[min_value])
+        heapreplace(positions[cur_value], min_index)
+        values[cur_index], values[min_index] = min_value, cur_value
+        swaps += 1
+
+    return {"comparisons": comparisons, "swaps": swaps}
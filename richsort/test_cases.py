@@ -1,9 +1,25 @@
 """
 Test cases module for RichSort.
 
-This module contains the standard test cases used across different UI implementations.
+This module contains the standard test cases used across different UI
+implementations, plus seeded generators for inputs of any size. Generated
+cases only build their array the first time it is accessed, so listing them
+in a UI costs nothing until one is actually selected.
+
+The generators use NumPy when it is installed and the ``random`` module
+otherwise. A seed always gives the same array within one environment, but
+the two backends draw different numbers for the same seed.
 """
 
+import random
+from math import isqrt
+from typing import Any, Callable, Dict, List
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional: os geradores caem para o módulo random
+    numpy = None
+
 # Standard test cases for sorting algorithms
 TEST_CASES = [
     {
@@ -28,7 +44,159 @@ TEST_CASES = [
     },
 ]
 
+# Tamanho padrão dos casos gerados mostrados nas interfaces
+GENERATED_SIZE = 1000
+
+# Quantidade de valores distintos em "few_unique"
+FEW_UNIQUE_VALUES = 5
+
+# Fração das posições trocadas com a vizinha em "nearly_sorted"
+NEARLY_SORTED_SWAPS = 0.05
+
+
+def _random(size: int, seed: int) -> List[int]:
+    if numpy is not None:
+        return numpy.random.default_rng(seed).integers(0, size * 10 + 1, size).tolist()
+    rng = random.Random(seed)
+    return [rng.randint(0, size * 10) for _ in range(size)]
+
+
+def _sorted(size: int, seed: int) -> List[int]:
+    return list(range(size))
+
+
+def _reversed(size: int, seed: int) -> List[int]:
+    return list(range(size, 0, -1))
+
+
+def _nearly_sorted(size: int, seed: int) -> List[int]:
+    array = list(range(size))
+    if size < 2:
+        return array
+    swaps = max(1, int(size * NEARLY_SORTED_SWAPS))
+    if numpy is not None:
+        positions = numpy.random.default_rng(seed).integers(0, size - 1, swaps)
+        positions = positions.tolist()
+    else:
+        rng = random.Random(seed)
+        positions = [rng.randrange(size - 1) for _ in range(swaps)]
+    for i in positions:
+        array[i], array[i + 1] = array[i + 1], array[i]
+    return array
+
+
+def _sawtooth(size: int, seed: int) -> List[int]:
+    # Cerca de √n dentes, cada um uma sequência crescente
+    tooth = max(2, isqrt(size))
+    if numpy is not None:
+        return (numpy.arange(size) % tooth).tolist()
+    return [i % tooth for i in range(size)]
+
+
+def _few_unique(size: int, seed: int) -> List[int]:
+    if numpy is not None:
+        rng = numpy.random.default_rng(seed)
+        return rng.integers(0, FEW_UNIQUE_VALUES, size).tolist()
+    rng = random.Random(seed)
+    return [rng.randrange(FEW_UNIQUE_VALUES) for _ in range(size)]
+
+
+def _organ_pipe(size: int, seed: int) -> List[int]:
+    # Sobe até o meio e desce: 0, 1, 2, ..., 2, 1, 0
+    if numpy is not None:
+        positions = numpy.arange(size)
+        return numpy.minimum(positions, size - 1 - positions).tolist()
+    return [min(i, size - 1 - i) for i in range(size)]
+
+
+# Geradores: (tamanho, semente) -> lista de inteiros
+DISTRIBUTIONS: Dict[str, Callable[[int, int], List[int]]] = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "nearly_sorted": _nearly_sorted,
+    "sawtooth": _sawtooth,
+    "few_unique": _few_unique,
+    "organ_pipe": _organ_pipe,
+}
+
+# Nome e descrição dos casos gerados mostrados nas interfaces
+DISTRIBUTION_INFO = {
+    "random": ("🎲 Aleatório", "Valores aleatórios uniformes"),
+    "sorted": ("✅ Ordenado", "Já em ordem crescente"),
+    "reversed": ("❌ Decrescente", "Ordem decrescente - máximo de trocas"),
+    "nearly_sorted": ("📈 Quase ordenado", "Ordenado com algumas trocas vizinhas"),
+    "sawtooth": ("🪚 Dente de serra", "Várias sequências crescentes repetidas"),
+    "few_unique": ("🔁 Poucos valores", "Apenas 5 valores distintos, muito repetidos"),
+    "organ_pipe": ("🎹 Tubo de órgão", "Crescente até o meio, depois decrescente"),
+}
+
+
+def generate_array(distribution: str, size: int, seed: int = 0) -> List[int]:
+    """
+    Build an input array of ``size`` elements.
+
+    Args:
+        distribution: One of ``DISTRIBUTIONS``
+        size: Number of elements
+        seed: Seed of the random distributions (ignored by the others)
+
+    Raises:
+        ValueError: If the distribution is unknown or the size is negative
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    if size < 0:
+        raise ValueError(f"Invalid size: {size}")
+    return DISTRIBUTIONS[distribution](size, seed)
+
+
+class GeneratedCase(dict):
+    """Test case whose ``array`` is generated on first access."""
+
+    def __missing__(self, key: str) -> Any:
+        if key != "array":
+            raise KeyError(key)
+        array = generate_array(self["distribution"], self["size"], self["seed"])
+        self["array"] = array
+        return array
+
+
+def generated_case(distribution: str, size: int, seed: int = 0) -> GeneratedCase:
+    """Describe a generated test case without building its array yet."""
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    name, description = DISTRIBUTION_INFO[distribution]
+    return GeneratedCase(
+        name=f"{name} ({size:,})".replace(",", "."),
+        description=description,
+        distribution=distribution,
+        size=size,
+        seed=seed,
+    )
+
+
+def array_preview(test_case: Dict[str, Any], limit: int = 10) -> str:
+    """Describe a test case's array without generating it."""
+    if "array" not in test_case:
+        return f"{test_case['size']} elementos, gerados ao selecionar (semente {test_case['seed']})"
+    array = test_case["array"]
+    if len(array) <= limit:
+        return str(array)
+    head = ", ".join(str(value) for value in array[:limit])
+    return f"[{head}, …] ({len(array)} elementos)"
+
+
+def get_test_cases(size: int = GENERATED_SIZE, seed: int = 0):
+    """
+    Get the standard test cases for sorting algorithms.
 
-def get_test_cases():
-    """Get the standard test cases for sorting algorithms."""
-    return TEST_CASES.copy()
+    Besides the fixed examples, one generated case of ``size`` elements per
+    distribution is included (``size=0`` leaves them out).
+    """
+    test_cases = TEST_CASES.copy()
+    if size > 0:
+        test_cases.extend(
+            generated_case(distribution, size, seed) for distribution in DISTRIBUTIONS
+        )
+    return test_cases
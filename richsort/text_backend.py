@@ -0,0 +1,78 @@
+"""
+Rich Text backend for the RichSort renderers.
+
+Builds ``rich.text.Text`` lines directly from a small set of cached ``Style``
+objects instead of emitting markup that Rich or Textual must parse again on
+every render. Array lines, which hold one styled cell per element and
+dominate the cost of a trace, never go through the markup parser; the short
+narration lines are parsed once and cached.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rich.style import Style
+from rich.text import Span, Text
+
+_STYLES: Dict[str, Style] = {}
+
+
+def get_style(name: str) -> Style:
+    """Return the cached ``Style`` for a style definition such as ``"dim green"``."""
+    style = _STYLES.get(name)
+    if style is None:
+        style = _STYLES[name] = Style.parse(name)
+    return style
+
+
+@lru_cache(maxsize=4096)
+def _parse_markup(line: str) -> Text:
+    return Text.from_markup(line, end="")
+
+
+def markup_text(line: str) -> Text:
+    """Convert a narration line to ``Text`` (parsed once per distinct line)."""
+    return _parse_markup(line).copy()
+
+
+def cells_text(
+    label: str,
+    cells: Sequence[Tuple[str, int]],
+    positions: Optional[List[int]] = None,
+) -> Text:
+    """
+    Build an array line from ``(style, value)`` cells without any markup.
+
+    Args:
+        label: Text shown before the cells
+        cells: Styled cells, as returned by the ``_create_visual_array*`` helpers
+        positions: Element indices of the cells for delta lines (shown as
+            ``index:`` before each cell, like the markup backend)
+    """
+    # Mesmos separadores do markup: "label Δ c1 c2" ou "label c1 c2", com o
+    # espaço depois do rótulo (e do Δ) mesmo sem nenhuma célula
+    parts = [label, " "]
+    spans = []
+    offset = len(label) + 1
+    dim = get_style("dim")
+
+    if positions is not None:
+        parts.append("Δ ")
+        spans.append(Span(offset, offset + 1, dim))
+        offset += 2
+
+    for index, (style, value) in enumerate(cells):
+        if index:
+            parts.append(" ")
+            offset += 1
+        if positions is not None:
+            prefix = f"{positions[index]}:"
+            parts.append(prefix)
+            spans.append(Span(offset, offset + len(prefix), dim))
+            offset += len(prefix)
+        cell = f" {value} "
+        parts.append(cell)
+        spans.append(Span(offset, offset + len(cell), get_style(style)))
+        offset += len(cell)
+
+    return Text("".join(parts), spans=spans, end="")
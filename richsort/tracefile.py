@@ -0,0 +1,418 @@
+"""
+Binary trace module for RichSort.
+
+Records the step events of a sort run into a compact binary file and replays
+them later without recomputing anything. The file holds a small header with
+the algorithm id and the input array, followed by fixed-width event records
+``(opcode, i, j)`` stored as three int32 values, the steps where each pass
+starts and a snapshot of the run every ``interval`` events. Replay
+memory-maps the file and reads the records through a ``memoryview``, so a
+trace is never loaded into memory as a whole: seeking restores the nearest
+snapshot and replays only the events after it.
+
+Layout (header little-endian, arrays in the machine's native byte order)::
+
+    header     magic "RSTR", version, algorithm id length, input length,
+               events, snapshot interval, passes, snapshots
+    algo       algorithm id (UTF-8), zero-padded to a multiple of 8 bytes
+    input      input array as int64 values
+    events     event records as int32 triples, zero-padded to 8 bytes
+    passes     step where each pass starts, as uint64 values
+    offsets    start of each snapshot, as uint64 values relative to the
+               first snapshot
+    snapshots  one every ``interval`` events plus the final state, each as
+               int64 values: the six totals of ``checkpoints.advance``, key
+               flag, key, auxiliary buffer flag, the array and, when the
+               flag is set, the auxiliary buffer
+"""
+
+import argparse
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .checkpoints import CHECKPOINT_INTERVAL, CheckpointedTrace, advance
+from .events import PASS_START, Event
+from .registry import get_algorithm_visualizer
+from .test_cases import DISTRIBUTIONS, GENERATED_SIZE, generate_array
+
+MAGIC = b"RSTR"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHHQQQQQ")
+_EVENT_COUNT_OFFSET = 16
+
+# Quantidade de eventos acumulados em memória antes de cada escrita
+CHUNK_EVENTS = 65536
+
+# Cabeçalho de cada snapshot: 6 totais, tem chave, chave, tem auxiliar
+_SNAPSHOT_FIELDS = 9
+
+
+def _padded(size: int) -> int:
+    return (size + 7) // 8 * 8
+
+
+def trace_interval(length: int) -> int:
+    """Events between two snapshots of a trace file for an input of ``length``.
+
+    Sparser than ``CheckpointedTrace``'s default: the snapshots together stay
+    smaller than the event log, and a seek still replays O(n) events.
+    """
+    return max(4 * CHECKPOINT_INTERVAL, 4 * length)
+
+
+def _write_snapshot(
+    file, state: array, aux: Optional[array], key: Any, totals: Tuple[int, ...]
+) -> int:
+    """Append one snapshot to ``file``; returns its size in bytes."""
+    header = array(
+        "q",
+        [
+            *totals,
+            key is not None,
+            0 if key is None else key,
+            aux is not None,
+        ],
+    )
+    file.write(memoryview(header))
+    file.write(memoryview(state))
+    size = (len(header) + len(state)) * 8
+    if aux is not None:
+        file.write(memoryview(aux))
+        size += len(aux) * 8
+    return size
+
+
+def record_trace(
+    algorithm_id: str, input_array: List[int], path: str, chunk_events=CHUNK_EVENTS
+) -> int:
+    """
+    Run an algorithm and write its events to a binary trace file.
+
+    Args:
+        algorithm_id: Id of the algorithm in the registry
+        input_array: The array to sort
+        path: Destination file
+        chunk_events: Events buffered in memory between writes
+
+    Returns:
+        The number of events recorded
+    """
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    algo = algorithm_id.encode("utf-8")
+    values = array("q", input_array)
+    interval = trace_interval(len(values))
+
+    # Estado da execução, avançado um intervalo de cada vez para os snapshots
+    state = array("q", values)
+    aux = None
+    key = None
+    totals = (0, 0, 0, 0, 0, 0)
+    pending = array("i")
+    passes = array("Q")
+    offsets = array("Q")
+
+    count = 0
+    # Os snapshots vão depois dos eventos: ficam num arquivo temporário até o fim
+    with open(path, "wb") as file, tempfile.TemporaryFile() as snapshots:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(algo), len(values), 0, 0, 0, 0))
+        file.write(algo.ljust(_padded(len(algo)), b"\0"))
+        file.write(memoryview(values))
+
+        snapshot_size = 0
+        buffer = array("i")
+        for event in visualizer.iter_events(input_array):
+            if count % interval == 0:
+                aux, key, totals = advance(state, aux, key, totals, _triples(pending))
+                pending = array("i")
+                offsets.append(snapshot_size)
+                snapshot_size += _write_snapshot(snapshots, state, aux, key, totals)
+            if event[0] == PASS_START:
+                passes.append(count)
+            buffer.extend(event)
+            pending.extend(event)
+            count += 1
+            if len(buffer) >= chunk_events * 3:
+                file.write(memoryview(buffer))
+                buffer = array("i")
+        file.write(memoryview(buffer))
+        file.write(b"\0" * (_padded(count * 12) - count * 12))
+
+        # Estado final, depois do último evento
+        aux, key, totals = advance(state, aux, key, totals, _triples(pending))
+        offsets.append(snapshot_size)
+        _write_snapshot(snapshots, state, aux, key, totals)
+
+        file.write(memoryview(passes))
+        file.write(memoryview(offsets))
+        snapshots.seek(0)
+        shutil.copyfileobj(snapshots, file)
+
+        # Os totais só são conhecidos no final
+        file.seek(_EVENT_COUNT_OFFSET)
+        file.write(struct.pack("<QQQQ", count, interval, len(passes), len(offsets)))
+
+    return count
+
+
+def _triples(events: array) -> Iterator[Event]:
+    for base in range(0, len(events), 3):
+        yield (events[base], events[base + 1], events[base + 2])
+
+
+class _Snapshots:
+    """Snapshots of a mapped trace file, read on access (see ``CheckpointedTrace``)."""
+
+    def __init__(self, view: memoryview, offsets: memoryview, length: int):
+        self._view = view
+        self._offsets = offsets
+        self._length = length
+
+    def __len__(self) -> int:
+        # O último é o estado final, fora da sequência dos intervalos
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int):
+        if not 0 <= index < len(self._offsets):
+            raise IndexError("snapshot index out of range")
+        start = self._offsets[index] // 8
+        fields = self._view[start : start + _SNAPSHOT_FIELDS]
+        totals = tuple(fields[:6])
+        key = fields[7] if fields[6] else None
+        start += _SNAPSHOT_FIELDS
+        state = self._view[start : start + self._length].tolist()
+        aux = None
+        if fields[8]:
+            start += self._length
+            aux = self._view[start : start + self._length].tolist()
+        return state, totals, key, aux
+
+    def final(self) -> Tuple[List[int], Tuple[int, ...], Any]:
+        """State, totals and key after the last event."""
+        state, totals, key, _ = self[len(self)]
+        return state, totals, key
+
+
+class TraceFile:
+    """Memory-mapped, read-only view of a recorded trace."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Arquivo de trace vazio: {path}")
+
+        magic, version = struct.unpack_from("<4sH", self._mmap)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Arquivo de trace inválido: {path}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Versão de trace não suportada: {version}")
+        (
+            _,
+            _,
+            algo_length,
+            length,
+            count,
+            interval,
+            passes,
+            snapshots,
+        ) = _HEADER.unpack_from(self._mmap)
+
+        offset = _HEADER.size
+        self.algorithm_id = bytes(self._mmap[offset : offset + algo_length]).decode(
+            "utf-8"
+        )
+        offset += _padded(algo_length)
+
+        self._view = memoryview(self._mmap)
+        self._input = self._view[offset : offset + length * 8].cast("q")
+        offset += length * 8
+        self._events = self._view[offset : offset + count * 12].cast("i")
+        offset += _padded(count * 12)
+        self._passes = self._view[offset : offset + passes * 8].cast("Q")
+        offset += passes * 8
+        self._offsets = self._view[offset : offset + snapshots * 8].cast("Q")
+        offset += snapshots * 8
+        self._snapshots = self._view[offset:].cast("q")
+        self.length = length
+        self.event_count = count
+        self.interval = interval
+        self._checkpoints: Optional[CheckpointedTrace] = None
+
+    def close(self) -> None:
+        """Release the memory map and the file."""
+        views = ("_snapshots", "_offsets", "_passes", "_events", "_input", "_view")
+        for view in views:
+            if hasattr(self, view):
+                getattr(self, view).release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "TraceFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.event_count
+
+    def __getitem__(self, index: int) -> Event:
+        if index < 0:
+            index += self.event_count
+        if not 0 <= index < self.event_count:
+            raise IndexError("event index out of range")
+        base = index * 3
+        return (
+            self._events[base],
+            self._events[base + 1],
+            self._events[base + 2],
+        )
+
+    @property
+    def input_array(self) -> List[int]:
+        """The recorded input array."""
+        return self._input.tolist()
+
+    @property
+    def pass_count(self) -> int:
+        """Number of passes of the run."""
+        return len(self._passes)
+
+    def iter_events(self, start: int = 0, stop: int = None) -> Iterator[Event]:
+        """Yield the events in ``[start, stop)`` straight from the mapped file."""
+        stop = self.event_count if stop is None else min(stop, self.event_count)
+        events = self._events
+        for base in range(start * 3, stop * 3, 3):
+            yield (events[base], events[base + 1], events[base + 2])
+
+    def array_at(self, step: int) -> List[int]:
+        """Return the array state after the first ``step`` events.
+
+        Restores the nearest snapshot stored in the file and replays at most
+        ``interval`` events.
+        """
+        return self.checkpoints().array_at(step)
+
+    def checkpoints(self) -> CheckpointedTrace:
+        """A read-only ``CheckpointedTrace`` over the mapped events and snapshots.
+
+        Nothing is copied: the events, the pass steps and each snapshot are
+        read from the file when needed. The same trace is returned on every
+        call, so the narration states it keeps while seeking are reused.
+        """
+        if self._checkpoints is None:
+            snapshots = _Snapshots(self._snapshots, self._offsets, self.length)
+            self._checkpoints = CheckpointedTrace.from_index(
+                self.input_array,
+                self.interval,
+                self._events,
+                self._passes,
+                snapshots,
+                snapshots.final(),
+            )
+        return self._checkpoints
+
+    def render_lines(self, start: int = 0, **options) -> Iterator[str]:
+        """Replay the trace through the algorithm's renderer.
+
+        With ``start`` the narration begins at that event (without the header):
+        the renderer is positioned by ``CheckpointedTrace.renderer_at`` from
+        the snapshots in the file, so only the events after it are narrated.
+        """
+        visualizer = get_algorithm_visualizer(self.algorithm_id)
+        if not start:
+            renderer = visualizer.renderer_class(self.input_array, **options)
+            return renderer.render(self.iter_events())
+
+        renderer = self.checkpoints().renderer_at(
+            start, visualizer.renderer_class, **options
+        )
+        return self._render_from(renderer, start)
+
+    def _render_from(self, renderer, start: int) -> Iterator[str]:
+        for event in self.iter_events(start):
+            yield from renderer.feed(event)
+        yield from renderer.footer()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="richsort-trace",
+        description="Grava e reproduz traces binários do RichSort.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record = subparsers.add_parser("record", help="grava um trace")
+    record.add_argument("algorithm", help="id do algoritmo (ex.: bubble)")
+    record.add_argument("path", help="arquivo de saída")
+    record.add_argument(
+        "values", nargs="*", type=int, help="elementos do array de entrada"
+    )
+    record.add_argument(
+        "-d",
+        "--distribution",
+        choices=list(DISTRIBUTIONS),
+        help="gera a entrada com esta distribuição em vez de usar os valores",
+    )
+    record.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=GENERATED_SIZE,
+        help="tamanho da entrada gerada",
+    )
+    record.add_argument("--seed", type=int, default=0, help="semente da entrada gerada")
+
+    info = subparsers.add_parser("info", help="mostra o cabeçalho de um trace")
+    info.add_argument("path")
+
+    replay = subparsers.add_parser("replay", help="reproduz a narração de um trace")
+    replay.add_argument("path")
+    replay.add_argument(
+        "--start", type=int, default=0, help="começa a narração neste evento"
+    )
+    return parser
+
+
+def main(argv: List[str] = None):
+    """Entry point for recording and replaying binary traces."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        values = args.values
+        if args.distribution is not None:
+            if values:
+                parser.error("informe os valores ou --distribution, não ambos")
+            values = generate_array(args.distribution, args.size, args.seed)
+        elif not values:
+            parser.error("informe os valores do array ou --distribution")
+        count = record_trace(args.algorithm, values, args.path)
+        print(f"{count} eventos gravados em {args.path}")
+        return
+
+    with TraceFile(args.path) as trace:
+        if args.command == "info":
+            print(f"Algoritmo: {trace.algorithm_id}")
+            print(f"Tamanho: {trace.length} elementos")
+            print(f"Eventos: {trace.event_count}")
+        else:
+            from rich.console import Console
+
+            console = Console()
+            for line in trace.render_lines(start=args.start):
+                console.print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Vectorized sorting kernels for RichSort.
+
+Odd-even transposition sort is the data-parallel relative of Bubble Sort:
+each phase compares the pairs ``(i, i + 1)`` with ``i`` of one parity (even
+phases start at 0, odd phases at 1). The pairs of a phase never overlap, so
+the whole phase is a batch of independent compare-exchanges, which NumPy runs
+as one ``minimum``/``maximum`` over two strided views of the array.
+
+NumPy is optional: without it ``numpy`` is None and the visualizers run the
+same phases through their event engine instead.
+"""
+
+from typing import Tuple
+
+from .buffers import ArrayLike
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional: o motor de eventos faz as mesmas fases
+    numpy = None
+
+
+def odd_even_phase(values, phase: int) -> Tuple[int, int]:
+    """
+    Compare-exchange every pair of one phase of a NumPy array, in place.
+
+    Returns:
+        ``(comparisons, swaps)`` of the phase
+    """
+    start = phase % 2
+    pairs = (len(values) - start) // 2
+    left = values[start : start + 2 * pairs : 2]
+    right = values[start + 1 : start + 2 * pairs : 2]
+
+    swaps = int(numpy.count_nonzero(left > right))
+    if swaps:
+        # ``left`` e ``right`` são vistas do array: a fase é escrita nele
+        low = numpy.minimum(left, right)
+        numpy.maximum(left, right, out=right)
+        left[...] = low
+    return pairs, swaps
+
+
+def odd_even_sort(array: ArrayLike) -> Tuple[int, int]:
+    """
+    Sort ``array`` in place by odd-even transposition, one vectorized phase at a time.
+
+    Runs the same phases as ``OddEvenSortVisualizer.generate_events``, stopping
+    after two phases in a row without swaps, so the counters are identical.
+    Buffers (``array.array``, ``memoryview``, NumPy) are sorted through a view
+    of their memory; a list is converted once and written back at the end.
+
+    Returns:
+        ``(comparisons, swaps)`` of the whole run
+    """
+    values = numpy.asarray(array)
+    length = len(values)
+    comparisons = 0
+    swaps = 0
+    quiet = 0
+    for phase in range(length):
+        phase_comparisons, phase_swaps = odd_even_phase(values, phase)
+        comparisons += phase_comparisons
+        swaps += phase_swaps
+        quiet = 0 if phase_swaps else quiet + 1
+        if quiet == 2:
+            break
+
+    if values.base is None and values is not array:
+        # O NumPy copiou a entrada (lista): devolve o resultado a ela
+        if isinstance(array, list):
+            array[:] = values.tolist()
+        else:
+            for index, value in enumerate(values.tolist()):
+                array[index] = value
+    return comparisons, swaps
@@ -0,0 +1,130 @@
+"""Quick Sort pivots, the Merge Sort variants and odd-even transposition."""
+
+import pytest
+
+from richsort.algorithms import (
+    PIVOT_STRATEGIES,
+    MergeSortVisualizer,
+    OddEvenSortVisualizer,
+    QuickSortVisualizer,
+)
+from richsort.events import COMPARE, PIVOT, RANGE, SWAP, apply_events, count_events
+from richsort.registry import get_algorithm_visualizer
+from richsort.test_cases import DISTRIBUTIONS, generate_array
+
+SIZES = (0, 1, 2, 3, 17, 100)
+
+
+def inputs():
+    for distribution in DISTRIBUTIONS:
+        for size in SIZES:
+            yield generate_array(distribution, size, seed=11)
+
+
+def check_run(visualizer, values):
+    """Sort ``values`` and check the result and counters against the events."""
+    events = list(visualizer.iter_events(values))
+    assert apply_events(list(values), events) == sorted(values)
+    assert (visualizer.comparisons, visualizer.swaps) == count_events(events)
+    assert list(visualizer.sort(values)) == sorted(values)
+    return events
+
+
+@pytest.mark.parametrize("pivot", PIVOT_STRATEGIES)
+@pytest.mark.parametrize("three_way", [False, True])
+def test_quick_sort_variants(pivot, three_way):
+    visualizer = QuickSortVisualizer(pivot=pivot, three_way=three_way)
+    for values in inputs():
+        events = check_run(visualizer, values)
+        # Cada passo anuncia o trecho e o pivô escolhido dentro dele
+        ranges = [event for event in events if event[0] == RANGE]
+        pivots = [event for event in events if event[0] == PIVOT]
+        assert len(ranges) == len(pivots)
+        for (_, lo, hi), (_, index, _) in zip(ranges, pivots):
+            assert lo <= index <= hi
+
+
+@pytest.mark.parametrize(
+    "algorithm_id", ["quick", "quick_first", "quick_random", "quick_3way"]
+)
+def test_registered_quick_sorts(algorithm_id):
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    for values in inputs():
+        check_run(visualizer, values)
+
+
+def test_quick_first_is_quadratic_on_sorted_input():
+    values = list(range(60))
+    visualizer = get_algorithm_visualizer("quick_first")
+    visualizer.sort(values)
+    assert visualizer.comparisons == 60 * 59 // 2
+    median = get_algorithm_visualizer("quick")
+    median.sort(values)
+    assert median.comparisons < visualizer.comparisons // 4
+
+
+def test_quick_random_is_reproducible():
+    values = generate_array("random", 80, seed=2)
+    first = list(QuickSortVisualizer(pivot="random", seed=5).iter_events(values))
+    again = list(QuickSortVisualizer(pivot="random", seed=5).iter_events(values))
+    other = list(QuickSortVisualizer(pivot="random", seed=6).iter_events(values))
+    assert first == again
+    assert first != other
+
+
+def test_three_way_skips_repeated_values():
+    values = generate_array("few_unique", 200, seed=1)
+    two_way = QuickSortVisualizer(three_way=False)
+    three_way = QuickSortVisualizer(three_way=True)
+    two_way.sort(values)
+    three_way.sort(values)
+    assert three_way.comparisons < two_way.comparisons
+
+
+def test_unknown_pivot():
+    with pytest.raises(ValueError):
+        QuickSortVisualizer(pivot="middle")
+
+
+@pytest.mark.parametrize("algorithm_id", ["merge", "merge_bottom_up", "merge_parallel"])
+def test_merge_sort_variants(algorithm_id):
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    for values in inputs():
+        check_run(visualizer, values)
+        assert visualizer.swaps == 0
+
+
+@pytest.mark.parametrize("algorithm_id", ["merge", "merge_bottom_up", "merge_parallel"])
+def test_merge_sort_is_stable(algorithm_id):
+    # Chaves repetidas com o índice original nos bits baixos: a ordem dos
+    # iguais só se mantém se a intercalação for estável
+    keys = generate_array("few_unique", 64, seed=4)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    values = [key * 1000 + index for index, key in enumerate(keys)]
+    assert list(visualizer.sort(values)) == sorted(values)
+
+
+def test_merge_sorted_input_costs_one_comparison_per_merge():
+    values = list(range(33))
+    visualizer = MergeSortVisualizer()
+    events = list(visualizer.iter_events(values))
+    assert visualizer.comparisons == len(values) - 1
+    assert [event[0] for event in events].count(COMPARE) == len(values) - 1
+
+
+def test_odd_even_sort():
+    visualizer = OddEvenSortVisualizer()
+    for values in inputs():
+        events = check_run(visualizer, values)
+        # Uma fase compara só pares disjuntos de vizinhos
+        assert all(j == i + 1 for opcode, i, j in events if opcode in (COMPARE, SWAP))
+
+
+def test_odd_even_swaps_are_inversions():
+    values = generate_array("random", 50, seed=8)
+    visualizer = OddEvenSortVisualizer()
+    visualizer.sort(values)
+    bubble = get_algorithm_visualizer("bubble")
+    bubble.sort(values)
+    # Trocas de vizinhos: cada uma desfaz exatamente uma inversão
+    assert visualizer.swaps == bubble.swaps
@@ -0,0 +1,87 @@
+"""Sorting typed buffers: ``copy_buffer``, ``in_place`` and ``format_values``."""
+
+from array import array
+
+import pytest
+
+from richsort.buffers import check_writable, copy_buffer, format_values
+from richsort.registry import get_algorithm_visualizer, get_available_algorithms
+
+VALUES = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+
+ALGORITHMS = [info["id"] for info in get_available_algorithms() if info["implemented"]]
+
+
+def buffers():
+    """The same values in each supported container."""
+    return {
+        "list": list(VALUES),
+        "array": array("i", VALUES),
+        "memoryview": memoryview(array("q", VALUES)),
+        "bytearray": bytearray(VALUES),
+    }
+
+
+@pytest.mark.parametrize("kind", ["list", "array", "memoryview", "bytearray"])
+def test_copy_buffer_keeps_type_and_format(kind):
+    values = buffers()[kind]
+    copy = copy_buffer(values)
+    assert type(copy) is type(values)
+    assert list(copy) == list(values)
+    if isinstance(values, memoryview):
+        assert copy.format == values.format
+    elif isinstance(values, array):
+        assert copy.typecode == values.typecode
+
+    copy[0] = 42
+    assert values[0] == VALUES[0]
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+@pytest.mark.parametrize("kind", ["array", "memoryview", "bytearray"])
+def test_sort_copy_leaves_input_untouched(algorithm_id, kind):
+    values = buffers()[kind]
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    result = visualizer.sort(values)
+    assert type(result) is type(values)
+    assert list(result) == sorted(VALUES)
+    assert list(values) == VALUES
+
+    # Os mesmos contadores que a lista
+    expected = get_algorithm_visualizer(algorithm_id)
+    expected.sort(list(VALUES))
+    assert (visualizer.comparisons, visualizer.swaps) == (
+        expected.comparisons,
+        expected.swaps,
+    )
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+@pytest.mark.parametrize("kind", ["list", "array", "memoryview", "bytearray"])
+def test_sort_in_place(algorithm_id, kind):
+    values = buffers()[kind]
+    result = get_algorithm_visualizer(algorithm_id).sort(values, in_place=True)
+    assert result is values
+    assert list(values) == sorted(VALUES)
+
+
+def test_read_only_buffer_cannot_be_sorted_in_place():
+    values = memoryview(bytes(VALUES))
+    with pytest.raises(TypeError):
+        check_writable(values)
+    with pytest.raises(TypeError):
+        get_algorithm_visualizer("bubble").sort(values, in_place=True)
+    # Uma cópia pode ser ordenada
+    assert list(get_algorithm_visualizer("bubble").sort(values)) == sorted(VALUES)
+
+
+def test_render_lines_on_buffers_matches_list():
+    visualizer = get_algorithm_visualizer("merge")
+    expected = list(visualizer.render_lines(list(VALUES)))
+    assert list(visualizer.render_lines(array("i", VALUES))) == expected
+
+
+def test_format_values():
+    assert format_values([3, 1, 2]) == "[3, 1, 2]"
+    assert format_values(array("q", [3, 1, 2])) == "[3, 1, 2]"
+    assert format_values(memoryview(array("i", [3, 1]))) == "[3, 1]"
@@ -0,0 +1,40 @@
+"""The trace cache: LRU limits and the versioned disk files."""
+
+import os
+
+from richsort.cache import CACHE_FORMAT, TraceCache
+
+
+def test_lru_eviction():
+    cache = TraceCache(max_entries=2)
+    keys = [cache.make_key("bubble", [index]) for index in range(3)]
+    for key in keys:
+        cache.put(key, "saida")
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == "saida"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_options_are_part_of_the_key():
+    assert TraceCache.make_key("bubble", [1, 2]) != TraceCache.make_key(
+        "bubble", [1, 2], delta=False
+    )
+
+
+def test_disk_files_are_versioned_and_safe(tmp_path):
+    cache = TraceCache(cache_dir=str(tmp_path))
+    key = cache.make_key("../plugin:quick sort", [3, 1, 2])
+    cache.put(key, "saida")
+
+    (name,) = os.listdir(tmp_path)
+    assert name.startswith(f"v{CACHE_FORMAT}-")
+    assert "/" not in name and ":" not in name and " " not in name
+
+    # Um processo novo (cache vazio em memória) lê o arquivo
+    fresh = TraceCache(cache_dir=str(tmp_path))
+    assert fresh.get(key) == "saida"
+    assert fresh.stats()["disk_hits"] == 1
+
+    # Ids diferentes com a mesma forma sanitizada não dividem o arquivo
+    other = cache.make_key("../plugin:quick_sort", [3, 1, 2])
+    assert cache._path(other) != cache._path(key)
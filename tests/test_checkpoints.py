@@ -0,0 +1,143 @@
+"""Random access into a run: ``CheckpointedTrace.state_at`` and ``line_of_step``."""
+
+import pytest
+
+from richsort.checkpoints import CheckpointedTrace, LineIndex
+from richsort.events import LOAD, PASS_START, apply_events, count_accesses
+from richsort.registry import get_algorithm_visualizer
+from richsort.test_cases import generate_array
+
+# Um de cada família: trocas, chave (LOAD/STORE), buffer auxiliar, partições
+ALGORITHMS = ("bubble", "insertion_shift", "merge", "quick_3way", "merge_parallel")
+
+
+def record(algorithm_id, values, interval):
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    events = list(visualizer.iter_events(values))
+    trace = CheckpointedTrace.from_events(values, events, interval=interval)
+    return visualizer, events, trace
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_state_at_matches_replay_from_start(algorithm_id):
+    values = generate_array("random", 24, seed=4)
+    _, events, trace = record(algorithm_id, values, interval=7)
+    assert len(trace) == len(events)
+
+    for step in range(len(events) + 1):
+        state, counts, key = trace.state_at(step)
+        prefix = events[:step]
+        assert list(state) == apply_events(list(values), prefix)
+        assert counts == count_accesses(prefix)
+
+        # O registrador da chave: o valor lido pelo último LOAD, se houver
+        loads = [index for index, event in enumerate(prefix) if event[0] == LOAD]
+        if loads:
+            _, position, _ = prefix[loads[-1]]
+            before = apply_events(list(values), prefix[: loads[-1]])
+            assert key == before[position]
+        else:
+            assert key is None
+
+
+def test_state_at_clamps_and_ends_sorted():
+    values = generate_array("reversed", 30)
+    _, events, trace = record("bubble", values, interval=16)
+    assert list(trace.array_at(len(events) + 100)) == sorted(values)
+    assert list(trace.array_at(-5)) == values
+    assert trace.clamp(-1) == 0
+    assert trace.clamp(len(events) + 1) == len(events)
+
+
+def test_pass_index():
+    values = generate_array("random", 20, seed=1)
+    visualizer, events, trace = record("selection", values, interval=10)
+    starts = [step for step, event in enumerate(events) if event[0] == PASS_START]
+    assert trace.pass_count == len(starts)
+    for number, step in enumerate(starts):
+        assert trace.pass_step(number) == step
+        assert trace.pass_at(step) == number
+    assert trace.pass_at(-1) == -1
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_line_of_step_points_at_the_step_output(algorithm_id):
+    values = generate_array("random", 16, seed=6)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    renderer_class = visualizer.renderer_class
+    trace = CheckpointedTrace(values, interval=5)
+    index = LineIndex()
+    lines = list(
+        trace.render_indexed(
+            renderer_class(values), visualizer.iter_events(values), index
+        )
+    )
+    assert lines == list(visualizer.render_lines(values))
+
+    # A primeira linha de cada passo é a contagem das linhas antes dele
+    reference = renderer_class(values)
+    line = len(reference.header())
+    for step, event in enumerate(trace.iter_events()):
+        assert trace.line_of_step(step, index, renderer_class) == line
+        line += len(reference.feed(event))
+    assert trace.line_of_step(len(trace), index, renderer_class) == line
+    assert index.end_line == line
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_renderer_at_continues_like_a_full_render(algorithm_id):
+    values = generate_array("random", 14, seed=8)
+    visualizer, events, trace = record(algorithm_id, values, interval=6)
+    renderer_class = visualizer.renderer_class
+
+    full = renderer_class(values)
+    outputs = [full.feed(event) for event in events]
+    footer = full.footer()
+    for step in range(0, len(events) + 1, 3):
+        renderer = trace.renderer_at(step, renderer_class, delta=False)
+        tail = [line for event in events[step:] for line in renderer.feed(event)]
+        expected = [line for output in outputs[step:] for line in output]
+        assert tail == expected
+        assert renderer.footer() == footer
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_seeks_in_any_order_continue_like_a_full_render(algorithm_id):
+    """Seeks restored from the narration kept at earlier checkpoints."""
+    values = generate_array("random", 40, seed=5)
+    visualizer, events, trace = record(algorithm_id, values, interval=5)
+    renderer_class = visualizer.renderer_class
+
+    full = renderer_class(values, delta=False)
+    outputs = [full.feed(event) for event in events]
+    steps = list(range(0, len(events) + 1, max(1, len(events) // 20)))
+    for step in steps[::-1] + steps[::2] + steps:
+        renderer = trace.renderer_at(step, renderer_class, delta=False)
+        # Os próximos eventos, com folga para atravessar alguns checkpoints
+        stop = step + 4 * trace.interval
+        tail = [line for event in events[step:stop] for line in renderer.feed(event)]
+        assert tail == [line for output in outputs[step:stop] for line in output]
+
+
+def test_second_seek_starts_at_the_nearest_checkpoint(monkeypatch):
+    values = generate_array("random", 40, seed=6)
+    visualizer, events, trace = record("merge_parallel", values, interval=8)
+    renderer_class = visualizer.renderer_class
+    # Um ponto no fim do passo mais longo: a intercalação final
+    last_pass = trace.pass_step(trace.pass_count - 1)
+    step = len(events) - 3
+    assert step - last_pass > 3 * trace.interval
+    trace.renderer_at(step, renderer_class)
+
+    replayed = []
+    iter_events = trace.iter_events
+
+    def spy(start=0, stop=None):
+        for event in iter_events(start, stop):
+            replayed.append(event)
+            yield event
+
+    monkeypatch.setattr(trace, "iter_events", spy)
+    renderer = trace.renderer_at(step - 1, renderer_class)
+    assert len(replayed) < trace.interval
+    assert [line for event in events[step - 1 :] for line in renderer.feed(event)]
@@ -0,0 +1,71 @@
+"""The step-event engines and the renderers that narrate their events."""
+
+import pytest
+
+from richsort.events import (
+    COMPARE,
+    KEY,
+    SWAP,
+    apply_events,
+    count_accesses,
+    count_events,
+)
+from richsort.registry import get_algorithm_visualizer, get_available_algorithms
+from richsort.test_cases import generate_array
+
+ALGORITHMS = [info["id"] for info in get_available_algorithms() if info["implemented"]]
+
+INPUTS = [[], [1], [2, 1], [3, 3, 1, 2], generate_array("random", 30, seed=1)]
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_events_replay_to_the_sorted_array(algorithm_id):
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    for values in INPUTS:
+        events = list(visualizer.iter_events(values))
+        assert apply_events(list(values), events) == sorted(values)
+        # O motor ordena uma cópia: a entrada fica intacta
+        assert list(visualizer.sort(values)) == sorted(values)
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_counters_match_the_events(algorithm_id):
+    values = generate_array("random", 40, seed=2)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    comparisons, swaps = count_events(visualizer.iter_events(values))
+    assert (visualizer.comparisons, visualizer.swaps) == (comparisons, swaps)
+
+    visualizer.sort(values)
+    assert (visualizer.comparisons, visualizer.swaps) == (comparisons, swaps)
+
+
+def test_count_accesses():
+    events = [(COMPARE, 0, 1), (COMPARE, 2, KEY), (SWAP, 0, 1)]
+    assert count_accesses(events) == {
+        "comparisons": 2,
+        "swaps": 1,
+        "moves": 0,
+        "reads": 5,
+        "writes": 2,
+    }
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_renderer_narrates_the_same_run(algorithm_id):
+    values = generate_array("random", 12, seed=3)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    lines = list(visualizer.render_lines(values))
+    assert visualizer.sort_complete(values) == "\n".join(lines)
+
+    # Alimentar o renderer evento a evento produz as mesmas linhas
+    renderer = visualizer.new_renderer(values)
+    fed = list(renderer.header())
+    for event in visualizer.iter_events(values):
+        fed.extend(renderer.feed(event))
+    fed.extend(renderer.footer())
+    assert fed == lines
+    assert list(renderer.array) == sorted(values)
+    assert (renderer.comparisons, renderer.swaps) == (
+        visualizer.comparisons,
+        visualizer.swaps,
+    )
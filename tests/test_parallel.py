@@ -0,0 +1,126 @@
+"""The multi-process Merge Sort over shared memory and its run split."""
+
+from array import array
+
+import pytest
+
+from richsort.algorithms import (
+    MIN_CHUNK_SIZE,
+    PARALLEL_CHUNKS,
+    PARALLEL_MIN_SIZE,
+    ParallelMergeSortVisualizer,
+    chunk_bounds,
+)
+from richsort.events import PASS_START, count_events
+from richsort.parallel import LIST_FORMAT, shared_format
+from richsort.renderers import ParallelMergeSortRenderer
+from richsort.test_cases import generate_array
+
+
+@pytest.mark.parametrize("length", [0, 1, 3, 4, 7, 31, 32, 1000])
+@pytest.mark.parametrize("chunks", [1, 2, 3, 8])
+def test_chunk_bounds_cover_the_array(length, chunks):
+    runs = chunk_bounds(length, chunks)
+    if not length:
+        assert runs == []
+        return
+    assert runs[0][0] == 0
+    assert runs[-1][1] == length - 1
+    for (_, hi), (lo, _) in zip(runs, runs[1:]):
+        assert lo == hi + 1
+    assert 1 <= len(runs) <= chunks
+    sizes = [hi - lo + 1 for lo, hi in runs]
+    assert max(sizes) - min(sizes) <= 1
+    if len(runs) > 1:
+        assert min(sizes) >= MIN_CHUNK_SIZE
+
+
+def test_default_chunks_follow_the_workers():
+    visualizer = ParallelMergeSortVisualizer(workers=3)
+    assert visualizer.chunk_count(PARALLEL_MIN_SIZE - 1) == PARALLEL_CHUNKS
+    assert visualizer.chunk_count(PARALLEL_MIN_SIZE) == 3
+    assert ParallelMergeSortVisualizer(chunks=5, workers=3).chunk_count(10**6) == 5
+    # Um só worker: um só trecho, o Merge Sort comum sem intercalação final
+    events = list(
+        ParallelMergeSortVisualizer(workers=1).iter_events(
+            generate_array("random", PARALLEL_MIN_SIZE, seed=3)
+        )
+    )
+    assert [event[1] for event in events if event[0] == PASS_START] == [0]
+
+
+def test_renderer_knows_the_split():
+    values = generate_array("random", 40, seed=9)
+    visualizer = ParallelMergeSortVisualizer(chunks=3)
+    assert visualizer.new_renderer(values).chunks == 3
+    assert ParallelMergeSortRenderer(values).chunks == PARALLEL_CHUNKS
+
+
+def test_shared_format():
+    assert shared_format([3, 1, 2]) == LIST_FORMAT
+    assert shared_format([]) == LIST_FORMAT
+    assert shared_format(array("i", [1])) == "i"
+    assert shared_format(memoryview(array("d", [1.0]))) == "d"
+    # Não cabem em inteiros de 64 bits, ou não são inteiros: ficam no serial
+    assert shared_format([2**64]) is None
+    assert shared_format([1.5, 2]) is None
+    assert shared_format(memoryview(bytes(4)).cast("c")) is None
+
+
+def engine_counts(values, chunks):
+    visualizer = ParallelMergeSortVisualizer(chunks=chunks)
+    return count_events(visualizer.iter_events(values))
+
+
+@pytest.fixture(scope="module")
+def large():
+    return generate_array("random", PARALLEL_MIN_SIZE, seed=12)
+
+
+@pytest.fixture
+def pool_runs(monkeypatch):
+    """Count the runs that really went through the process pool."""
+    import richsort.parallel
+
+    runs = []
+    parallel_sort = richsort.parallel.parallel_sort
+
+    def spy(visualizer, values, workers):
+        runs.append(workers)
+        return parallel_sort(visualizer, values, workers)
+
+    monkeypatch.setattr(richsort.parallel, "parallel_sort", spy)
+    return runs
+
+
+def test_parallel_sort_of_a_list(large, pool_runs):
+    visualizer = ParallelMergeSortVisualizer(chunks=4, workers=2)
+    result = visualizer.sort(large)
+    assert result == sorted(large)
+    assert result is not large
+    assert (visualizer.comparisons, visualizer.swaps) == engine_counts(large, 4)
+    assert pool_runs == [2]
+
+
+def test_parallel_sort_of_a_buffer_in_place(large, pool_runs):
+    values = array("q", large)
+    visualizer = ParallelMergeSortVisualizer(chunks=3, workers=2)
+    assert visualizer.sort(values, in_place=True) is values
+    assert values.tolist() == sorted(large)
+    assert (visualizer.comparisons, visualizer.swaps) == engine_counts(large, 3)
+    assert pool_runs == [2]
+
+
+def test_small_or_unshareable_inputs_run_serially(monkeypatch):
+    import richsort.parallel
+
+    def fail(*args, **kwargs):
+        raise AssertionError("processes started for a serial input")
+
+    monkeypatch.setattr(richsort.parallel, "parallel_sort", fail)
+    visualizer = ParallelMergeSortVisualizer(workers=2)
+    small = generate_array("random", 100, seed=1)
+    assert visualizer.sort(small) == sorted(small)
+    floats = [float(value) for value in small] * (PARALLEL_MIN_SIZE // 100)
+    assert visualizer.sort(floats) == sorted(floats)
+    assert ParallelMergeSortVisualizer(workers=1).sort(small) == sorted(small)
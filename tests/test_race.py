@@ -0,0 +1,39 @@
+"""Races: racers advance in lockstep and are ranked by the tick they finish."""
+
+from richsort.race import Race
+
+
+def run(race, events_per_tick):
+    while race.tick(events_per_tick):
+        pass
+    return {racer.algorithm_id: racer for racer in race.racers}
+
+
+def test_fewer_events_finish_first():
+    values = list(range(40, 0, -1))
+    racers = run(Race(["bubble", "merge", "selection"], values), 50)
+    assert racers["merge"].place == 1
+    assert all(racer.place is not None for racer in racers.values())
+    for racer in racers.values():
+        assert list(racer.array) == sorted(values)
+
+
+def test_same_tick_is_ranked_by_events():
+    values = [5, 3, 1, 4, 2, 9, 8, 7, 6, 0]
+    race = Race(["bubble", "insertion", "selection", "bubble_last_swap"], values)
+    # Um tique grande o bastante para todos terminarem juntos
+    racers = run(race, 10_000)
+    assert race.ticks == 1
+    assert len({racer.finished_at for racer in racers.values()}) == 1
+    ranked = sorted(racers.values(), key=lambda racer: racer.place)
+    assert [racer.events for racer in ranked] == sorted(
+        racer.events for racer in racers.values()
+    )
+    assert ranked[0].place == 1
+
+
+def test_equal_event_counts_share_the_place():
+    race = Race(["bubble", "bubble"], [3, 2, 1])
+    first, second = race.racers
+    run(race, 1_000)
+    assert first.place == second.place == 1
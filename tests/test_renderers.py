@@ -0,0 +1,112 @@
+"""Delta/keyframe array lines and the output budget of the renderers."""
+
+import re
+
+import pytest
+
+from richsort.registry import get_algorithm_visualizer
+from richsort.renderers import (
+    DELTA_AUTO_SIZE,
+    LEVEL_FINAL,
+    LEVEL_FULL,
+    budget_options,
+)
+from richsort.test_cases import generate_array
+
+# Células do markup: "[estilo] valor [/]", e nas linhas delta "[dim]i:[/]" antes
+FULL_CELL = re.compile(r"\[([^\]/][^\]]*)\] (-?\d+) \[/\]")
+DELTA_CELL = re.compile(r"\[dim\](\d+):\[/\]\[([^\]]*)\] (-?\d+) \[/\]")
+
+ALGORITHMS = ("bubble", "insertion_shift", "merge", "quick_3way", "merge_parallel")
+
+
+def is_array_line(line):
+    return " [dim]Δ[/] " in line or len(FULL_CELL.findall(line)) > 1
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_deltas_rebuild_the_full_lines(algorithm_id):
+    values = generate_array("random", 12, seed=2)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    full = list(visualizer.render_lines(values, delta=False))
+    delta = list(visualizer.render_lines(values, delta=True, keyframe_interval=4))
+    assert len(full) == len(delta)
+
+    state = None
+    array_lines = 0
+    for full_line, delta_line in zip(full, delta):
+        if full_line == delta_line and not is_array_line(full_line):
+            continue
+        expected = FULL_CELL.findall(full_line)
+        assert len(expected) == len(values), full_line
+
+        if array_lines % 4 == 0:
+            # Quadro-chave: a linha inteira, igual à do modo completo
+            assert delta_line == full_line
+            state = [int(value) for _, value in expected]
+        else:
+            assert " [dim]Δ[/] " in delta_line
+            for position, style, value in DELTA_CELL.findall(delta_line):
+                position = int(position)
+                # Cada célula do delta é a célula daquela posição na linha inteira
+                assert (style, value) == expected[position]
+                state[position] = int(value)
+            # Quadro-chave + deltas = o array completo
+            assert state == [int(value) for _, value in expected]
+        array_lines += 1
+    assert array_lines > 4
+
+
+def test_delta_is_automatic_above_the_threshold():
+    visualizer = get_algorithm_visualizer("bubble")
+    small = generate_array("random", DELTA_AUTO_SIZE, seed=1)
+    large = generate_array("random", DELTA_AUTO_SIZE + 1, seed=1)
+    assert not visualizer.new_renderer(small).delta
+    assert visualizer.new_renderer(large).delta
+    assert not visualizer.new_renderer(large, delta=False).delta
+    assert not any("Δ" in line for line in visualizer.render_lines(small))
+    assert any("Δ" in line for line in visualizer.render_lines(large))
+
+
+def test_interactive_views_keep_delta_off():
+    """The views pass ``delta=False``; the headless output keeps the automatic choice."""
+    assert budget_options(None, delta=False) == {"delta": False}
+    assert "delta" not in budget_options(100)
+    options = budget_options(100, delta=False)
+    values = generate_array("random", DELTA_AUTO_SIZE + 10, seed=1)
+    lines = get_algorithm_visualizer("bubble").render_lines(values, **options)
+    assert not any("Δ" in line for line in lines)
+
+
+def test_budget_options():
+    assert budget_options(0) == {}
+    assert budget_options(None, delta=False) == {"delta": False}
+    options = budget_options(100, delta=False)
+    assert options["max_lines"] == 100
+    assert options["delta"] is False
+
+
+def test_budget_keeps_exact_totals():
+    values = generate_array("random", 60, seed=9)
+    visualizer = get_algorithm_visualizer("bubble")
+    unlimited = list(visualizer.render_lines(values))
+    reference = visualizer.new_renderer(values)
+    for event in visualizer.iter_events(values):
+        reference.feed(event)
+    footer = reference.footer()
+
+    renderer = visualizer.new_renderer(values, max_lines=80, summary_lines=5)
+    assert renderer.level == LEVEL_FULL
+    limited = list(renderer.render(visualizer.iter_events(values)))
+    assert renderer.level == LEVEL_FINAL
+    assert len(limited) < len(unlimited)
+    # O mesmo rodapé, com a linha dos eventos narrados antes da complexidade:
+    # os contadores seguem todos os eventos
+    end = limited[-(len(footer) + 1) :]
+    assert end[:-2] == footer[:-1]
+    assert "Eventos narrados" in end[-2]
+    assert end[-1] == footer[-1]
+    assert (renderer.comparisons, renderer.swaps) == (
+        visualizer.comparisons,
+        visualizer.swaps,
+    )
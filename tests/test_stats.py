@@ -0,0 +1,64 @@
+"""The closed-form counters of ``stats`` against the event engines."""
+
+import pytest
+
+from richsort.events import count_events
+from richsort.registry import get_algorithm_visualizer
+from richsort.stats import (
+    bubble_sort_stats,
+    count_inversions,
+    insertion_sort_stats,
+    selection_sort_stats,
+)
+from richsort.test_cases import DISTRIBUTIONS, generate_array
+
+FORMULAS = {
+    "bubble": bubble_sort_stats,
+    "insertion": insertion_sort_stats,
+    "selection": selection_sort_stats,
+}
+
+SIZES = (0, 1, 2, 7, 64)
+
+
+def inputs():
+    for distribution in DISTRIBUTIONS:
+        for size in SIZES:
+            yield generate_array(distribution, size, seed=3)
+
+
+@pytest.mark.parametrize("algorithm_id", sorted(FORMULAS))
+def test_formulas_match_event_engine(algorithm_id):
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    for values in inputs():
+        result = visualizer.sort(values)
+        assert list(result) == sorted(values)
+        expected = {
+            "comparisons": visualizer.comparisons,
+            "swaps": visualizer.swaps,
+        }
+        assert FORMULAS[algorithm_id](values) == expected, values
+
+
+@pytest.mark.parametrize("algorithm_id", sorted(FORMULAS))
+def test_sort_stats_uses_formula_without_events(algorithm_id):
+    values = generate_array("random", 300, seed=5)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    assert visualizer.sort_stats(values) == sorted(values)
+    engine = get_algorithm_visualizer(algorithm_id)
+    comparisons, swaps = count_events(engine.iter_events(values))
+    assert (visualizer.comparisons, visualizer.swaps) == (comparisons, swaps)
+
+
+def test_count_inversions():
+    assert count_inversions([]) == 0
+    assert count_inversions(list(range(50))) == 0
+    assert count_inversions(list(range(50, 0, -1))) == 50 * 49 // 2
+    values = generate_array("random", 200, seed=1)
+    brute = sum(
+        1
+        for i in range(len(values))
+        for j in range(i + 1, len(values))
+        if values[i] > values[j]
+    )
+    assert count_inversions(values) == brute
@@ -0,0 +1,48 @@
+"""The ``text`` backend renders exactly what the markup backend renders."""
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from richsort.registry import get_algorithm_visualizer, get_available_algorithms
+from richsort.text_backend import cells_text, get_style
+
+console = Console(width=10_000, color_system="truecolor")
+
+
+def segments(text):
+    return [(segment.text, segment.style) for segment in console.render(text)]
+
+
+@pytest.mark.parametrize(
+    "algorithm_id",
+    [info["id"] for info in get_available_algorithms() if info["implemented"]],
+)
+@pytest.mark.parametrize("delta", [False, True])
+def test_same_output_as_markup(algorithm_id, delta):
+    values = [5, 3, 9, 1, 7, 2, 8, 4]
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    markup = list(visualizer.render_lines(values, delta=delta))
+    text = list(visualizer.render_lines(values, delta=delta, backend="text"))
+    assert len(markup) == len(text)
+    for markup_line, text_line in zip(markup, text):
+        assert isinstance(text_line, Text)
+        assert segments(Text.from_markup(markup_line, end="")) == segments(text_line)
+
+
+def test_cells_text_separators():
+    cells = [("bold red", 3), ("dim", 10)]
+    assert cells_text("Array:", cells).plain == "Array:  3   10 "
+    assert cells_text("Array:", cells, [2, 5]).plain == "Array: Δ 2: 3  5: 10 "
+    # Sem células, o separador depois do rótulo continua lá
+    assert cells_text("Array:", []).plain == "Array: "
+    assert cells_text("Array:", [], []).plain == "Array: Δ "
+
+
+def test_styles_are_cached():
+    assert get_style("bold green") is get_style("bold green")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_algorithm_visualizer("bubble").new_renderer([1, 2], backend="html")
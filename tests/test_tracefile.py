@@ -0,0 +1,93 @@
+"""Binary trace files: record, then replay and seek from the stored snapshots."""
+
+import pytest
+
+from richsort.checkpoints import CheckpointedTrace
+from richsort.events import count_accesses
+from richsort.registry import get_algorithm_visualizer
+from richsort.test_cases import generate_array
+from richsort.tracefile import TraceFile, record_trace
+
+ALGORITHMS = ("bubble", "insertion_shift", "merge", "quick_3way", "merge_parallel")
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    def record(algorithm_id, values, **options):
+        path = str(tmp_path / f"{algorithm_id}.trace")
+        count = record_trace(algorithm_id, values, path, **options)
+        return path, count
+
+    return record
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_round_trip(recorded, algorithm_id):
+    values = generate_array("random", 30, seed=7)
+    path, count = recorded(algorithm_id, values, chunk_events=16)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    events = list(visualizer.iter_events(values))
+    assert count == len(events)
+
+    with TraceFile(path) as trace:
+        assert trace.algorithm_id == algorithm_id
+        assert trace.input_array == values
+        assert len(trace) == len(events)
+        assert list(trace.iter_events()) == events
+        assert trace[-1] == events[-1]
+        assert list(trace.render_lines()) == list(visualizer.render_lines(values))
+
+
+@pytest.mark.parametrize("algorithm_id", ALGORITHMS)
+def test_seek_matches_in_memory_trace(recorded, algorithm_id):
+    values = generate_array("random", 40, seed=3)
+    path, _ = recorded(algorithm_id, values)
+    visualizer = get_algorithm_visualizer(algorithm_id)
+    memory = CheckpointedTrace.from_events(values, visualizer.iter_events(values))
+
+    with TraceFile(path) as trace:
+        checkpoints = trace.checkpoints()
+        assert trace.pass_count == memory.pass_count
+        steps = sorted({0, 1, len(trace) // 3, len(trace) // 2, len(trace)})
+        for step in steps:
+            state, counts, key = checkpoints.state_at(step)
+            expected = memory.state_at(step)
+            assert (list(state), counts, key) == (list(expected[0]), *expected[1:])
+            assert counts == count_accesses(trace.iter_events(0, step))
+            assert trace.array_at(step) == list(expected[0])
+
+            renderer = memory.renderer_at(step, visualizer.renderer_class)
+            tail = [
+                line
+                for event in memory.iter_events(step)
+                for line in renderer.feed(event)
+            ]
+            tail += renderer.footer()
+            if step:
+                assert list(trace.render_lines(step)) == tail
+        assert trace.array_at(len(trace)) == sorted(values)
+
+
+def test_snapshots_are_stored_in_the_file(recorded, monkeypatch):
+    """Seeking reads the snapshots from the file, without replaying the log."""
+    values = generate_array("reversed", 20)
+    path, count = recorded("bubble", values)
+    memory = CheckpointedTrace.from_events(
+        values, get_algorithm_visualizer("bubble").iter_events(values)
+    )
+    middle = list(memory.array_at(count // 2))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the trace was replayed from the start")
+
+    monkeypatch.setattr(CheckpointedTrace, "extend", fail)
+    with TraceFile(path) as trace:
+        assert trace.array_at(count) == sorted(values)
+        assert trace.array_at(count // 2) == middle
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-trace"
+    path.write_bytes(b"XXXX" + bytes(60))
+    with pytest.raises(ValueError):
+        TraceFile(str(path))
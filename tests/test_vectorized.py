@@ -0,0 +1,59 @@
+"""The NumPy odd-even kernel against the event engine (skipped without NumPy)."""
+
+from array import array
+
+import pytest
+
+from richsort.algorithms import OddEvenSortVisualizer
+from richsort.test_cases import DISTRIBUTIONS, generate_array
+
+numpy = pytest.importorskip("numpy")
+
+from richsort.vectorized import odd_even_phase, odd_even_sort  # noqa: E402
+
+
+def engine_counts(values):
+    visualizer = OddEvenSortVisualizer()
+    for _ in visualizer.iter_events(values):
+        pass
+    return visualizer.comparisons, visualizer.swaps
+
+
+@pytest.mark.parametrize("distribution", sorted(DISTRIBUTIONS))
+@pytest.mark.parametrize("size", [0, 1, 2, 9, 64])
+def test_kernel_matches_event_engine(distribution, size):
+    values = generate_array(distribution, size, seed=5)
+    data = numpy.array(values)
+    assert odd_even_sort(data) == engine_counts(values)
+    assert data.tolist() == sorted(values)
+
+
+def test_phase_compares_disjoint_pairs():
+    data = numpy.array([4, 3, 2, 1, 0])
+    assert odd_even_phase(data, 0) == (2, 2)
+    assert data.tolist() == [3, 4, 1, 2, 0]
+    assert odd_even_phase(data, 1) == (2, 2)
+    assert data.tolist() == [3, 1, 4, 0, 2]
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        list,
+        lambda values: array("q", values),
+        lambda values: memoryview(array("i", values)),
+    ],
+)
+def test_kernel_sorts_other_containers_in_place(make):
+    values = generate_array("random", 40, seed=3)
+    data = make(values)
+    assert odd_even_sort(data) == engine_counts(values)
+    assert list(data) == sorted(values)
+
+
+def test_visualizer_uses_the_kernel():
+    values = generate_array("reversed", 50)
+    visualizer = OddEvenSortVisualizer()
+    result = visualizer.sort(values)
+    assert list(result) == sorted(values)
+    assert (visualizer.comparisons, visualizer.swaps) == engine_counts(values)